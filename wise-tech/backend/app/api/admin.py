@@ -2,30 +2,100 @@
 Admin API endpoints.
 """
 
-from typing import Any, List, Dict
+import enum
+from datetime import datetime
+from typing import Any, Iterator, List, Dict, Optional, Sequence, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import Row, Select, func
+from sqlalchemy.exc import IntegrityError
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core import pagination
+from app.core.config import settings
+from app.core.responses import (
+    NegotiatedRoute,
+    csv_lines,
+    msgpack_available,
+    msgpack_records,
+    ndjson_lines,
+    trusted_json,
+    wants_msgpack,
+)
+from app.db.gadget_import import ImportFormat, import_gadgets
+from app.db.session import SessionLocal
+from app.models.review import ReviewStatus
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
+
+# Rows fetched per round-trip from the server-side cursor during exports
+EXPORT_BATCH_SIZE = 1000
+
+
+def _admin_page(
+    db: Session, stmt: Select, sort: str, keys: Sequence[pagination.SortKey],
+    *, limit: int, cursor: Optional[str], skip: int,
+) -> Tuple[List[Row], Dict[str, str]]:
+    """
+    Fetch one page of an admin listing, by cursor or by skip, and the headers
+    carrying the next cursor.
+    """
+    try:
+        rows, next_cursor = pagination.keyset_page(
+            db, stmt, sort, keys, limit=limit, cursor=cursor, offset=skip
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    headers = {pagination.NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    return rows, headers
+
+
+class ExportResource(str, enum.Enum):
+    """Resources available for admin export."""
+    REVIEWS = "reviews"
+    USERS = "users"
+    GADGETS = "gadgets"
+
+
+class ExportFormat(str, enum.Enum):
+    """Export encodings."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+    MSGPACK = "msgpack"
 
 
 @router.get("/admin/users", response_model=List[schemas.User])
 def read_users(
     *,
     db: Session = Depends(deps.get_db),
+    response: Response,
+    search: Optional[str] = Query(None, description="Search username, full name or email"),
+    is_admin: Optional[bool] = Query(None, description="Filter by admin role"),
+    joined_from: Optional[datetime] = Query(None, description="Joined at or after"),
+    joined_to: Optional[datetime] = Query(None, description="Joined before"),
+    sort: str = Query("id", description="Sort order: id, newest, oldest, username"),
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor from a previous page; replaces skip"),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
     current_user: models.User = Depends(deps.get_current_active_admin),
 ) -> Any:
     """
-    Get all users (admin only).
+    Get users with filtering and keyset pagination (admin only).
     """
-    return crud.user.get_multi(db, skip=skip, limit=limit)
+    stmt = crud.user.admin_select(
+        search=search, is_admin=is_admin, joined_from=joined_from, joined_to=joined_to
+    )
+    rows, headers = _admin_page(
+        db, stmt, sort, crud.user.sort_keys(sort), limit=limit, cursor=cursor, skip=skip
+    )
+    response.headers.update(headers)
+    return [row[0] for row in rows]
 
 
 @router.post("/admin/users", response_model=schemas.User)
@@ -83,6 +153,42 @@ def create_user(
     return user
 
 
+@router.post("/admin/users/bulk", response_model=schemas.UserBulkCreateReport)
+def create_users(
+    *,
+    db: Session = Depends(deps.get_db),
+    users_in: schemas.UserBulkCreate,
+    current_user: models.User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Create many users in one transaction (admin only).
+    
+    Users failing validation or uniqueness checks are skipped and reported by
+    their position in the request.
+    """
+    if not 1 <= len(users_in.users) <= settings.USER_BULK_CREATE_MAX_USERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Between 1 and {settings.USER_BULK_CREATE_MAX_USERS} users are required; "
+            "use provision_users.py for larger batches",
+        )
+    
+    try:
+        created, errors = crud.user.bulk_create(db, users=users_in.users)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Some users were created concurrently; retry the batch",
+        )
+    
+    return trusted_json({
+        "created": len(created),
+        "failed": len(errors),
+        "users": created,
+        "errors": errors,
+    })
+
+
 @router.put("/admin/users/{id}", response_model=schemas.User)
 def update_user(
     *,
@@ -119,7 +225,8 @@ def delete_user(
     """
     Delete user (admin only).
     """
-    user = crud.user.get(db, id=id)
+    # Deleting a user detaches their reviews, so load them up front
+    user = crud.user.get(db, id=id, options=[selectinload(models.User.reviews)])
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -148,7 +255,7 @@ def update_review(
     """
     Update review (admin only).
     """
-    review = crud.review.get(db, id=id)
+    review = crud.review.get(db, id=id, options=[joinedload(models.Review.user)])
     if not review:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -156,7 +263,53 @@ def update_review(
         )
     
     review = crud.review.update(db, db_obj=review, obj_in=review_in)
-    return review
+    
+    # Add user info to review response
+    review_dict = {
+        **review.__dict__,
+        "user_name": review.user.username,
+        "user": {
+            "id": review.user.id,
+            "username": review.user.username,
+            "full_name": review.user.full_name,
+            "profile_photo": review.user.profile_photo,
+        }
+    }
+    
+    return review_dict
+
+
+@router.post("/admin/reviews/moderate", response_model=schemas.ReviewModerationResult)
+def moderate_reviews(
+    *,
+    db: Session = Depends(deps.get_db),
+    moderation: schemas.ReviewBulkModeration,
+    current_user: models.User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Set the status of many reviews, by ids or by listing filter, in one UPDATE (admin only).
+    """
+    if moderation.ids is not None:
+        condition = models.Review.id.in_(set(moderation.ids))
+    else:
+        try:
+            condition = crud.review.moderation_condition(
+                **moderation.filter.model_dump(exclude_none=True)
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    rows = crud.review.moderate(db, status=moderation.status, condition=condition)
+    
+    updated_ids = {review_id for review_id, _ in rows}
+    return {
+        "status": moderation.status,
+        "updated": len(rows),
+        "gadget_ids": sorted({gadget_id for _, gadget_id in rows}),
+        "not_found": [
+            review_id for review_id in dict.fromkeys(moderation.ids or ())
+            if review_id not in updated_ids
+        ],
+    }
 
 
 @router.delete("/admin/reviews/{id}")
@@ -198,9 +351,10 @@ def get_dashboard_stats(
     # Count total reviews
     total_reviews = db.query(func.count(models.Review.id)).scalar() or 0
     
-    # Count pending reviews (assuming we'll add status field later)
-    # For now, we'll assume all reviews are pending if they don't have a status
-    pending_reviews = 0  # Placeholder for future implementation
+    # Count reviews awaiting moderation
+    pending_reviews = db.query(func.count(models.Review.id)).filter(
+        models.Review.status == ReviewStatus.PENDING
+    ).scalar() or 0
     
     return {
         "totalUsers": total_users,
@@ -214,72 +368,84 @@ def get_dashboard_stats(
 def get_all_reviews(
     *,
     db: Session = Depends(deps.get_db),
+    search: Optional[str] = Query(None, description="Search title, content, username or gadget name"),
+    review_status: Optional[ReviewStatus] = Query(None, alias="status", description="Filter by status"),
+    category: Optional[str] = Query(None, description="Filter by gadget category"),
+    user_id: Optional[int] = Query(None, description="Filter by author"),
+    gadget_id: Optional[int] = Query(None, description="Filter by gadget"),
+    min_rating: Optional[float] = Query(None, description="Minimum rating"),
+    created_from: Optional[datetime] = Query(None, description="Created at or after"),
+    created_to: Optional[datetime] = Query(None, description="Created before"),
+    sort: str = Query("newest", description="Sort order: newest, oldest, rating_high, rating_low"),
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor from a previous page; replaces skip"),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Review)),
     current_user: models.User = Depends(deps.get_current_active_admin),
 ) -> Any:
     """
-    Get all reviews (admin only).
+    Get reviews with filtering and keyset pagination (admin only).
     """
-    from sqlalchemy import desc
-    from sqlalchemy.orm import joinedload
-    
-    # Get reviews with user and gadget data, sorted by creation date (newest first)
-    reviews = (
-        db.query(models.Review)
-        .options(joinedload(models.Review.user), joinedload(models.Review.gadget))
-        .order_by(desc(models.Review.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
+    stmt = crud.review.admin_select(
+        fields,
+        search=search,
+        status=review_status,
+        category=category,
+        user_id=user_id,
+        gadget_id=gadget_id,
+        min_rating=min_rating,
+        created_from=created_from,
+        created_to=created_to,
     )
+    rows, headers = _admin_page(
+        db, stmt, sort, crud.review.sort_keys(sort), limit=limit, cursor=cursor, skip=skip
+    )
+    # Column-projection rows with user and gadget data
+    result = [crud.review.listing_dict(row, fields) for row in rows]
     
-    # Add user_name and format response consistently
-    result = []
-    for review in reviews:
-        review_dict = {
-            "id": review.id,
-            "title": review.title,
-            "content": review.content,
-            "rating": review.rating,
-            "pros": review.pros,
-            "cons": review.cons,
-            "user_id": review.user_id,
-            "gadget_id": review.gadget_id,
-            "status": getattr(review, 'status', 'approved'),
-            "created_at": review.created_at,
-            "updated_at": review.updated_at,
-            "user_name": review.user.username,
-            "user": {
-                "id": review.user.id,
-                "username": review.user.username,
-                "full_name": getattr(review.user, 'full_name', None),
-                "profile_photo": getattr(review.user, 'profile_photo', None),
-            },
-            "gadget": {
-                "id": review.gadget.id,
-                "name": review.gadget.name,
-                "category": review.gadget.category,
-                "brand": review.gadget.brand,
-            }
-        }
-        result.append(schemas.Review(**review_dict))
-    
-    return result
+    response = trusted_json(result)
+    response.headers.update(headers)
+    return response
 
 
 @router.get("/admin/gadgets", response_model=List[schemas.Gadget])
 def get_all_gadgets(
     *,
     db: Session = Depends(deps.get_db),
+    response: Response,
+    search: Optional[str] = Query(None, description="Search name, brand or description"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    brand: Optional[str] = Query(None, description="Filter by brand"),
+    created_from: Optional[datetime] = Query(None, description="Created at or after"),
+    created_to: Optional[datetime] = Query(None, description="Created before"),
+    sort: str = Query("id", description="Sort order: id, newest, name, price_low, price_high"),
+    cursor: Optional[str] = Query(None, description="Opaque X-Next-Cursor from a previous page; replaces skip"),
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=500),
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Gadget)),
     current_user: models.User = Depends(deps.get_current_active_admin),
 ) -> Any:
     """
-    Get all gadgets (admin only).
+    Get gadgets with filtering and keyset pagination (admin only).
     """
-    return crud.gadget.get_multi(db, skip=skip, limit=limit)
+    stmt = crud.gadget.admin_select(
+        fields,
+        search=search,
+        category=category,
+        brand=brand,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    rows, headers = _admin_page(
+        db, stmt, sort, crud.gadget.sort_keys(sort), limit=limit, cursor=cursor, skip=skip
+    )
+    gadgets = [row[0] for row in rows]
+    if fields is None:
+        response.headers.update(headers)
+        return gadgets
+    trimmed = trusted_json([crud.gadget.fields_dict(g, fields) for g in gadgets])
+    trimmed.headers.update(headers)
+    return trimmed
 
 
 @router.post("/admin/gadgets", response_model=schemas.Gadget)
@@ -292,10 +458,39 @@ def create_gadget(
     """
     Create new gadget (admin only).
     """
-    gadget = crud.gadget.create(db, obj_in=gadget_in)
+    try:
+        gadget = crud.gadget.create(db, obj_in=gadget_in)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A gadget with this brand and name already exists",
+        )
     return gadget
 
 
+@router.post("/admin/gadgets/import", response_model=schemas.GadgetImportReport)
+def import_gadget_file(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    format: Optional[ImportFormat] = Query(None, description="csv or ndjson (default: from the file name)"),
+    current_user: models.User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Bulk import gadgets with specs from a CSV or NDJSON file (admin only).
+
+    Existing gadgets with the same brand and name are updated. Returns
+    per-row errors for rejected rows.
+    """
+    format = format or ImportFormat.from_filename(file.filename)
+    if format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unknown file format; use a .csv or .ndjson file or pass ?format=",
+        )
+    return trusted_json(import_gadgets(db, file.file, format))
+
+
 @router.put("/admin/gadgets/{id}", response_model=schemas.Gadget)
 def update_gadget(
     *,
@@ -307,14 +502,20 @@ def update_gadget(
     """
     Update gadget (admin only).
     """
-    gadget = crud.gadget.get(db, id=id)
+    gadget = crud.gadget.get(db, id=id, options=crud.gadget.response_options())
     if not gadget:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Gadget not found",
         )
     
-    gadget = crud.gadget.update(db, db_obj=gadget, obj_in=gadget_in)
+    try:
+        gadget = crud.gadget.update(db, db_obj=gadget, obj_in=gadget_in)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A gadget with this brand and name already exists",
+        )
     return gadget
 
 
@@ -328,7 +529,7 @@ def delete_gadget(
     """
     Delete gadget (admin only).
     """
-    gadget = crud.gadget.get(db, id=id)
+    gadget = crud.gadget.get(db, id=id, options=crud.gadget.response_options())
     if not gadget:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -337,3 +538,62 @@ def delete_gadget(
     
     crud.gadget.remove(db, id=id)
     return {"message": "Gadget deleted successfully"}
+
+
+def _export_batches(stmt: Select) -> Iterator[Sequence[Row]]:
+    """
+    Yield batches of rows from a server-side cursor.
+
+    Runs on its own session because the request session is closed before a
+    streaming response body is sent.
+    """
+    with SessionLocal() as db:
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for batch in result.partitions():
+            yield batch
+
+
+@router.get("/admin/export/{resource}")
+def export_data(
+    *,
+    resource: ExportResource,
+    format: Optional[ExportFormat] = Query(
+        None, description="ndjson, csv or msgpack (default: msgpack if accepted, else ndjson)"
+    ),
+    current_user: models.User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Stream all reviews, users or gadgets as NDJSON, CSV or MessagePack (admin only).
+    """
+    if format is None:
+        format = ExportFormat.MSGPACK if wants_msgpack() else ExportFormat.NDJSON
+    if format == ExportFormat.MSGPACK and not msgpack_available():
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail="MessagePack export is not available",
+        )
+
+    stmt = {
+        ExportResource.REVIEWS: crud.review.export_select,
+        ExportResource.USERS: crud.user.export_select,
+        ExportResource.GADGETS: crud.gadget.export_select,
+    }[resource]()
+    batches = _export_batches(stmt)
+
+    if format == ExportFormat.CSV:
+        body = csv_lines(list(stmt.selected_columns.keys()), batches)
+        media_type = "text/csv"
+    elif format == ExportFormat.MSGPACK:
+        body = msgpack_records(batches)
+        media_type = "application/msgpack"
+    else:
+        body = ndjson_lines(batches)
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{resource.value}.{format.value}"'
+        },
+    )
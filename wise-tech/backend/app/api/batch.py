@@ -0,0 +1,185 @@
+"""
+Batch API endpoint.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Scope
+
+from app import models, schemas
+from app.api import deps
+from app.core.config import settings
+from app.core.responses import NegotiatedRoute, trusted_json
+from app.db.session import SessionLocal
+from app.schemas.batch import SubRequest
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=NegotiatedRoute)
+
+BATCH_PATH = f"{settings.API_V1_STR}/batch"
+
+# Batch request headers not passed on: sub-requests carry their own body, and
+# their responses are embedded in the batch, so they are plain JSON
+_PARENT_ONLY_HEADERS = frozenset({
+    b"content-length", b"content-type", b"accept", b"accept-encoding",
+})
+# Headers a sub-request can't set; it always runs as the batch's user
+_RESERVED_HEADERS = frozenset({
+    "authorization", "host", "content-length", "content-type", "accept", "accept-encoding",
+})
+
+
+def _sub_scope(request: Request, sub: SubRequest, state: Dict[str, Any]) -> Scope:
+    """
+    ASGI scope for a sub-request, with the batch request's connection details
+    and headers (including its Authorization).
+    """
+    parent = request.scope
+    url = urlsplit(sub.path)
+    headers = [(k, v) for k, v in parent["headers"] if k not in _PARENT_ONLY_HEADERS]
+    headers += [
+        (name.lower().encode("latin-1"), value.encode("latin-1", "replace"))
+        for name, value in sub.headers.items()
+        if name.lower() not in _RESERVED_HEADERS
+    ]
+    headers.append((b"accept", b"application/json"))
+    if sub.body is not None:
+        headers.append((b"content-type", b"application/json"))
+    return {
+        "type": "http",
+        "asgi": parent.get("asgi", {"version": "3.0"}),
+        "http_version": parent.get("http_version", "1.1"),
+        "scheme": parent.get("scheme", "http"),
+        "server": parent.get("server"),
+        "client": parent.get("client"),
+        "root_path": parent.get("root_path", ""),
+        "method": sub.method,
+        "path": url.path,
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "headers": headers,
+        "state": state,
+    }
+
+
+async def _dispatch(app: ASGIApp, scope: Scope, body: Optional[Any]) -> Dict[str, Any]:
+    """
+    Run one sub-request through the ASGI app and collect its response.
+    """
+    if scope["path"].rstrip("/") == BATCH_PATH:
+        return {"status": 400, "headers": {}, "body": {"detail": "Batch requests can't be nested"}}
+
+    request_body = b"" if body is None else orjson.dumps(body)
+    body_sent = False
+
+    async def receive() -> Message:
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": request_body, "more_body": False}
+        # The client never disconnects; streaming responses run to completion
+        await asyncio.Event().wait()
+
+    start: Dict[str, Any] = {}
+    chunks: List[bytes] = []
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # The error middleware re-raises after sending its 500 response
+        logger.exception("Batch sub-request %s %s failed", scope["method"], scope["path"])
+        if not start:
+            return {"status": 500, "headers": {}, "body": {"detail": "Internal Server Error"}}
+
+    headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in start["headers"]}
+    content = b"".join(chunks)
+    if not content:
+        response_body = None
+    elif "json" in headers.get("content-type", ""):
+        response_body = orjson.loads(content)
+    else:
+        response_body = content.decode("utf-8", "replace")
+    return {"status": start["status"], "headers": headers, "body": response_body}
+
+
+def _resolve_user(request: Request, token: str) -> models.User:
+    """
+    Resolve the batch's user once, detached so every sub-request can read it.
+    """
+    db = SessionLocal()
+    try:
+        return deps.get_current_user(request, db, token)
+    finally:
+        db.close()
+
+
+@router.post("/batch", response_model=schemas.BatchResponse)
+async def run_batch(
+    *,
+    request: Request,
+    batch_in: schemas.BatchRequest,
+    token: Optional[str] = Depends(deps.optional_oauth2_scheme),
+) -> Any:
+    """
+    Run many API requests in one round-trip.
+
+    Sub-requests go through the app in-process as the batch's user, whose
+    token is checked once (and the user reloaded after every write).
+    Consecutive reads (GET) run concurrently, each on its own session; writes
+    run one at a time, in request order, after the reads before them. Every
+    sub-request gets its own status in the response.
+    """
+    if not 1 <= len(batch_in.requests) <= settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Between 1 and {settings.BATCH_MAX_REQUESTS} requests are required",
+        )
+
+    user = await run_in_threadpool(_resolve_user, request, token) if token else None
+    state = {**request.scope.get("state", {}), "user": user}
+
+    responses: List[Optional[Dict[str, Any]]] = [None] * len(batch_in.requests)
+    reads: List[int] = []
+
+    async def run_reads() -> None:
+        results = await asyncio.gather(*(
+            _dispatch(
+                request.app,
+                _sub_scope(request, batch_in.requests[index], state),
+                batch_in.requests[index].body,
+            )
+            for index in reads
+        ))
+        for index, result in zip(reads, results):
+            responses[index] = result
+        reads.clear()
+
+    for index, sub in enumerate(batch_in.requests):
+        if sub.method == "GET":
+            reads.append(index)
+            continue
+        await run_reads()
+        responses[index] = await _dispatch(request.app, _sub_scope(request, sub, state), sub.body)
+        if user is not None:
+            # The write may have changed the user (profile, admin flag, ...)
+            try:
+                state["user"] = await run_in_threadpool(_resolve_user, request, token)
+            except HTTPException:
+                # Deleted: later sub-requests fail on their own
+                state["user"] = None
+    await run_reads()
+
+    return trusted_json({"responses": responses})
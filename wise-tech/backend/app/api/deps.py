@@ -2,26 +2,33 @@
 Dependencies for API endpoints.
 """
 
-from typing import Generator
+from typing import Callable, Generator, List, Optional, Type
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.core import security
 from app.core.config import settings
+from app.core.responses import server_cache_headers
 from app.db.session import SessionLocal
 
 # Dependency for OAuth2 token verification
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.API_V1_STR}/auth/login", auto_error=False
+)
 
 
 def get_db() -> Generator:
     """
     Get database session.
+
+    The session only checks out a connection when it first runs a statement,
+    so requests answered without the database never take one.
     """
     db = SessionLocal()
     try:
@@ -30,12 +37,87 @@ def get_db() -> Generator:
         db.close()
 
 
+def public_cache(response: Response) -> None:
+    """
+    Mark a response as the same for every user, so the server may cache it.
+    """
+    response.headers.update(server_cache_headers())
+
+
+def sparse_fields(schema: Type[BaseModel]) -> Callable[..., Optional[List[str]]]:
+    """
+    Build a dependency that parses a ``?fields=`` sparse fieldset for a response schema.
+
+    Returns None when the parameter is absent (full response), otherwise the
+    requested field names in order, always including ``id``.
+    """
+    allowed = set(schema.model_fields)
+
+    def parse_fields(
+        fields: Optional[str] = Query(
+            None, description=f"Comma-separated fields to return: {', '.join(schema.model_fields)}"
+        ),
+    ) -> Optional[List[str]]:
+        if fields is None:
+            return None
+        requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in requested if f not in allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+        if "id" not in requested:
+            requested.insert(0, "id")
+        return requested
+
+    return parse_fields
+
+
+def id_list(max_ids: int) -> Callable[..., List[int]]:
+    """
+    Build a dependency that parses a required ``?ids=`` list of comma-separated ids.
+
+    Order and duplicates are kept, so responses can follow the request.
+    """
+
+    def parse_ids(
+        ids: str = Query(..., description=f"Comma-separated ids, at most {max_ids}"),
+    ) -> List[int]:
+        parts = [part.strip() for part in ids.split(",") if part.strip()]
+        # ASCII digits only (isdigit() also accepts "²" and the like), short
+        # enough to fit a 64-bit database integer
+        invalid = [
+            part for part in parts
+            if not (part.isascii() and part.isdigit() and len(part) <= 18)
+        ]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid ids: {', '.join(invalid)}",
+            )
+        if not parts or len(parts) > max_ids:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Between 1 and {max_ids} ids are required",
+            )
+        return [int(part) for part in parts]
+
+    return parse_ids
+
+
 def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+    request: Request, db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
 ) -> models.User:
     """
     Get current user from token.
+
+    Sub-requests of a batch reuse the user the batch resolved from the same
+    token, in ``request.state.user``.
     """
+    shared = getattr(request.state, "user", None)
+    if shared is not None:
+        return shared
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
@@ -5,15 +5,32 @@ Gadget API endpoints.
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core.config import settings
+from app.core.responses import NegotiatedRoute, trusted_json
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
-@router.get("/gadgets", response_model=List[schemas.Gadget])
+def _gadget_list(gadgets: List[models.Gadget], fields: Optional[List[str]]) -> Any:
+    """
+    Return the full gadget list for validation by response_model, or a trimmed
+    sparse-fieldset response that skips it.
+    """
+    if fields is None:
+        return gadgets
+    return trusted_json([crud.gadget.fields_dict(g, fields) for g in gadgets], cacheable=True)
+
+
+@router.get(
+    "/gadgets",
+    response_model=List[schemas.Gadget],
+    dependencies=[Depends(deps.public_cache)],
+)
 def read_gadgets(
     *,
     db: Session = Depends(deps.get_db),
@@ -24,11 +41,12 @@ def read_gadgets(
     min_rating: Optional[float] = Query(None, description="Minimum rating"),
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Gadget)),
 ) -> Any:
     """
     Get gadgets with filtering.
     """
-    return crud.gadget.filter_gadgets(
+    gadgets = crud.gadget.filter_gadgets(
         db,
         category=category,
         brand=brand,
@@ -37,10 +55,16 @@ def read_gadgets(
         min_rating=min_rating,
         skip=skip,
         limit=limit,
+        fields=fields,
     )
+    return _gadget_list(gadgets, fields)
 
 
-@router.get("/gadgets/search", response_model=List[schemas.Gadget])
+@router.get(
+    "/gadgets/search",
+    response_model=List[schemas.Gadget],
+    dependencies=[Depends(deps.public_cache)],
+)
 def search_gadgets(
     *,
     db: Session = Depends(deps.get_db),
@@ -48,38 +72,139 @@ def search_gadgets(
     category: Optional[str] = Query(None, description="Filter by category"),
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Gadget)),
 ) -> Any:
     """
     Search gadgets with optional category filter.
     """
-    return crud.gadget.search_gadgets(db, query=query, category=category, skip=skip, limit=limit)
+    gadgets = crud.gadget.search_gadgets(
+        db, query=query, category=category, skip=skip, limit=limit, fields=fields
+    )
+    return _gadget_list(gadgets, fields)
 
 
-@router.get("/gadgets/featured", response_model=List[schemas.Gadget])
+@router.get(
+    "/gadgets/featured",
+    response_model=List[schemas.Gadget],
+    dependencies=[Depends(deps.public_cache)],
+)
 def read_featured_gadgets(
     *,
     db: Session = Depends(deps.get_db),
     limit: int = Query(4, description="Number of featured gadgets to return"),
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Gadget)),
 ) -> Any:
     """
     Get featured gadgets.
     """
-    return crud.gadget.get_featured_gadgets(db, limit=limit)
+    gadgets = crud.gadget.get_featured_gadgets(db, limit=limit, fields=fields)
+    return _gadget_list(gadgets, fields)
+
+
+@router.get(
+    "/gadgets/categories",
+    response_model=List[schemas.CategoryWithCount],
+    dependencies=[Depends(deps.public_cache)],
+)
+def read_categories(
+    *,
+    db: Session = Depends(deps.get_db),
+) -> Any:
+    """
+    Get all gadget categories with their gadget counts.
+    """
+    return crud.gadget.get_categories_with_counts(db)
+
+
+@router.get(
+    "/gadgets/categories/{category}/stats",
+    response_model=List[schemas.GadgetReviewStats],
+    dependencies=[Depends(deps.public_cache)],
+)
+def read_category_review_stats(
+    *,
+    db: Session = Depends(deps.get_db),
+    category: str,
+) -> Any:
+    """
+    Get review statistics for every gadget in a category.
+    """
+    return trusted_json(crud.gadget.get_review_stats(db, category=category), cacheable=True)
 
 
-@router.get("/gadgets/all", response_model=List[schemas.Gadget])
+@router.get(
+    "/gadgets/all",
+    response_model=List[schemas.Gadget],
+    dependencies=[Depends(deps.public_cache)],
+)
 def read_all_gadgets(
     *,
     db: Session = Depends(deps.get_db),
     limit: int = Query(100, description="Maximum number of gadgets to return"),
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Gadget)),
 ) -> Any:
     """
     Get all gadgets (not limited to featured).
     """
-    return crud.gadget.get_multi(db, skip=0, limit=limit)
+    gadgets = crud.gadget.get_multi(db, skip=0, limit=limit, fields=fields)
+    return _gadget_list(gadgets, fields)
+
+
+@router.get(
+    "/gadgets/batch",
+    response_model=schemas.GadgetBatch,
+    dependencies=[Depends(deps.public_cache)],
+)
+def read_gadget_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    ids: List[int] = Depends(deps.id_list(settings.GADGET_BATCH_MAX_IDS)),
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Gadget)),
+) -> Any:
+    """
+    Get many gadgets by id in one request.
+
+    Gadgets come back in request order, with null in place of (and the id
+    listed in missing for) any id that does not exist.
+    """
+    found = crud.gadget.get_batch(db, ids=ids)
+    gadgets = []
+    for gadget_id in ids:
+        item = found.get(gadget_id)
+        if item is not None and fields is not None:
+            item = {name: item[name] for name in fields}
+        gadgets.append(item)
+    missing = list(dict.fromkeys(gadget_id for gadget_id in ids if gadget_id not in found))
+    return trusted_json({"gadgets": gadgets, "missing": missing}, cacheable=True)
 
 
-@router.get("/gadgets/{id}", response_model=schemas.GadgetWithReviews)
+@router.get(
+    "/gadgets/stats",
+    response_model=schemas.GadgetReviewStatsBatch,
+    dependencies=[Depends(deps.public_cache)],
+)
+def read_gadget_review_stats(
+    *,
+    db: Session = Depends(deps.get_db),
+    ids: List[int] = Depends(deps.id_list(settings.GADGET_BATCH_MAX_IDS)),
+) -> Any:
+    """
+    Get review count, average rating and last review time for many gadgets.
+
+    Stats come back in request order, with null in place of (and the id
+    listed in missing for) any gadget that does not exist.
+    """
+    found = {item["gadget_id"]: item for item in crud.gadget.get_review_stats(db, ids=ids)}
+    stats = [found.get(gadget_id) for gadget_id in ids]
+    missing = list(dict.fromkeys(gadget_id for gadget_id in ids if gadget_id not in found))
+    return trusted_json({"stats": stats, "missing": missing}, cacheable=True)
+
+
+@router.get(
+    "/gadgets/{id}",
+    response_model=schemas.GadgetWithReviews,
+    dependencies=[Depends(deps.public_cache)],
+)
 def read_gadget(
     *,
     db: Session = Depends(deps.get_db),
@@ -88,7 +213,7 @@ def read_gadget(
     """
     Get a specific gadget with reviews.
     """
-    gadget = crud.gadget.get(db, id=id)
+    gadget = crud.gadget.get(db, id=id, options=crud.gadget.detail_options())
     if not gadget:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -117,11 +242,12 @@ def read_gadget(
                 "profile_photo": getattr(review.user, 'profile_photo', None),
             }
         }
-        reviews_with_usernames.append(schemas.ReviewInGadget(**review_dict))
+        reviews_with_usernames.append(review_dict)
         
     gadget_dict["reviews"] = reviews_with_usernames
-        
-    return schemas.GadgetWithReviews(**gadget_dict)
+    
+    # Validated once against response_model
+    return gadget_dict
 
 
 @router.get("/gadgets/{id}/reviews", response_model=List[schemas.Review])
@@ -131,6 +257,7 @@ def read_gadget_reviews(
     id: int,
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Review)),
 ) -> Any:
     """
     Get reviews for a specific gadget.
@@ -142,26 +269,12 @@ def read_gadget_reviews(
             detail="Gadget not found",
         )
         
-    reviews = crud.review.get_reviews_by_gadget(
-        db, gadget_id=id, skip=skip, limit=limit
-    )
+    rows = crud.review.get_review_rows(db, gadget_id=id, fields=fields, skip=skip, limit=limit)
     
     # Add user names and profile info to reviews
-    result = []
-    for review in reviews:
-        review_dict = {
-            **review.__dict__,
-            "user_name": review.user.username,
-            "user": {
-                "id": review.user.id,
-                "username": review.user.username,
-                "full_name": getattr(review.user, 'full_name', None),
-                "profile_photo": getattr(review.user, 'profile_photo', None),
-            }
-        }
-        result.append(schemas.Review(**review_dict))
+    result = [crud.review.listing_dict(row, fields, with_gadget=False) for row in rows]
         
-    return result
+    return trusted_json(result, cacheable=True)
 
 
 @router.post("/gadgets", response_model=schemas.Gadget)
@@ -175,7 +288,13 @@ def create_gadget(
     """
     Create a new gadget (admin only).
     """
-    return crud.gadget.create_with_specs(db, gadget_in=gadget_in, specs=specs)
+    try:
+        return crud.gadget.create_with_specs(db, gadget_in=gadget_in, specs=specs)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A gadget with this brand and name already exists",
+        )
 
 
 @router.put("/gadgets/{id}", response_model=schemas.Gadget)
@@ -189,14 +308,20 @@ def update_gadget(
     """
     Update a gadget (admin only).
     """
-    gadget = crud.gadget.get(db, id=id)
+    gadget = crud.gadget.get(db, id=id, options=crud.gadget.response_options())
     if not gadget:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Gadget not found",
         )
         
-    return crud.gadget.update(db, db_obj=gadget, obj_in=gadget_in)
+    try:
+        return crud.gadget.update(db, db_obj=gadget, obj_in=gadget_in)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A gadget with this brand and name already exists",
+        )
 
 
 @router.delete("/gadgets/{id}", response_model=schemas.Gadget)
@@ -209,7 +334,7 @@ def delete_gadget(
     """
     Delete a gadget (admin only).
     """
-    gadget = crud.gadget.get(db, id=id)
+    gadget = crud.gadget.get(db, id=id, options=crud.gadget.response_options())
     if not gadget:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,99 @@
+"""
+Home page API endpoint.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable, List
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.api import deps
+from app.core.cache import TTLCache, clear_on_commit
+from app.core.config import settings
+from app.core.responses import NegotiatedRoute, trusted_json
+from app.db.session import SessionLocal
+
+router = APIRouter(route_class=NegotiatedRoute)
+
+# Home page sections by (section, limit). A committed write to any table the
+# sections read clears them all; the TTL bounds staleness from other processes.
+home_sections = TTLCache(maxsize=64, ttl=settings.HOME_SECTION_CACHE_TTL)
+HOME_SOURCE_TABLES = frozenset({"gadgets", "gadget_specs", "categories", "reviews", "users"})
+
+
+def _featured(db: Session, limit: int) -> List[Dict[str, Any]]:
+    """
+    Top-rated gadgets with their review counts.
+    """
+    ids = [g.id for g in crud.gadget.get_featured_gadgets(db, limit=limit, fields=["id"])]
+    items = crud.gadget.get_batch(db, ids=ids)
+    stats = {s["gadget_id"]: s for s in crud.gadget.get_review_stats(db, ids=ids)}
+    # Copy the cached items before filling in the count
+    return [
+        {**items[gadget_id], "review_count": stats[gadget_id]["review_count"]}
+        for gadget_id in ids
+        if gadget_id in items
+    ]
+
+
+def _recent_reviews(db: Session, limit: int) -> List[Dict[str, Any]]:
+    return [crud.review.listing_dict(row) for row in crud.review.get_review_rows(db, limit=limit)]
+
+
+def _categories(db: Session) -> List[Dict[str, Any]]:
+    return crud.gadget.get_categories_with_counts(db)
+
+
+def _cached_section(key: Hashable, build: Callable[[Session], Any]) -> Any:
+    """
+    A cached home page section, built on its own session when missing.
+    """
+    section = home_sections.get(key)
+    if section is None:
+        db = SessionLocal()
+        try:
+            section = build(db)
+        finally:
+            db.close()
+        home_sections.set(key, section)
+    return section
+
+
+@router.get(
+    "/home",
+    response_model=schemas.HomePage,
+    dependencies=[Depends(deps.public_cache)],
+)
+async def read_home(
+    *,
+    featured_limit: int = Query(4, ge=1, le=20, description="Number of featured gadgets"),
+    reviews_limit: int = Query(6, ge=1, le=50, description="Number of recent reviews"),
+) -> Any:
+    """
+    Get everything the home page shows in one response.
+
+    The sections are independent, so each one is built concurrently in the
+    threadpool on its own session.
+    """
+    featured, recent_reviews, categories = await asyncio.gather(
+        run_in_threadpool(
+            _cached_section, ("featured", featured_limit), lambda db: _featured(db, featured_limit)
+        ),
+        run_in_threadpool(
+            _cached_section,
+            ("recent_reviews", reviews_limit),
+            lambda db: _recent_reviews(db, reviews_limit),
+        ),
+        run_in_threadpool(_cached_section, ("categories",), _categories),
+    )
+    return trusted_json({
+        "featured": featured,
+        "recent_reviews": recent_reviews,
+        "categories": categories,
+    }, cacheable=True)
+
+
+clear_on_commit(home_sections, HOME_SOURCE_TABLES, "home_sections_stale")
@@ -2,16 +2,28 @@
 Review API endpoints.
 """
 
+import enum
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core import pagination
+from app.core.responses import NegotiatedRoute, trusted_json
+from app.crud.gadget import category_key
 from app.models.review import Review
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
+
+
+class CountMode(str, enum.Enum):
+    """How GET /reviews computes the total."""
+    EXACT = "exact"  # exact count, cached per filter set
+    ESTIMATE = "estimate"  # approximate total for unfiltered listings
+    NONE = "none"  # no total, only has_more
 
 
 @router.get("/reviews", response_model=schemas.ReviewPaginatedResponse)
@@ -23,19 +35,33 @@ def get_all_reviews(
     rating: Optional[int] = Query(None, description="Minimum rating filter"),
     sort: str = Query("newest", description="Sort order: newest, oldest, rating_high, rating_low"),
     page: int = Query(1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; replaces page"),
     limit: int = Query(12, ge=1, le=100, description="Number of reviews per page"),
+    count: CountMode = Query(CountMode.EXACT, description="Total count: exact, estimate or none"),
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Review)),
 ) -> Any:
     """
     Get all reviews with filtering, search, and pagination.
+
+    Pages are addressed either by page number (OFFSET, fine for the first few
+    pages) or by the opaque next_cursor returned with every page, which seeks
+    past the previous page's sort key so deep pages cost the same as the first.
+
+    Exact totals are cached per filter set until reviews, gadgets or users
+    change. count=estimate reads an approximate total for unfiltered listings
+    (filtered ones still get the exact count) and count=none skips counting;
+    has_more is always set from one extra fetched row.
     """
-    from sqlalchemy import and_, or_, desc, asc
+    from sqlalchemy import and_, or_
     from app.models.gadget import Gadget
+    from app.models.user import User
     
-    # Calculate skip value
-    skip = (page - 1) * limit
-    
-    # Base query with joins
-    query = db.query(Review).join(Review.user).join(Review.gadget)
+    # Column-projection query; users and gadgets are joined when the requested
+    # fields or the filters below need them
+    filter_category = bool(category and category.lower() != "all")
+    query = crud.review.listing_select(
+        fields, join_user=bool(search), join_gadget=bool(search) or filter_category
+    )
     
     # Apply filters
     filters = []
@@ -43,7 +69,6 @@ def get_all_reviews(
     # Search filter (search in review content, title, gadget name, username, and user full_name)
     if search:
         search_term = f"%{search}%"
-        from app.models.user import User
         filters.append(
             or_(
                 Review.content.ilike(search_term),
@@ -58,8 +83,8 @@ def get_all_reviews(
         )
     
     # Category filter
-    if category and category.lower() != "all":
-        filters.append(Gadget.category.ilike(f"%{category}%"))
+    if filter_category:
+        filters.append(crud.gadget.category_filter(category))
     
     # Rating filter
     if rating:
@@ -69,61 +94,50 @@ def get_all_reviews(
     if filters:
         query = query.filter(and_(*filters))
     
-    # Apply sorting
-    if sort == "oldest":
-        query = query.order_by(asc(Review.created_at))
-    elif sort == "rating_high":
-        query = query.order_by(desc(Review.rating), desc(Review.created_at))
-    elif sort == "rating_low":
-        query = query.order_by(asc(Review.rating), desc(Review.created_at))
-    else:  # newest (default)
-        query = query.order_by(desc(Review.created_at))
-    
     # Get total count for pagination
-    total_count = query.count()
-    total_pages = (total_count + limit - 1) // limit
+    total_count = total_pages = None
+    if count == CountMode.ESTIMATE and not filters:
+        total_count = crud.review.estimated_count(db)
+    elif count != CountMode.NONE:
+        count_key = (
+            search.strip().lower() if search else None,
+            category_key(category) if filter_category else None,
+            rating or None,
+        )
+        total_count = crud.review.cached_count(db, query, count_key)
+    if total_count is not None:
+        total_pages = (total_count + limit - 1) // limit
     
-    # Apply pagination
-    reviews = query.offset(skip).limit(limit).all()
+    # Apply sorting (newest by default) and pagination
+    try:
+        rows, next_cursor = pagination.keyset_page(
+            db,
+            query,
+            sort,
+            crud.review.sort_keys(sort),
+            limit=limit,
+            cursor=cursor,
+            offset=(page - 1) * limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    current_page = page if cursor is None else None
     
-    # Add user names and gadget info to reviews
-    result_reviews = []
-    for review in reviews:
-        review_dict = {
-            "id": review.id,
-            "title": review.title,
-            "content": review.content,
-            "rating": review.rating,
-            "pros": review.pros,
-            "cons": review.cons,
-            "user_id": review.user_id,
-            "gadget_id": review.gadget_id,
-            "status": review.status,
-            "created_at": review.created_at,
-            "updated_at": review.updated_at,
-            "user_name": review.user.username,
-            "user": {
-                "id": review.user.id,
-                "username": review.user.username,
-                "full_name": getattr(review.user, 'full_name', None),
-                "profile_photo": getattr(review.user, 'profile_photo', None),
-            },
-            "gadget": {
-                "id": review.gadget.id,
-                "name": review.gadget.name,
-                "category": review.gadget.category,
-                "brand": review.gadget.brand,
-            }
-        }
-        result_reviews.append(review_dict)
+    # Build response items straight from the projected rows
+    result_reviews = [crud.review.listing_dict(row, fields) for row in rows]
     
-    return schemas.ReviewPaginatedResponse(
-        reviews=result_reviews,
-        total=total_count,
-        total_pages=total_pages,
-        current_page=page,
-        limit=limit
-    )
+    return trusted_json({
+        "reviews": result_reviews,
+        "total": total_count,
+        "total_pages": total_pages,
+        "current_page": current_page,
+        "limit": limit,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+    }, cacheable=True)
 
 
 @router.get("/reviews/recent", response_model=List[schemas.Review])
@@ -131,44 +145,13 @@ def read_recent_reviews(
     *,
     db: Session = Depends(deps.get_db),
     limit: int = 10,
+    fields: Optional[List[str]] = Depends(deps.sparse_fields(schemas.Review)),
 ) -> Any:
     """
     Get recent reviews with user and gadget information.
     """
-    reviews = crud.review.get_recent_reviews(db, limit=limit)
-    
-    # Convert to dict with full user and gadget information
-    result = []
-    for review in reviews:
-        review_dict = {
-            "id": review.id,
-            "title": review.title,
-            "content": review.content,
-            "rating": review.rating,
-            "pros": review.pros,
-            "cons": review.cons,
-            "user_id": review.user_id,
-            "gadget_id": review.gadget_id,
-            "status": review.status,
-            "created_at": review.created_at,
-            "updated_at": review.updated_at,
-            "user_name": review.user.username if review.user else "Unknown",
-            "user": {
-                "id": review.user.id,
-                "username": review.user.username,
-                "full_name": getattr(review.user, 'full_name', review.user.username),
-                "profile_photo": getattr(review.user, 'profile_photo', None),
-            } if review.user else None,
-            "gadget": {
-                "id": review.gadget.id,
-                "name": review.gadget.name,
-                "category": review.gadget.category,
-                "brand": review.gadget.brand,
-            } if review.gadget else None
-        }
-        result.append(review_dict)
-        
-    return result
+    rows = crud.review.get_review_rows(db, fields=fields, limit=limit)
+    return trusted_json([crud.review.listing_dict(row, fields) for row in rows], cacheable=True)
 
 
 @router.post("/reviews", response_model=schemas.Review)
@@ -181,20 +164,20 @@ def create_review(
     """
     Create a new review.
     """
-    # Mengecek apakah gadget yang direview ada
-    gadget = crud.gadget.get(db, id=review_in.gadget_id)
-    if not gadget:
+    # Note: Removed duplicate review restriction - users can now submit multiple reviews for the same gadget
+    
+    # Create review; a missing gadget surfaces as a foreign key violation
+    try:
+        review = crud.review.create_user_review(
+            db, obj_in=review_in, user_id=current_user.id
+        )
+    except IntegrityError as e:
+        if not crud.is_foreign_key_violation(e):
+            raise
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Gadget not found",
         )
-        
-    # Note: Removed duplicate review restriction - users can now submit multiple reviews for the same gadget
-    
-    # Create review
-    review = crud.review.create_user_review(
-        db, obj_in=review_in, user_id=current_user.id
-    )
     
     # Add complete user info to review response
     review_dict = {
@@ -209,7 +192,7 @@ def create_review(
         }
     }
     
-    return schemas.Review(**review_dict)
+    return review_dict
 
 
 @router.put("/reviews/{id}", response_model=schemas.Review)
@@ -253,7 +236,7 @@ def update_review(
         }
     }
     
-    return schemas.Review(**review_dict)
+    return review_dict
 
 
 @router.delete("/reviews/{id}", response_model=schemas.Review)
@@ -289,4 +272,4 @@ def delete_review(
     # Delete review
     crud.review.remove(db, id=id)
     
-    return schemas.Review(**review_dict)
+    return review_dict
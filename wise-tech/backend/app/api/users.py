@@ -12,8 +12,9 @@ from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.core.responses import NegotiatedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=NegotiatedRoute)
 
 
 @router.get("/users/profile", response_model=schemas.User)
@@ -53,23 +54,23 @@ def get_current_user_reviews(
     """
     Get current user's reviews.
     """
-    reviews = crud.review.get_reviews_by_user(
+    rows = crud.review.get_reviews_by_user(
         db, user_id=current_user.id, skip=skip, limit=limit
     )
     
     # Convert to ReviewWithDetails schema
     result = []
-    for review in reviews:
-        gadget = crud.gadget.get(db, id=review.gadget_id)
+    for review, gadget_name, gadget_brand, gadget_category in rows:
         review_dict = {
             **review.__dict__,
-            "user_name": review.user.username,
-            "gadget_name": gadget.name,
-            "gadget_brand": gadget.brand,
-            "gadget_category": gadget.category,
+            "user_name": current_user.username,
+            "gadget_name": gadget_name,
+            "gadget_brand": gadget_brand,
+            "gadget_category": gadget_category,
         }
-        result.append(schemas.ReviewWithDetails(**review_dict))
+        result.append(review_dict)
         
+    # Validated once against response_model
     return result
 
 
@@ -0,0 +1,147 @@
+"""
+In-process cache module for the WiseTech API application.
+Provides a small thread-safe LRU cache with per-entry expiry, and
+invalidation of caches when a session commits writes to their source tables.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Collection, Hashable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Every live cache, so tests can start from a cold process state
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+def clear_all_caches() -> None:
+    """
+    Empty every TTLCache in the process.
+    """
+    for cache in list(_caches):
+        cache.clear()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value, or default if it is missing or expired.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a single entry if present.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def mark_stale(session: Session, flag: str, keys: Optional[Iterable[Hashable]] = None) -> None:
+    """
+    Evict the given keys (or everything) from the cache registered under flag
+    with clear_on_commit when the session's transaction commits.
+    """
+    if keys is None or session.info.get(flag) is True:
+        session.info[flag] = True
+    else:
+        session.info.setdefault(flag, set()).update(keys)
+
+
+def clear_on_commit(
+    cache: TTLCache,
+    tables: Collection[str],
+    flag: str,
+    *,
+    keys_of: Optional[Callable[[Any], Iterable[Hashable]]] = None,
+    keys_reported: Optional[str] = None,
+) -> None:
+    """
+    Invalidate the cache when a session commits writes to any of the tables.
+
+    Writes are noted in session.info[flag] as the ORM flushes objects or
+    executes INSERT/UPDATE/DELETE statements, and forgotten on rollback. Any
+    write clears the whole cache, unless keys_of is given: then a flushed
+    object only evicts the keys keys_of returns for it. Statements executed
+    with the keys_reported execution option report their keys themselves
+    through mark_stale.
+    """
+
+    @event.listens_for(Session, "after_flush")
+    def _flag_flushed(session: Session, flush_context: Any) -> None:
+        written = (
+            obj for obj in chain(session.new, session.dirty, session.deleted)
+            if getattr(obj, "__tablename__", None) in tables
+        )
+        if keys_of is None:
+            if next(written, None) is not None:
+                mark_stale(session, flag)
+        else:
+            keys = [key for obj in written for key in keys_of(obj)]
+            if keys:
+                mark_stale(session, flag, keys)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _flag_executed(state: ORMExecuteState) -> None:
+        if (state.is_insert or state.is_update or state.is_delete) and (
+            state.statement.table.name in tables
+        ) and not (keys_reported and state.execution_options.get(keys_reported)):
+            mark_stale(state.session, flag)
+
+    @event.listens_for(Session, "after_commit")
+    def _clear_stale(session: Session) -> None:
+        stale = session.info.pop(flag, None)
+        if stale is True:
+            cache.clear()
+        elif stale:
+            for key in stale:
+                cache.delete(key)
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard_flag(session: Session) -> None:
+        session.info.pop(flag, None)
@@ -0,0 +1,329 @@
+"""
+Response compression module for the WiseTech API application.
+Negotiates zstd/brotli/gzip and keeps precompressed copies of hot responses.
+
+gzip is always available; brotli and zstd are used when the optional
+``brotli`` and ``zstandard`` packages are installed.
+"""
+
+import gzip
+import hashlib
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import TTLCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Server preference order when the client accepts several encodings equally
+SUPPORTED_ENCODINGS: List[str] = (
+    (["zstd"] if zstandard else []) + (["br"] if brotli else []) + ["gzip"]
+)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/msgpack",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Internal response header: the response is the same for every user and may be
+# kept in the hot-response cache for this many seconds. It is stripped before
+# the response leaves the server; clients get Cache-Control: no-cache and an
+# ETag instead, so they always revalidate and never see data older than a write.
+SERVER_CACHE_HEADER = "X-Server-Cache-TTL"
+CLIENT_CACHE_CONTROL = "no-cache"
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best supported content-coding from an Accept-Encoding header.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token.strip()] = q
+
+    best, best_q = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(encoding: str, body: bytes, *, best: bool = False) -> bytes:
+    """
+    Compress a complete body. ``best`` trades CPU for size, for cached bodies
+    that are compressed once and served many times.
+    """
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=10 if best else 3).compress(body)
+    if encoding == "br":
+        return brotli.compress(body, quality=9 if best else 4)
+    return gzip.compress(body, compresslevel=9 if best else 6, mtime=0)
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for streamed bodies. Each chunk is flushed so the
+    client receives data as soon as it is produced.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "zstd":
+            self._obj = zstandard.ZstdCompressor(level=3).compressobj()
+        elif encoding == "br":
+            self._obj = brotli.Compressor(quality=4)
+        else:
+            self._obj = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "zstd":
+            return self._obj.compress(chunk) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        if self.encoding == "br":
+            return self._obj.process(chunk) + self._obj.flush()
+        return self._obj.compress(chunk) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._obj.finish()
+        return self._obj.flush()
+
+
+@dataclass
+class CachedResponse:
+    """A cacheable response body with its precompressed variants."""
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    compressible: bool
+    etag: str
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+
+def _is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _pop_server_cache_ttl(headers: MutableHeaders) -> Optional[int]:
+    """
+    Remove the internal server cache header, returning its TTL (None when the
+    response was not marked). Marked responses are sent with no-cache.
+    """
+    value = headers.get(SERVER_CACHE_HEADER)
+    if value is None:
+        return None
+    del headers[SERVER_CACHE_HEADER]
+    headers["Cache-Control"] = CLIENT_CACHE_CONTROL
+    if "set-cookie" in headers:
+        return 0
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        return 0
+
+
+def _etag(body: bytes) -> str:
+    # Weak: the compressed variants carry the same validator
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses above a size threshold and
+    caches GET responses marked with the internal server cache header together
+    with their compressed bodies, so hot endpoints are neither recomputed nor
+    recompressed. Marked responses get an ETag, and a matching If-None-Match
+    is answered with 304.
+
+    Any successful unsafe request (POST/PUT/PATCH/DELETE) outside
+    ``invalidate_exempt`` clears the cache.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 500,
+        cache: Optional[TTLCache] = None,
+        invalidate_exempt: Sequence[str] = (),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = cache
+        self.invalidate_exempt = tuple(invalidate_exempt)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        if_none_match = request_headers.get("if-none-match", "")
+        method = scope["method"]
+
+        cache_key = None
+        if self.cache is not None and method == "GET":
+            cache_key = (
+                scope["path"],
+                scope["query_string"],
+                request_headers.get("accept", ""),
+            )
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                await self._send_entry(entry, encoding, if_none_match, send, hit=True)
+                return
+
+        state: Dict[str, object] = {
+            "start": None, "compressor": None, "streaming": False, "ttl": None,
+        }
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["start"] = message
+                state["ttl"] = _pop_server_cache_ttl(MutableHeaders(raw=message["headers"]))
+                if (
+                    self.cache is not None
+                    and method not in SAFE_METHODS
+                    and 200 <= message["status"] < 300
+                    and not scope["path"].startswith(self.invalidate_exempt)
+                ):
+                    self.cache.clear()
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            start: Message = state["start"]
+
+            if not state["streaming"] and not more_body:
+                await self._send_complete(
+                    start, body, encoding, cache_key, state["ttl"], if_none_match, send
+                )
+                return
+
+            if not state["streaming"]:
+                state["streaming"] = True
+                headers = MutableHeaders(raw=start["headers"])
+                if encoding and _is_compressible(headers):
+                    state["compressor"] = StreamCompressor(encoding)
+                    headers["Content-Encoding"] = encoding
+                    headers.add_vary_header("Accept-Encoding")
+                    if "content-length" in headers:
+                        del headers["Content-Length"]
+                await send(start)
+
+            compressor: Optional[StreamCompressor] = state["compressor"]
+            if compressor is not None:
+                body = compressor.compress(body)
+                if not more_body:
+                    body += compressor.finish()
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _send_complete(
+        self,
+        start: Message,
+        body: bytes,
+        encoding: Optional[str],
+        cache_key: Optional[tuple],
+        ttl: Optional[int],
+        if_none_match: str,
+        send: Send,
+    ) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        compressible = _is_compressible(headers)
+
+        if ttl is not None and start["status"] == 200:
+            raw_headers = [
+                (k, v) for k, v in start["headers"]
+                if k.lower() not in (b"content-length", b"content-encoding")
+            ]
+            entry = CachedResponse(start["status"], raw_headers, body, compressible, _etag(body))
+            if cache_key is not None and ttl:
+                self.cache.set(cache_key, entry, ttl=ttl)
+            await self._send_entry(entry, encoding, if_none_match, send, hit=False)
+            return
+
+        if encoding and compressible and len(body) >= self.minimum_size:
+            body = compress(encoding, body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+        await send(start)
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_entry(
+        self,
+        entry: CachedResponse,
+        encoding: Optional[str],
+        if_none_match: str,
+        send: Send,
+        *,
+        hit: bool,
+    ) -> None:
+        headers = MutableHeaders(raw=list(entry.headers))
+        headers["ETag"] = entry.etag
+        headers["X-Cache"] = "HIT" if hit else "MISS"
+        if _etag_matches(if_none_match, entry.etag):
+            if "content-type" in headers:
+                del headers["Content-Type"]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        body = entry.body
+        if encoding and entry.compressible and len(body) >= self.minimum_size:
+            compressed = entry.variants.get(encoding)
+            if compressed is None:
+                compressed = compress(encoding, body, best=True)
+                entry.variants[encoding] = compressed
+            body = compressed
+            headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+        headers["Content-Length"] = str(len(body))
+        await send({"type": "http.response.start", "status": entry.status, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
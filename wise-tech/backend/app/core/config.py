@@ -7,7 +7,7 @@ import secrets
 from typing import List, Optional, Union
 
 from pydantic import AnyHttpUrl, field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -36,12 +36,47 @@ class Settings(BaseSettings):
     # MySQL URL (uncomment if using MySQL)
     # DATABASE_URL: str = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_SERVER}:{MYSQL_PORT}/{MYSQL_DB}"
     
+    # Debug mode: per-request SQL statement count in the X-Query-Count header
+    DEBUG: bool = False
+    # Raise on relationship lazy loads instead of running N+1 queries
+    STRICT_LAZY_LOADS: bool = False
+
     # CORS settings
     BACKEND_CORS_ORIGINS: str = "http://localhost:3000"
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Response compression and hot-response cache settings
+    COMPRESSION_MINIMUM_SIZE: int = 500  # bytes
+    RESPONSE_CACHE_TTL: int = 30  # seconds, server-side only; clients get no-cache + ETag
+    RESPONSE_CACHE_SIZE: int = 256  # number of cached responses
+
+    # Cached review listing totals, cleared by review/gadget/user writes
+    REVIEW_COUNT_CACHE_TTL: int = 300  # seconds, bounds staleness from other processes
+    REVIEW_COUNT_CACHE_SIZE: int = 1024  # number of cached filter sets
+
+    # Batch gadget fetch and its per-gadget cache
+    GADGET_BATCH_MAX_IDS: int = 100
+    GADGET_CACHE_TTL: int = 300  # seconds
+    GADGET_CACHE_SIZE: int = 4096  # number of cached gadgets
+
+    # Cached home page sections, cleared by writes to the tables they read
+    HOME_SECTION_CACHE_TTL: int = 60  # seconds
+
+    # Sub-requests per POST /batch
+    BATCH_MAX_REQUESTS: int = 20
+
+    # Prebuilt sample database snapshots (see app.db.snapshot)
+    SNAPSHOT_DIR: str = "./.snapshots"
+
+    # Rows per transaction in bulk imports
+    IMPORT_BATCH_SIZE: int = 1000
+
+    # Bulk user provisioning
+    USER_BULK_CREATE_MAX_USERS: int = 100  # users per POST /admin/users/bulk
+    USER_PROVISION_MAX_USERS: int = 10000  # users per transaction in provision_users.py
+    PASSWORD_HASH_WORKERS: Optional[int] = None  # hashing processes; CPU count when unset
+    PASSWORD_HASH_ROUNDS: int = 12  # bcrypt cost; existing hashes keep verifying when changed
+
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 
 settings = Settings()
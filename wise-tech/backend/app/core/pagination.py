@@ -0,0 +1,135 @@
+"""
+Keyset (cursor) pagination module for the WiseTech API application.
+
+A cursor is an opaque URL-safe token holding the sort-key values of the last
+row of a page. The next page seeks past those values through an index instead
+of skipping rows with OFFSET, so every page costs the same as the first.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+import orjson
+from sqlalchemy import DateTime, Row, Select, and_, literal, or_, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+# Response header carrying the next cursor for endpoints that return plain lists
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# (column, descending); the last key must be unique (normally the primary key)
+SortKey = Tuple[ColumnElement, bool]
+
+
+def order_by(keys: Sequence[SortKey]) -> List[ColumnElement]:
+    """
+    ORDER BY clauses for a sort-key tuple.
+    """
+    return [column.desc() if descending else column.asc() for column, descending in keys]
+
+
+def cursor_columns(keys: Sequence[SortKey]) -> List[ColumnElement]:
+    """
+    Labeled sort-key columns to add to a select so each row carries its cursor values.
+    """
+    return [column.label(f"cursor_{i}") for i, (column, _) in enumerate(keys)]
+
+
+def row_cursor(name: str, keys: Sequence[SortKey], row: Any) -> str:
+    """
+    Encode the cursor pointing just past a row selected with cursor_columns().
+    """
+    values = [getattr(row, f"cursor_{i}") for i in range(len(keys))]
+    payload = orjson.dumps({
+        "s": name,
+        "k": [v.isoformat() if isinstance(v, datetime) else v for v in values],
+    })
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, name: str, keys: Sequence[SortKey]) -> List[Any]:
+    """
+    Decode a cursor into sort-key values.
+
+    Raises ValueError if the cursor is malformed or was issued for another sort order.
+    """
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        values = payload["k"]
+        if payload["s"] != name or len(values) != len(keys):
+            raise ValueError("Cursor does not match the sort order")
+        return [
+            datetime.fromisoformat(value)
+            if isinstance(column.type, DateTime) and value is not None
+            else value
+            for (column, _), value in zip(keys, values)
+        ]
+    except (binascii.Error, orjson.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def after_cursor(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    WHERE condition selecting the rows that sort after the given key values.
+
+    Consecutive keys with the same direction are compared as one row value,
+    e.g. ``(created_at, id) < (:c, :i)``, which databases can seek to in a
+    matching composite index. Mixed directions are expanded to
+    ``a > :a OR (a = :a AND (b, c) < (:b, :c))`` with a leading bound on ``a``.
+    """
+    groups: List[Tuple[List[ColumnElement], List[Any], bool]] = []
+    for (column, descending), value in zip(keys, values):
+        bound = literal(value, column.type)
+        if groups and groups[-1][2] == descending:
+            groups[-1][0].append(column)
+            groups[-1][1].append(bound)
+        else:
+            groups.append(([column], [bound], descending))
+
+    def beyond(columns, bounds, descending):
+        left = columns[0] if len(columns) == 1 else tuple_(*columns)
+        right = bounds[0] if len(bounds) == 1 else tuple_(*bounds)
+        return left < right if descending else left > right
+
+    condition = beyond(*groups[-1])
+    for columns, bounds, descending in reversed(groups[:-1]):
+        equal = and_(*(column == bound for column, bound in zip(columns, bounds)))
+        condition = or_(beyond(columns, bounds, descending), and_(equal, condition))
+
+    if len(groups) > 1:
+        column, bound, descending = groups[0][0][0], groups[0][1][0], groups[0][2]
+        condition = and_(column <= bound if descending else column >= bound, condition)
+    return condition
+
+
+def keyset_page(
+    db: Session,
+    stmt: Select,
+    name: str,
+    keys: Sequence[SortKey],
+    *,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    Fetch one page of a select in sort-key order, after ``cursor`` if given
+    (else at ``offset``), and the cursor of the following page if there is one.
+
+    Rows carry the labeled cursor columns after the selected ones. Raises
+    ValueError for an invalid cursor.
+    """
+    stmt = stmt.order_by(*order_by(keys)).add_columns(*cursor_columns(keys))
+    if cursor is not None:
+        stmt = stmt.where(after_cursor(keys, decode_cursor(cursor, name, keys)))
+    elif offset:
+        stmt = stmt.offset(offset)
+
+    # One extra row tells whether a next page exists
+    rows = db.execute(stmt.limit(limit + 1)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, row_cursor(name, keys, rows[-1])
+    return rows, None
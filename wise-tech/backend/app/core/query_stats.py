@@ -0,0 +1,127 @@
+"""
+SQL statement counting and N+1 detection for the WiseTech API application.
+
+Every statement run on any engine is counted by the active QueryCounter, which
+QueryCountMiddleware opens per request; in debug mode the total is sent back
+in the X-Query-Count header. In strict mode, relationship lazy loads that
+would emit SQL raise LazyLoadError instead, so N+1 patterns fail loudly
+wherever they are hit.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+_current_counter: ContextVar[Optional["QueryCounter"]] = ContextVar("query_counter", default=None)
+_strict_lazy_loads: ContextVar[bool] = ContextVar("strict_lazy_loads", default=False)
+
+
+class LazyLoadError(Exception):
+    """A relationship was lazy loaded while strict mode was on."""
+
+
+class QueryCounter:
+    """
+    Number of statements executed while a counter is active, also added to
+    the counter it was opened inside of. Safe to share with threadpool workers.
+    """
+
+    def __init__(self, parent: Optional["QueryCounter"] = None):
+        self.parent = parent
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def add(self) -> None:
+        counter = self
+        while counter is not None:
+            with counter._lock:
+                counter.count += 1
+            counter = counter.parent
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """
+    Count the statements run in this context, including threadpool work
+    started from it.
+    """
+    counter = QueryCounter(_current_counter.get())
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+@contextmanager
+def strict_lazy_loads(enabled: bool = True) -> Iterator[None]:
+    """
+    Raise LazyLoadError on lazy loads in this context, regardless of the
+    STRICT_LAZY_LOADS setting.
+    """
+    token = _strict_lazy_loads.set(enabled)
+    try:
+        yield
+    finally:
+        _strict_lazy_loads.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    counter = _current_counter.get()
+    if counter is not None:
+        counter.add()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _check_lazy_load(state: ORMExecuteState) -> None:
+    if not (settings.STRICT_LAZY_LOADS or _strict_lazy_loads.get()):
+        return
+    # Only lazy loads have an originating object; eager loads (selectinload)
+    # and explicit queries are left alone
+    if not (state.is_select and state.is_relationship_load) or state.lazy_loaded_from is None:
+        return
+    raise LazyLoadError(
+        f"Lazy load of {state.loader_strategy_path[-1]} "
+        f"(path {state.loader_strategy_path}); load it up front with a loader option or a join"
+    )
+
+
+class QueryCountMiddleware:
+    """
+    Counts the SQL statements each request runs; in debug mode the count is
+    sent in the X-Query-Count response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as counter:
+            async def send_with_count(message: Message) -> None:
+                # Streaming responses report the statements run before their first chunk
+                if message["type"] == "http.response.start" and settings.DEBUG:
+                    MutableHeaders(scope=message).append(QUERY_COUNT_HEADER, str(counter.count))
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
+        if settings.DEBUG:
+            logger.debug("%s %s: %d SQL statements", scope["method"], scope["path"], counter.count)
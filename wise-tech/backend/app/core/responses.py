@@ -0,0 +1,192 @@
+"""
+Response helpers for the WiseTech API application.
+Uses orjson for fast JSON encoding of API responses, and MessagePack for
+clients that ask for it with ``Accept: application/msgpack``.
+
+MessagePack is available when the optional ``msgpack`` package is installed;
+otherwise every response is JSON.
+"""
+
+import csv
+import enum
+import io
+from contextvars import ContextVar
+from datetime import date, datetime
+from typing import Any, Callable, Coroutine, Dict, Iterable, Iterator, List, Sequence
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy import Row
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.compression import SERVER_CACHE_HEADER
+from app.core.config import settings
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+# Set per request by NegotiatedRoute so trusted responses use the negotiated format
+_use_msgpack: ContextVar[bool] = ContextVar("use_msgpack", default=False)
+
+
+def server_cache_headers() -> Dict[str, str]:
+    """
+    Headers marking a response that is the same for every user for the
+    hot-response cache; CompressionMiddleware strips them.
+    """
+    return {SERVER_CACHE_HEADER: str(settings.RESPONSE_CACHE_TTL)}
+
+
+def msgpack_available() -> bool:
+    """
+    Whether the optional msgpack package is installed.
+    """
+    return msgpack is not None
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """
+    Whether an Accept header asks for MessagePack (and msgpack is installed).
+    """
+    if not msgpack_available():
+        return False
+    for part in accept.lower().split(","):
+        media_type, _, params = part.strip().partition(";")
+        if media_type.strip() in MSGPACK_MEDIA_TYPES:
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def wants_msgpack() -> bool:
+    """
+    Whether the current request, under a NegotiatedRoute, asked for MessagePack.
+    """
+    return _use_msgpack.get()
+
+
+def _msgpack_default(value: Any) -> Any:
+    # Same representations orjson produces, so both formats carry the same data
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack")
+
+
+def msgpack_dumps(content: Any) -> bytes:
+    """
+    Encode content as MessagePack.
+    """
+    return msgpack.packb(content, default=_msgpack_default, use_bin_type=True)
+
+
+class MsgPackResponse(Response):
+    """
+    Response encoded as MessagePack.
+    """
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack_dumps(content)
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    Route that answers in MessagePack when the client sends
+    ``Accept: application/msgpack`` and in JSON otherwise.
+
+    response_model endpoints are validated and serialized exactly as for
+    JSON, only the final encoding differs. Endpoints returning trusted_json()
+    pick the format up from the request context.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        json_handler = super().get_route_handler()
+        if not msgpack_available():
+            return json_handler
+
+        response_class = self.response_class
+        self.response_class = MsgPackResponse
+        try:
+            msgpack_handler = super().get_route_handler()
+        finally:
+            self.response_class = response_class
+
+        async def negotiated_handler(request: Request) -> Response:
+            use_msgpack = accepts_msgpack(request.headers.get("accept", ""))
+            token = _use_msgpack.set(use_msgpack)
+            try:
+                response = await (msgpack_handler if use_msgpack else json_handler)(request)
+            finally:
+                _use_msgpack.reset(token)
+            MutableHeaders(raw=response.raw_headers).add_vary_header("Accept")
+            return response
+
+        return negotiated_handler
+
+
+def trusted_json(
+    content: Any, status_code: int = 200, *, cacheable: bool = False
+) -> Response:
+    """
+    Encode data that was built from database rows and already has the shape of
+    the endpoint's response_model.
+
+    Returning a Response directly skips FastAPI's response_model validation,
+    so the data is encoded once by orjson without a second Pydantic pass.
+    ``cacheable`` marks public data for the hot-response cache. Under a
+    NegotiatedRoute the data is encoded as MessagePack when the client asked
+    for it.
+    """
+    headers = server_cache_headers() if cacheable else None
+    if wants_msgpack():
+        return MsgPackResponse(content=content, status_code=status_code, headers=headers)
+    return ORJSONResponse(content=content, status_code=status_code, headers=headers)
+
+
+def ndjson_lines(batches: Iterable[Sequence[Row]]) -> Iterator[bytes]:
+    """
+    Encode batches of result rows as newline-delimited JSON, one chunk per batch.
+    """
+    for batch in batches:
+        yield b"".join(orjson.dumps(dict(row._mapping)) + b"\n" for row in batch)
+
+
+def msgpack_records(batches: Iterable[Sequence[Row]]) -> Iterator[bytes]:
+    """
+    Encode batches of result rows as a stream of MessagePack maps, one chunk per batch.
+    """
+    packer = msgpack.Packer(default=_msgpack_default, use_bin_type=True)
+    for batch in batches:
+        yield b"".join(packer.pack(dict(row._mapping)) for row in batch)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def csv_lines(columns: List[str], batches: Iterable[Sequence[Row]]) -> Iterator[str]:
+    """
+    Encode batches of result rows as CSV with a header row, one chunk per batch.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(v) for v in row] for row in batch)
+        yield buffer.getvalue()
@@ -2,8 +2,12 @@
 Security module for authentication.
 """
 
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, List, Optional, Sequence, Union
 
 from jose import jwt
 from passlib.context import CryptContext
@@ -11,11 +15,20 @@ from passlib.context import CryptContext
 from app.core.config import settings
 
 # Hashing password menggunakan algorithm bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_HASH_ROUNDS
+)
 
 # JWT algorithm
 ALGORITHM = "HS256"
 
+# Long-lived password hashing pool, started on first use. Workers come from a
+# forkserver: forking the multi-threaded server process directly can copy
+# locks held by other threads and deadlock the child.
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_workers = 0
+_hash_pool_lock = threading.Lock()
+
 
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
@@ -47,3 +60,45 @@ def get_password_hash(password: str) -> str:
     Hash a password.
     """
     return pwd_context.hash(password)
+
+
+def get_password_hashes(
+    passwords: Sequence[str], *, workers: Optional[int] = None
+) -> List[str]:
+    """
+    Hash many passwords, in parallel across the shared process pool.
+
+    bcrypt is deliberately CPU-bound, so each hash runs in a worker process;
+    small batches are hashed inline.
+    """
+    workers = workers or settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+    if min(workers, len(passwords)) <= 1 or len(passwords) < 4:
+        return [get_password_hash(password) for password in passwords]
+    executor = _get_hash_pool(workers)
+    return list(executor.map(
+        get_password_hash, passwords, chunksize=max(1, len(passwords) // (workers * 4))
+    ))
+
+
+def _get_hash_pool(workers: int) -> ProcessPoolExecutor:
+    global _hash_pool, _hash_pool_workers
+    with _hash_pool_lock:
+        if _hash_pool is None or _hash_pool_workers != workers:
+            if _hash_pool is not None:
+                _hash_pool.shutdown(wait=False)
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("forkserver")
+            )
+            _hash_pool_workers = workers
+        return _hash_pool
+
+
+def shutdown_password_hash_pool() -> None:
+    """
+    Stop the password hashing workers, if they were started.
+    """
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown()
+            _hash_pool = None
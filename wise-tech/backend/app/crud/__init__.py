@@ -1,5 +1,5 @@
 # CRUD package initialization
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, is_foreign_key_violation
 from app.crud.user import user
 from app.crud.gadget import gadget
 from app.crud.review import review
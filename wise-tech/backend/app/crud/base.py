@@ -2,11 +2,13 @@
 CRUD operations base class.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import insert, inspect, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.db.base_class import Base
 
@@ -15,6 +17,14 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def is_foreign_key_violation(exc: IntegrityError) -> bool:
+    """
+    Check whether an IntegrityError was caused by a missing foreign key target.
+    """
+    message = str(exc.orig).lower()
+    return "foreign key" in message
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
     CRUD base class with default methods for Create, Read, Update, Delete operations.
@@ -28,31 +38,27 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             model: The SQLAlchemy model class
         """
         self.model = model
+        self.column_keys = frozenset(attr.key for attr in inspect(model).column_attrs)
 
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
+    def get(self, db: Session, id: Any, *, options: Sequence[Any] = ()) -> Optional[ModelType]:
         """
-        Get a record by ID.
+        Get a record by ID, with optional loader options.
         """
-        return db.query(self.model).filter(self.model.id == id).first()
+        return db.query(self.model).options(*options).filter(self.model.id == id).first()
 
     def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self, db: Session, *, skip: int = 0, limit: int = 100, options: Sequence[Any] = ()
     ) -> List[ModelType]:
         """
-        Get multiple records.
+        Get multiple records, with optional loader options.
         """
-        return db.query(self.model).offset(skip).limit(limit).all()
+        return db.query(self.model).options(*options).offset(skip).limit(limit).all()
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """
         Create a new record.
         """
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self._insert_returning(db, obj_in.model_dump())
 
     def update(
         self,
@@ -63,18 +69,89 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     ) -> ModelType:
         """
         Update a record.
+
+        Only mapped columns whose value actually changes are written; when
+        nothing changes no statement is issued at all.
         """
-        obj_data = jsonable_encoder(db_obj)
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+            update_data = obj_in.model_dump(exclude_unset=True)
+        values = {
+            field: value
+            for field, value in update_data.items()
+            if field in self.column_keys and getattr(db_obj, field) != value
+        }
+        if not values:
+            return db_obj
+        return self._update_returning(db, db_obj=db_obj, values=values)
+
+    def _insert_row(self, db: Session, values: Dict[str, Any]) -> ModelType:
+        """
+        Insert a row without committing, getting it back via INSERT ... RETURNING.
+
+        Falls back to add/flush on dialects without RETURNING support (MySQL).
+        """
+        if db.get_bind().dialect.insert_returning:
+            stmt = insert(self.model).values(**values).returning(self.model)
+            return db.scalars(stmt).one()
+        db_obj = self.model(**values)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        db.flush()
+        return db_obj
+
+    def _insert_returning(self, db: Session, values: Dict[str, Any]) -> ModelType:
+        """
+        Insert and commit a row in a single INSERT ... RETURNING statement.
+
+        Raises IntegrityError (after rolling back) on constraint violations.
+        """
+        try:
+            db_obj = self._insert_row(db, values)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise
+        return db_obj
+
+    def _update_returning(
+        self, db: Session, *, db_obj: ModelType, values: Dict[str, Any]
+    ) -> ModelType:
+        """
+        Update a row and get it back in one UPDATE ... RETURNING statement.
+
+        Falls back to setattr/flush on dialects without RETURNING support (MySQL).
+        Relationships already loaded on db_obj stay loaded unless one of their
+        foreign key columns changes.
+        Raises IntegrityError (after rolling back) on constraint violations.
+        """
+        try:
+            if db.get_bind().dialect.update_returning:
+                # populate_existing resets relationships to lazy loading
+                loaded = {
+                    rel.key: db_obj.__dict__[rel.key]
+                    for rel in inspect(self.model).relationships
+                    if rel.key in db_obj.__dict__
+                    and not any(column.key in values for column in rel.local_columns)
+                }
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == db_obj.id)
+                    .values(**values)
+                    .returning(self.model)
+                    .execution_options(populate_existing=True)
+                )
+                db_obj = db.scalars(stmt).one()
+                for key, value in loaded.items():
+                    set_committed_value(db_obj, key, value)
+            else:
+                for field, value in values.items():
+                    setattr(db_obj, field, value)
+                db.add(db_obj)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise
         return db_obj
 
     def remove(self, db: Session, *, id: int) -> ModelType:
@@ -2,15 +2,67 @@
 CRUD operations for gadget model.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, delete, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.cache import TTLCache, clear_on_commit, mark_stale
+from app.core.config import settings
+from app.core.pagination import SortKey
 from app.crud.base import CRUDBase
-from app.models.gadget import Gadget, GadgetSpec
+from app.models.gadget import Brand, Category, Gadget, GadgetSpec
 from app.models.review import Review
-from app.schemas.gadget import GadgetCreate, GadgetUpdate
+from app.schemas.gadget import Gadget as GadgetSchema, GadgetCreate, GadgetImportRow, GadgetUpdate
+
+# Fields of the gadget list response, usable in sparse fieldsets
+GADGET_FIELDS = tuple(GadgetSchema.model_fields)
+
+# Full gadget response items by id for batch fetches. Cleared per gadget when a
+# committed transaction touched the gadget, its specs or its reviews.
+gadget_cache = TTLCache(maxsize=settings.GADGET_CACHE_SIZE, ttl=settings.GADGET_CACHE_TTL)
+GADGET_CACHE_SOURCE_TABLES = frozenset({"gadgets", "gadget_specs", "reviews"})
+# Execution option for statement-level writes whose caller reports the gadgets
+# it touched with mark_gadgets_stale(), so the rest of the cache survives
+GADGET_IDS_REPORTED = "gadget_ids_reported"
+# session.info flag holding the gadget ids to evict at commit
+STALE_GADGETS = "stale_gadget_ids"
+
+# Sort orders for the admin gadget listing, each ending in the unique id
+GADGET_SORTS: Dict[str, Tuple[SortKey, ...]] = {
+    "id": ((Gadget.id, False),),
+    "newest": ((Gadget.created_at, True), (Gadget.id, True)),
+    "name": ((Gadget.name, False), (Gadget.id, False)),
+    "price_low": ((Gadget.price, False), (Gadget.id, False)),
+    "price_high": ((Gadget.price, True), (Gadget.id, True)),
+}
+
+
+# Names that share a category's lookup key besides the name itself, e.g. the
+# singular filter values the review browser sends
+CATEGORY_ALIASES: Dict[str, str] = {
+    "smartphones": "smartphone",
+    "laptops": "laptop",
+    "tablets": "tablet",
+}
+
+
+def category_key(value: str) -> str:
+    """
+    Normalize a category name to its lookup key ("Smartphones" -> "smartphone").
+    """
+    key = value.strip().lower()
+    return CATEGORY_ALIASES.get(key, key)
+
+
+def brand_key(value: str) -> str:
+    """
+    Normalize a brand name to its lookup key ("Samsung" -> "samsung").
+    """
+    return value.strip().lower()
 
 
 class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
@@ -34,20 +86,372 @@ class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
             release_date = obj_in.release_date
         
         # Create gadget manually to avoid pydantic datetime encoding issues
-        gadget = Gadget(
-            name=obj_in.name,
-            brand=obj_in.brand,
-            category=obj_in.category,
-            description=obj_in.description,
-            price=obj_in.price,
-            release_date=release_date,  # Use the properly converted datetime
-            image_url=obj_in.image_url
-        )
-        db.add(gadget)
-        db.commit()
-        db.refresh(gadget)
+        gadget_data = self._resolve_taxonomy(db, {
+            "name": obj_in.name,
+            "brand": obj_in.brand,
+            "category": obj_in.category,
+            "description": obj_in.description,
+            "price": obj_in.price,
+            "release_date": release_date,  # Use the properly converted datetime
+            "image_url": obj_in.image_url,
+        })
+        gadget = self._insert_returning(db, gadget_data)
+        # A new gadget has no specs or reviews; no need to query for them
+        set_committed_value(gadget, "specs", [])
+        set_committed_value(gadget, "reviews", [])
         return gadget
 
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Gadget,
+        obj_in: Union[GadgetUpdate, Dict[str, Any]]
+    ) -> Gadget:
+        """
+        Update a gadget, keeping brand/category lookup references in sync.
+        """
+        if isinstance(obj_in, dict):
+            update_data = dict(obj_in)
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = self._resolve_taxonomy(db, update_data)
+        return super().update(db, db_obj=db_obj, obj_in=update_data)
+
+    def _get_or_create_lookup(
+        self, db: Session, model: Union[type[Brand], type[Category]], key: str, name: str
+    ) -> Union[Brand, Category]:
+        """
+        Get a brand/category lookup row by key, creating it on first use.
+        """
+        obj = db.query(model).filter(model.key == key).first()
+        if not obj:
+            obj = model(key=key, name=name.strip())
+            db.add(obj)
+            db.flush()
+        return obj
+
+    def _resolve_taxonomy(self, db: Session, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill in brand_id/category_id and the canonical display names from the lookup tables.
+        """
+        if data.get("category"):
+            category = self._get_or_create_lookup(
+                db, Category, category_key(data["category"]), data["category"]
+            )
+            data["category"] = category.name
+            data["category_id"] = category.id
+        if data.get("brand"):
+            brand = self._get_or_create_lookup(
+                db, Brand, brand_key(data["brand"]), data["brand"]
+            )
+            data["brand"] = brand.name
+            data["brand_id"] = brand.id
+        return data
+
+    def lookup_rows(
+        self, db: Session, model: Union[type[Brand], type[Category]], names: Dict[str, str]
+    ) -> Dict[str, Tuple[int, str]]:
+        """
+        Map lookup keys to (id, canonical name), creating missing rows in one executemany.
+        """
+        stmt = select(model.key, model.id, model.name).where(model.key.in_(names))
+        rows = {key: (id_, name) for key, id_, name in db.execute(stmt)}
+        missing = [{"key": key, "name": name.strip()} for key, name in names.items() if key not in rows]
+        if missing:
+            db.execute(insert(model), missing)
+            rows.update({key: (id_, name) for key, id_, name in db.execute(stmt)})
+        return rows
+
+    def bulk_upsert(self, db: Session, *, rows: Sequence[GadgetImportRow]) -> Tuple[int, int]:
+        """
+        Insert or update a chunk of gadgets, keyed on (brand, name), in one transaction.
+
+        Gadgets, their lookups and their specs are written with executemany
+        statements; a row with specs replaces the gadget's existing specs.
+        Returns (created, updated) gadgets. Raises IntegrityError after rolling
+        back, e.g. when a concurrent import inserted one of the gadgets first.
+        """
+        categories = {category_key(row.category): row.category for row in rows}
+        brands = {brand_key(row.brand): row.brand for row in rows}
+        try:
+            category_rows = self.lookup_rows(db, Category, categories)
+            brand_rows = self.lookup_rows(db, Brand, brands)
+
+            # Later rows for the same gadget win, as if applied one by one
+            values: Dict[Tuple[int, str], Dict[str, Any]] = {}
+            specs: Dict[Tuple[int, str], Dict[str, str]] = {}
+            for row in rows:
+                data = row.model_dump(exclude={"specs"})
+                data["category_id"], data["category"] = category_rows[category_key(row.category)]
+                data["brand_id"], data["brand"] = brand_rows[brand_key(row.brand)]
+                key = (data["brand_id"], data["name"])
+                values[key] = data
+                if row.specs:
+                    specs[key] = row.specs
+
+            def existing_ids() -> Dict[Tuple[int, str], int]:
+                stmt = select(Gadget.brand_id, Gadget.name, Gadget.id).where(
+                    Gadget.brand_id.in_({brand_id for brand_id, _ in values}),
+                    Gadget.name.in_({name for _, name in values}),
+                )
+                return {
+                    (brand_id, name): id_
+                    for brand_id, name, id_ in db.execute(stmt)
+                    if (brand_id, name) in values
+                }
+
+            ids = existing_ids()
+            new_rows = [data for key, data in values.items() if key not in ids]
+            # Counted per gadget, so repeats within the chunk count once
+            created, updated = len(new_rows), len(ids)
+            if ids:
+                db.execute(update(Gadget), [{**values[key], "id": id_} for key, id_ in ids.items()])
+            if new_rows and db.get_bind().dialect.insert_executemany_returning:
+                stmt = insert(Gadget).returning(Gadget.brand_id, Gadget.name, Gadget.id)
+                ids.update({(brand_id, name): id_ for brand_id, name, id_ in db.execute(stmt, new_rows)})
+            elif new_rows:
+                db.execute(insert(Gadget), new_rows)
+                ids = existing_ids()
+
+            if specs:
+                gadget_ids = [ids[key] for key in specs]
+                db.execute(delete(GadgetSpec).where(GadgetSpec.gadget_id.in_(gadget_ids)))
+                db.execute(insert(GadgetSpec), [
+                    {"gadget_id": ids[key], "spec_name": name, "spec_value": value}
+                    for key, gadget_specs in specs.items()
+                    for name, value in gadget_specs.items()
+                ])
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise
+        return created, updated
+
+    def category_filter(self, category: str):
+        """
+        Indexed equality filter on category_id for a category name or alias in any case.
+        """
+        category_id = (
+            select(Category.id)
+            .where(Category.key == category_key(category))
+            .scalar_subquery()
+        )
+        return Gadget.category_id == category_id
+
+    def brand_filter(self, brands: List[str]):
+        """
+        Indexed equality filter on brand_id for a list of brand names in any case.
+        """
+        brand_ids = select(Brand.id).where(Brand.key.in_([brand_key(b) for b in brands]))
+        return Gadget.brand_id.in_(brand_ids)
+
+    def get_categories_with_counts(self, db: Session) -> List[dict]:
+        """
+        Get all categories from the lookup table with their gadget counts.
+        """
+        rows = (
+            db.query(Category, func.count(Gadget.id).label("gadget_count"))
+            .outerjoin(Gadget, Gadget.category_id == Category.id)
+            .group_by(Category.id)
+            .order_by(Category.name)
+            .all()
+        )
+        return [
+            {"id": c.id, "key": c.key, "name": c.name, "gadget_count": count}
+            for c, count in rows
+        ]
+
+    def get_review_stats(
+        self,
+        db: Session,
+        *,
+        ids: Optional[Sequence[int]] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Review count, average rating and last review time per gadget, for the
+        given gadget ids or every gadget in a category, from one GROUP BY.
+
+        Gadgets without reviews are included with a count of 0.
+        """
+        stmt = (
+            select(
+                Gadget.id,
+                func.count(Review.id),
+                func.coalesce(func.avg(Review.rating), 0),
+                func.max(Review.created_at),
+            )
+            .outerjoin(Review, Review.gadget_id == Gadget.id)
+            .group_by(Gadget.id)
+            .order_by(Gadget.id)
+        )
+        if ids is not None:
+            stmt = stmt.where(Gadget.id.in_(set(ids)))
+        if category:
+            stmt = stmt.where(self.category_filter(category))
+        return [
+            {
+                "gadget_id": gadget_id,
+                "review_count": review_count,
+                "average_rating": float(average_rating),
+                "last_review_at": last_review_at,
+            }
+            for gadget_id, review_count, average_rating, last_review_at in db.execute(stmt)
+        ]
+
+    def export_select(self) -> Select:
+        """
+        Column-projection select for exporting gadgets.
+        """
+        return select(
+            Gadget.id,
+            Gadget.name,
+            Gadget.brand,
+            Gadget.category,
+            Gadget.description,
+            Gadget.price,
+            Gadget.release_date,
+            Gadget.image_url,
+            Gadget.created_at,
+            Gadget.updated_at,
+        ).order_by(Gadget.id)
+
+    def load_options(
+        self, fields: Optional[Sequence[str]] = None, *, required: Sequence[str] = ()
+    ) -> List[Any]:
+        """
+        Loader options that read only the columns and relationships behind the
+        requested gadget fields (all list fields when fields is None).
+
+        Specs are batch-loaded with one extra SELECT; average_rating loads only
+        the review ratings.
+        """
+        wanted = set(GADGET_FIELDS if fields is None else fields) | set(required)
+        columns = [getattr(Gadget, name) for name in wanted if name in self.column_keys]
+        options = [load_only(*columns)]
+        if "specs" in wanted:
+            options.append(selectinload(Gadget.specs))
+        if "average_rating" in wanted:
+            options.append(selectinload(Gadget.reviews).load_only(Review.rating))
+        return options
+
+    @staticmethod
+    def response_options() -> List[Any]:
+        """
+        Loader options for returning (or deleting) a full ORM gadget: specs
+        and reviews are batch-loaded instead of lazy loaded.
+        """
+        # Whole reviews: deleting them reads their foreign keys
+        return [selectinload(Gadget.specs), selectinload(Gadget.reviews)]
+
+    @staticmethod
+    def detail_options() -> List[Any]:
+        """
+        Loader options for the gadget detail page: specs, and reviews with
+        their authors.
+        """
+        return [selectinload(Gadget.specs), selectinload(Gadget.reviews).joinedload(Review.user)]
+
+    @staticmethod
+    def fields_dict(gadget: Gadget, fields: Sequence[str]) -> Dict[str, Any]:
+        """
+        Build a trimmed gadget response item with only the requested fields.
+        """
+        item = {}
+        for name in fields:
+            if name == "specs":
+                item[name] = [
+                    {
+                        "id": spec.id,
+                        "gadget_id": spec.gadget_id,
+                        "spec_name": spec.spec_name,
+                        "spec_value": spec.spec_value,
+                    }
+                    for spec in gadget.specs
+                ]
+            else:
+                # review_count is not a model attribute; the schema defaults it to 0
+                item[name] = getattr(gadget, name, 0)
+        return item
+
+    def get_batch(self, db: Session, *, ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Full response items for many gadgets by id, missing ids left out.
+
+        Cached items are used as is; the rest are loaded with one IN query
+        (specs and ratings batch-loaded) and cached.
+        """
+        found: Dict[int, Dict[str, Any]] = {}
+        misses = []
+        for gadget_id in dict.fromkeys(ids):
+            item = gadget_cache.get(gadget_id)
+            if item is None:
+                misses.append(gadget_id)
+            else:
+                found[gadget_id] = item
+
+        if misses:
+            gadgets = db.scalars(
+                select(Gadget).where(Gadget.id.in_(misses)).options(*self.load_options())
+            ).all()
+            for gadget in gadgets:
+                item = self.fields_dict(gadget, GADGET_FIELDS)
+                gadget_cache.set(gadget.id, item)
+                found[gadget.id] = item
+        return found
+
+    @staticmethod
+    def sort_keys(sort: str) -> Tuple[SortKey, ...]:
+        """
+        Sort-key tuple for an admin gadget listing sort order, by id by default.
+        """
+        return GADGET_SORTS.get(sort, GADGET_SORTS["id"])
+
+    def admin_select(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        *,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        brand: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> Select:
+        """
+        Select gadgets for the admin listing with server-side filters.
+        """
+        stmt = select(Gadget).options(*self.load_options(fields))
+        if search:
+            search_term = f"%{search}%"
+            stmt = stmt.where(or_(
+                Gadget.name.ilike(search_term),
+                Gadget.brand.ilike(search_term),
+                Gadget.description.ilike(search_term),
+            ))
+        if category:
+            stmt = stmt.where(self.category_filter(category))
+        if brand:
+            stmt = stmt.where(self.brand_filter([brand]))
+        if created_from is not None:
+            stmt = stmt.where(Gadget.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(Gadget.created_at < created_to)
+        return stmt
+
+    def get_multi(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Gadget]:
+        """
+        Get multiple gadgets, loading only what the requested fields need.
+        """
+        return super().get_multi(db, skip=skip, limit=limit, options=self.load_options(fields))
+
     def get_gadgets_by_category(
         self, db: Session, *, category: str, skip: int = 0, limit: int = 100
     ) -> List[Gadget]:
@@ -56,14 +460,14 @@ class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
         """
         return (
             db.query(Gadget)
-            .filter(Gadget.category.ilike(category))
+            .filter(self.category_filter(category))
             .offset(skip)
             .limit(limit)
             .all()
         )
 
     def get_featured_gadgets(
-        self, db: Session, *, limit: int = 4
+        self, db: Session, *, limit: int = 4, fields: Optional[Sequence[str]] = None
     ) -> List[Gadget]:
         """
         Get featured gadgets based on average rating.
@@ -82,14 +486,67 @@ class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
         # Join with gadgets and order by rating
         return (
             db.query(Gadget)
+            .options(*self.load_options(fields))
             .outerjoin(avg_ratings, Gadget.id == avg_ratings.c.gadget_id)
             .order_by(avg_ratings.c.avg_rating.desc(), avg_ratings.c.review_count.desc())
             .limit(limit)
             .all()
         )
         
+    @staticmethod
+    def score_gadgets(gadgets: Iterable[Gadget], query_lower: str) -> List[Tuple[int, Gadget]]:
+        """
+        Search relevance scores for gadgets matching a lowercased query,
+        leaving out weak matches for short queries.
+        """
+        scored_gadgets = []
+        for gadget in gadgets:
+            score = 0
+            name_lower = gadget.name.lower()
+            brand_lower = gadget.brand.lower()
+            desc_lower = gadget.description.lower() if gadget.description else ""
+            
+            # Exact match (highest priority)
+            if name_lower == query_lower or brand_lower == query_lower:
+                score += 100
+            
+            # Starts with query
+            elif name_lower.startswith(query_lower) or brand_lower.startswith(query_lower):
+                score += 80
+            
+            # Word starts with query (e.g., "Samsung Galaxy" matches "gal")
+            elif (f" {query_lower}" in f" {name_lower}") or (f" {query_lower}" in f" {brand_lower}"):
+                score += 60
+            
+            # Contains query in name or brand (but not for very short queries)
+            elif len(query_lower) > 2 and (query_lower in name_lower or query_lower in brand_lower):
+                score += 40
+            
+            # Contains query in description (only for longer queries and lowest priority)
+            elif len(query_lower) > 3 and query_lower in desc_lower:
+                score += 10
+            
+            # Skip results with very low relevance for short queries
+            if len(query_lower) <= 2 and score < 40:
+                continue
+                
+            # Add small bonus for shorter names (more specific)
+            if len(name_lower) < 20:
+                score += 5
+            
+            scored_gadgets.append((score, gadget))
+
+        return scored_gadgets
+
     def search_gadgets(
-        self, db: Session, *, query: str, category: Optional[str] = None, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        query: str,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Gadget]:
         """
         Search gadgets by name, brand, or category with improved relevance.
@@ -128,48 +585,15 @@ class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
         
         # Add category filter if specified
         if category:
-            gadgets_query = gadgets_query.filter(Gadget.category.ilike(category))
+            gadgets_query = gadgets_query.filter(self.category_filter(category))
         
-        # Get all matching gadgets
-        all_gadgets = gadgets_query.all()
+        # Get all matching gadgets (scoring reads name, brand and description)
+        all_gadgets = gadgets_query.options(
+            *self.load_options(fields, required=("name", "brand", "description"))
+        ).all()
         
         # Score and sort by relevance
-        scored_gadgets = []
-        for gadget in all_gadgets:
-            score = 0
-            name_lower = gadget.name.lower()
-            brand_lower = gadget.brand.lower()
-            desc_lower = gadget.description.lower() if gadget.description else ""
-            
-            # Exact match (highest priority)
-            if name_lower == query_lower or brand_lower == query_lower:
-                score += 100
-            
-            # Starts with query
-            elif name_lower.startswith(query_lower) or brand_lower.startswith(query_lower):
-                score += 80
-            
-            # Word starts with query (e.g., "Samsung Galaxy" matches "gal")
-            elif (f" {query_lower}" in f" {name_lower}") or (f" {query_lower}" in f" {brand_lower}"):
-                score += 60
-            
-            # Contains query in name or brand (but not for very short queries)
-            elif len(query_lower) > 2 and (query_lower in name_lower or query_lower in brand_lower):
-                score += 40
-            
-            # Contains query in description (only for longer queries and lowest priority)
-            elif len(query_lower) > 3 and query_lower in desc_lower:
-                score += 10
-            
-            # Skip results with very low relevance for short queries
-            if len(query_lower) <= 2 and score < 40:
-                continue
-                
-            # Add small bonus for shorter names (more specific)
-            if len(name_lower) < 20:
-                score += 5
-            
-            scored_gadgets.append((score, gadget))
+        scored_gadgets = self.score_gadgets(all_gadgets, query_lower)
         
         # Sort by score (descending) and take pagination
         scored_gadgets.sort(key=lambda x: x[0], reverse=True)
@@ -186,33 +610,37 @@ class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
         Create a gadget with specifications.
         """
         # Create gadget manually to avoid pydantic datetime issues
-        from app.models.gadget import Gadget as GadgetModel
-        
-        gadget = GadgetModel(
-            name=gadget_in.name,
-            brand=gadget_in.brand,
-            category=gadget_in.category,
-            description=gadget_in.description,
-            price=gadget_in.price,
-            release_date=gadget_in.release_date,
-            image_url=gadget_in.image_url
-        )
-        db.add(gadget)
-        db.commit()
-        db.refresh(gadget)
-        
-        # Add specifications
-        for spec in specs:
-            from app.models.gadget import GadgetSpec
-            db_spec = GadgetSpec(
-                gadget_id=gadget.id,
-                spec_name=spec["name"],
-                spec_value=spec["value"]
-            )
-            db.add(db_spec)
-        
-        db.commit()
-        db.refresh(gadget)
+        gadget_data = self._resolve_taxonomy(db, {
+            "name": gadget_in.name,
+            "brand": gadget_in.brand,
+            "category": gadget_in.category,
+            "description": gadget_in.description,
+            "price": gadget_in.price,
+            "release_date": gadget_in.release_date,
+            "image_url": gadget_in.image_url,
+        })
+        try:
+            gadget = self._insert_row(db, gadget_data)
+
+            # Add specifications in one executemany, committed with the gadget
+            spec_rows = [
+                {"gadget_id": gadget.id, "spec_name": spec["name"], "spec_value": spec["value"]}
+                for spec in specs
+            ]
+            if spec_rows and db.get_bind().dialect.insert_executemany_returning:
+                spec_objs = db.scalars(insert(GadgetSpec).returning(GadgetSpec), spec_rows).all()
+            elif spec_rows:
+                db.execute(insert(GadgetSpec), spec_rows)
+                spec_objs = None
+            else:
+                spec_objs = []
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise
+        if spec_objs is not None:
+            set_committed_value(gadget, "specs", spec_objs)
+        set_committed_value(gadget, "reviews", [])
         return gadget
         
     def filter_gadgets(
@@ -225,21 +653,23 @@ class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
         max_price: Optional[float] = None,
         min_rating: Optional[float] = None,
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Gadget]:
         """
         Filter gadgets by various criteria.
         """
-        query = db.query(Gadget)
+        required = ("average_rating",) if min_rating is not None else ()
+        query = db.query(Gadget).options(*self.load_options(fields, required=required))
         
         if category:
-            query = query.filter(Gadget.category.ilike(category))
+            query = query.filter(self.category_filter(category))
             
         if brand:
             # Support comma-separated brands for multiple brand filtering
             brands = [b.strip() for b in brand.split(',') if b.strip()]
             if brands:
-                query = query.filter(Gadget.brand.in_(brands))
+                query = query.filter(self.brand_filter(brands))
             
         if min_price is not None:
             query = query.filter(Gadget.price >= min_price)
@@ -258,3 +688,23 @@ class CRUDGadget(CRUDBase[Gadget, GadgetCreate, GadgetUpdate]):
 
 
 gadget = CRUDGadget(Gadget)
+
+
+def mark_gadgets_stale(session: Session, gadget_ids: Iterable[int]) -> None:
+    """
+    Evict gadgets from the cache when the session's transaction commits.
+    """
+    mark_stale(session, STALE_GADGETS, gadget_ids)
+
+
+def _cached_gadget_ids(obj: Any) -> Tuple[int]:
+    return (obj.id if isinstance(obj, Gadget) else obj.gadget_id,)
+
+
+clear_on_commit(
+    gadget_cache,
+    GADGET_CACHE_SOURCE_TABLES,
+    STALE_GADGETS,
+    keys_of=_cached_gadget_ids,
+    keys_reported=GADGET_IDS_REPORTED,
+)
@@ -2,21 +2,346 @@
 CRUD operations for review model.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, and_, desc, func, or_, select, text, update
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.core.cache import TTLCache, clear_on_commit
+from app.core.config import settings
+from app.core.pagination import SortKey
 from app.crud.base import CRUDBase
-from app.models.review import Review
+from app.crud.gadget import GADGET_IDS_REPORTED, gadget as crud_gadget, mark_gadgets_stale
+from app.models.gadget import Gadget
+from app.models.review import Review, ReviewStatus
+from app.models.user import User
 from app.schemas.review import ReviewCreate, ReviewUpdate
 
+# Columns needed to render each review listing field. Selecting them directly
+# returns plain rows: no ORM objects, identity map or unused user/gadget columns.
+LISTING_FIELD_COLUMNS = {
+    "id": (Review.id,),
+    "title": (Review.title,),
+    "content": (Review.content,),
+    "rating": (Review.rating,),
+    "pros": (Review.pros,),
+    "cons": (Review.cons,),
+    "user_id": (Review.user_id,),
+    "gadget_id": (Review.gadget_id,),
+    "status": (Review.status,),
+    "created_at": (Review.created_at,),
+    "updated_at": (Review.updated_at,),
+    "user_name": (User.username.label("user_username"),),
+    "user": (
+        Review.user_id,
+        User.username.label("user_username"),
+        User.full_name.label("user_full_name"),
+        User.profile_photo.label("user_profile_photo"),
+    ),
+    "gadget": (
+        Review.gadget_id,
+        Gadget.name.label("gadget_name"),
+        Gadget.category.label("gadget_category"),
+        Gadget.brand.label("gadget_brand"),
+    ),
+}
+
+LISTING_FIELDS = tuple(LISTING_FIELD_COLUMNS)
+USER_LISTING_FIELDS = frozenset({"user_name", "user"})
+
+# How each listing field is read back from a projected row
+LISTING_FIELD_VALUES = {
+    **{
+        name: attrgetter(name)
+        for name in LISTING_FIELD_COLUMNS
+        if name not in USER_LISTING_FIELDS and name != "gadget"
+    },
+    "user_name": attrgetter("user_username"),
+    "user": lambda row: {
+        "id": row.user_id,
+        "username": row.user_username,
+        "full_name": row.user_full_name,
+        "profile_photo": row.user_profile_photo,
+    },
+    "gadget": lambda row: {
+        "id": row.gadget_id,
+        "name": row.gadget_name,
+        "category": row.gadget_category,
+        "brand": row.gadget_brand,
+    },
+}
+
+# Sort orders for review listings, each ending in the unique id so cursors are exact
+REVIEW_SORTS: Dict[str, Tuple[SortKey, ...]] = {
+    "newest": ((Review.created_at, True), (Review.id, True)),
+    "oldest": ((Review.created_at, False), (Review.id, False)),
+    "rating_high": ((Review.rating, True), (Review.created_at, True), (Review.id, True)),
+    "rating_low": ((Review.rating, False), (Review.created_at, True), (Review.id, True)),
+}
+
+# Exact listing totals per normalized filter set. The filters read reviews,
+# gadgets and users, so a committed write to any of them clears the cache; the
+# TTL bounds staleness from writes made by other processes.
+review_counts = TTLCache(
+    maxsize=settings.REVIEW_COUNT_CACHE_SIZE, ttl=settings.REVIEW_COUNT_CACHE_TTL
+)
+COUNT_SOURCE_TABLES = frozenset({"reviews", "gadgets", "users"})
+
 
 class CRUDReview(CRUDBase[Review, ReviewCreate, ReviewUpdate]):
     """
     CRUD operations for review model.
     """
 
+    @staticmethod
+    def sort_keys(sort: str) -> Tuple[SortKey, ...]:
+        """
+        Sort-key tuple for a listing sort order, newest first by default.
+        """
+        return REVIEW_SORTS.get(sort, REVIEW_SORTS["newest"])
+
+    def listing_select(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        *,
+        with_gadget: bool = True,
+        join_user: bool = False,
+        join_gadget: bool = False,
+    ) -> Select:
+        """
+        Column-projection select for review listings.
+
+        Only the columns behind the requested fields are selected, and users or
+        gadgets are joined only when a field (or the caller's filters) needs them.
+        """
+        fields = LISTING_FIELDS if fields is None else fields
+        with_gadget = with_gadget and "gadget" in fields
+        columns = {}
+        for name in fields:
+            if name == "gadget" and not with_gadget:
+                continue
+            for column in LISTING_FIELD_COLUMNS[name]:
+                columns.setdefault(column.key, column)
+
+        stmt = select(*columns.values()).select_from(Review)
+        if join_user or USER_LISTING_FIELDS.intersection(fields):
+            stmt = stmt.join(User, Review.user_id == User.id)
+        if join_gadget or with_gadget:
+            stmt = stmt.join(Gadget, Review.gadget_id == Gadget.id)
+        return stmt
+
+    def admin_select(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        *,
+        search: Optional[str] = None,
+        status: Optional[ReviewStatus] = None,
+        category: Optional[str] = None,
+        user_id: Optional[int] = None,
+        gadget_id: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> Select:
+        """
+        Listing select for the admin review listing with server-side filters.
+        """
+        stmt = self.listing_select(
+            fields, join_user=bool(search), join_gadget=bool(search or category)
+        )
+        if search:
+            search_term = f"%{search}%"
+            stmt = stmt.where(or_(
+                Review.title.ilike(search_term),
+                Review.content.ilike(search_term),
+                User.username.ilike(search_term),
+                Gadget.name.ilike(search_term),
+            ))
+        if category:
+            stmt = stmt.where(crud_gadget.category_filter(category))
+        return stmt.where(*self._column_filters(
+            status=status,
+            user_id=user_id,
+            gadget_id=gadget_id,
+            min_rating=min_rating,
+            created_from=created_from,
+            created_to=created_to,
+        ))
+
+    @staticmethod
+    def _column_filters(
+        *,
+        status: Optional[ReviewStatus] = None,
+        user_id: Optional[int] = None,
+        gadget_id: Optional[int] = None,
+        min_rating: Optional[float] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> List[ColumnElement]:
+        """
+        Admin review filters on the reviews table's own columns.
+        """
+        conditions = []
+        if status is not None:
+            conditions.append(Review.status == status)
+        if user_id is not None:
+            conditions.append(Review.user_id == user_id)
+        if gadget_id is not None:
+            conditions.append(Review.gadget_id == gadget_id)
+        if min_rating is not None:
+            conditions.append(Review.rating >= min_rating)
+        if created_from is not None:
+            conditions.append(Review.created_at >= created_from)
+        if created_to is not None:
+            conditions.append(Review.created_at < created_to)
+        return conditions
+
+    def moderation_condition(
+        self,
+        *,
+        search: Optional[str] = None,
+        category: Optional[str] = None,
+        **filters: Any,
+    ) -> ColumnElement:
+        """
+        WHERE condition for the admin listing filters without joins, usable in an UPDATE.
+
+        Raises ValueError when no filter is given, so a bulk UPDATE can never
+        run without a WHERE clause.
+        """
+        conditions = self._column_filters(**filters)
+        if search:
+            search_term = f"%{search}%"
+            conditions.append(or_(
+                Review.title.ilike(search_term),
+                Review.content.ilike(search_term),
+                Review.user_id.in_(select(User.id).where(User.username.ilike(search_term))),
+                Review.gadget_id.in_(select(Gadget.id).where(Gadget.name.ilike(search_term))),
+            ))
+        if category:
+            conditions.append(
+                Review.gadget_id.in_(select(Gadget.id).where(crud_gadget.category_filter(category)))
+            )
+        if not conditions:
+            raise ValueError("At least one moderation filter is required")
+        return and_(*conditions)
+
+    def moderate(
+        self, db: Session, *, status: ReviewStatus, condition: ColumnElement
+    ) -> List[Row]:
+        """
+        Set the status of every review matching a condition in one UPDATE and commit.
+
+        Returns the (id, gadget_id) rows of the updated reviews. Their gadgets
+        are evicted from the gadget cache once, on commit, and listing totals
+        are cleared with it.
+        """
+        stmt = update(Review).where(condition).values(status=status)
+        options = {"synchronize_session": False, GADGET_IDS_REPORTED: True}
+        if db.get_bind().dialect.update_returning:
+            rows = db.execute(
+                stmt.returning(Review.id, Review.gadget_id), execution_options=options
+            ).all()
+        else:
+            # Lock the matching rows so the UPDATE changes exactly the ones read
+            rows = db.execute(
+                select(Review.id, Review.gadget_id).where(condition).with_for_update()
+            ).all()
+            if rows:
+                db.execute(stmt, execution_options=options)
+        mark_gadgets_stale(db, {gadget_id for _, gadget_id in rows})
+        db.commit()
+        return rows
+
+    @staticmethod
+    def listing_dict(
+        row: Row, fields: Optional[Sequence[str]] = None, *, with_gadget: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Build the review listing response item from a listing_select() row.
+        """
+        fields = LISTING_FIELDS if fields is None else fields
+        item = {}
+        for name in fields:
+            if name == "gadget" and not with_gadget:
+                item[name] = None
+            else:
+                item[name] = LISTING_FIELD_VALUES[name](row)
+        return item
+
+    def get_review_rows(
+        self,
+        db: Session,
+        *,
+        gadget_id: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Row]:
+        """
+        Get review listing rows, newest first, optionally for one gadget.
+        """
+        stmt = self.listing_select(fields, with_gadget=gadget_id is None)
+        if gadget_id is not None:
+            stmt = stmt.where(Review.gadget_id == gadget_id)
+        stmt = stmt.order_by(desc(Review.created_at)).offset(skip).limit(limit)
+        return db.execute(stmt).all()
+
+    def cached_count(self, db: Session, stmt: Select, key: Hashable) -> int:
+        """
+        Count the rows of a listing select, cached under a normalized filter key.
+        """
+        total = review_counts.get(key)
+        if total is None:
+            total = db.scalar(select(func.count()).select_from(stmt.subquery()))
+            review_counts.set(key, total)
+        return total
+
+    def estimated_count(self, db: Session) -> int:
+        """
+        Approximate number of reviews from counters the database maintains,
+        without scanning the table.
+
+        MySQL reports InnoDB's row estimate. Elsewhere the highest id is used;
+        ids only grow, so deleted reviews make it an overestimate.
+        """
+        if db.get_bind().dialect.name == "mysql":
+            total = db.scalar(text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'reviews'"
+            ))
+        else:
+            total = db.scalar(select(func.max(Review.id)))
+        return total or 0
+
+    def export_select(self) -> Select:
+        """
+        Column-projection select for exporting reviews with user and gadget names.
+        """
+        return (
+            select(
+                Review.id,
+                Review.user_id,
+                User.username.label("user_name"),
+                Review.gadget_id,
+                Gadget.name.label("gadget_name"),
+                Review.title,
+                Review.content,
+                Review.rating,
+                Review.pros,
+                Review.cons,
+                Review.status,
+                Review.created_at,
+                Review.updated_at,
+            )
+            .join(User, Review.user_id == User.id)
+            .join(Gadget, Review.gadget_id == Gadget.id)
+            .order_by(Review.id)
+        )
+
     def get_reviews_by_gadget(
         self, db: Session, *, gadget_id: int, skip: int = 0, limit: int = 100
     ) -> List[Review]:
@@ -34,12 +359,14 @@ class CRUDReview(CRUDBase[Review, ReviewCreate, ReviewUpdate]):
 
     def get_reviews_by_user(
         self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Review]:
+    ) -> List[Row]:
         """
-        Get reviews by user ID.
+        Get reviews by user ID as (review, gadget name, gadget brand, gadget
+        category) rows, the gadget columns joined in.
         """
         return (
-            db.query(Review)
+            db.query(Review, Gadget.name, Gadget.brand, Gadget.category)
+            .join(Gadget, Gadget.id == Review.gadget_id)
             .filter(Review.user_id == user_id)
             .order_by(desc(Review.created_at))
             .offset(skip)
@@ -53,7 +380,6 @@ class CRUDReview(CRUDBase[Review, ReviewCreate, ReviewUpdate]):
         """
         Get recent reviews with user and gadget information.
         """
-        from sqlalchemy.orm import joinedload
         return (
             db.query(Review)
             .options(joinedload(Review.user), joinedload(Review.gadget))
@@ -68,19 +394,17 @@ class CRUDReview(CRUDBase[Review, ReviewCreate, ReviewUpdate]):
         """
         Create a review for a user.
         """
-        db_obj = Review(
-            user_id=user_id,
-            gadget_id=obj_in.gadget_id,
-            title=obj_in.title,
-            content=obj_in.content,
-            rating=obj_in.rating,
-            pros=obj_in.pros,
-            cons=obj_in.cons
-        )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
-
+        return self._insert_returning(db, {
+            "user_id": user_id,
+            "gadget_id": obj_in.gadget_id,
+            "title": obj_in.title,
+            "content": obj_in.content,
+            "rating": obj_in.rating,
+            "pros": obj_in.pros,
+            "cons": obj_in.cons,
+        })
 
 review = CRUDReview(Review)
+
+
+clear_on_commit(review_counts, COUNT_SOURCE_TABLES, "review_counts_stale")
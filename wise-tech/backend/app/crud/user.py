@@ -2,21 +2,88 @@
 CRUD operations for user model.
 """
 
-from typing import Any, Dict, Optional, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+from sqlalchemy import Select, func, insert, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.pagination import SortKey
+from app.core.security import get_password_hash, get_password_hashes, verify_password
 from app.crud.base import CRUDBase
+from app.models.review import Review
 from app.models.user import User
 from app.schemas.user import UserCreate, UserAdminCreate, UserUpdate
 
+# Sort orders for the admin user listing, each ending in the unique id
+USER_SORTS: Dict[str, Tuple[SortKey, ...]] = {
+    "id": ((User.id, False),),
+    "newest": ((User.joined_date, True), (User.id, True)),
+    "oldest": ((User.joined_date, False), (User.id, False)),
+    "username": ((User.username, False), (User.id, False)),
+}
+
+# Columns returned for users created in bulk, enough for the User response schema
+USER_RESPONSE_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.full_name,
+    User.bio,
+    User.profile_photo,
+    User.is_admin,
+    User.joined_date,
+)
+
+# Required fields of an admin-created user, with the error for a blank value
+REQUIRED_USER_FIELDS = {
+    "email": "Email is required",
+    "username": "Username is required",
+    "password": "Password is required",
+    "full_name": "Full name is required",
+}
+
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """
     CRUD operations for user model.
     """
 
+    @staticmethod
+    def sort_keys(sort: str) -> Tuple[SortKey, ...]:
+        """
+        Sort-key tuple for an admin user listing sort order, by id by default.
+        """
+        return USER_SORTS.get(sort, USER_SORTS["id"])
+
+    def admin_select(
+        self,
+        *,
+        search: Optional[str] = None,
+        is_admin: Optional[bool] = None,
+        joined_from: Optional[datetime] = None,
+        joined_to: Optional[datetime] = None,
+    ) -> Select:
+        """
+        Select users for the admin listing with server-side filters.
+        """
+        stmt = select(User)
+        if search:
+            search_term = f"%{search}%"
+            stmt = stmt.where(or_(
+                User.username.ilike(search_term),
+                User.full_name.ilike(search_term),
+                User.email.ilike(search_term),
+            ))
+        if is_admin is not None:
+            stmt = stmt.where(User.is_admin == is_admin)
+        if joined_from is not None:
+            stmt = stmt.where(User.joined_date >= joined_from)
+        if joined_to is not None:
+            stmt = stmt.where(User.joined_date < joined_to)
+        return stmt
+
     def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
         return db.query(User).filter(User.email == email).first()
 
@@ -24,32 +91,109 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         return db.query(User).filter(User.username == username).first()
 
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
-        db_obj = User(
-            email=obj_in.email,
-            username=obj_in.username,
-            hashed_password=get_password_hash(obj_in.password),
-            full_name=obj_in.full_name,
-            bio=obj_in.bio,
-        )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self._insert_returning(db, {
+            "email": obj_in.email,
+            "username": obj_in.username,
+            "hashed_password": get_password_hash(obj_in.password),
+            "full_name": obj_in.full_name,
+            "bio": obj_in.bio,
+        })
 
     def create_admin_user(self, db: Session, *, obj_in: UserAdminCreate) -> User:
         """Create user with admin privileges by admin"""
-        db_obj = User(
-            email=obj_in.email,
-            username=obj_in.username,
-            hashed_password=get_password_hash(obj_in.password),
-            full_name=obj_in.full_name,
-            bio=obj_in.bio,
-            is_admin=obj_in.is_admin if obj_in.is_admin is not None else False,
-        )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self._insert_returning(db, {
+            "email": obj_in.email,
+            "username": obj_in.username,
+            "hashed_password": get_password_hash(obj_in.password),
+            "full_name": obj_in.full_name,
+            "bio": obj_in.bio,
+            "is_admin": obj_in.is_admin if obj_in.is_admin is not None else False,
+        })
+
+    def bulk_create(
+        self,
+        db: Session,
+        *,
+        users: Sequence[UserAdminCreate],
+        workers: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Create many users in one transaction.
+
+        Email and username uniqueness is checked for the whole batch in one
+        query, passwords are hashed in parallel and the users are inserted in
+        one executemany. Users failing a check are skipped and reported as
+        ``{"index", "email", "errors"}`` instead of aborting the batch.
+
+        Returns the created users as response dicts and the errors. Raises
+        IntegrityError (after rolling back) if a conflicting user was created
+        concurrently.
+        """
+        errors: Dict[int, List[str]] = {}
+        emails: Dict[str, int] = {}
+        usernames: Dict[str, int] = {}
+        for index, user_in in enumerate(users):
+            messages = [
+                message for field, message in REQUIRED_USER_FIELDS.items()
+                if not (getattr(user_in, field) or "").strip()
+            ]
+            if user_in.email in emails:
+                messages.append(f"Email duplicates user {emails[user_in.email]} of the batch")
+            if user_in.username in usernames:
+                messages.append(f"Username duplicates user {usernames[user_in.username]} of the batch")
+            emails.setdefault(user_in.email, index)
+            usernames.setdefault(user_in.username, index)
+            if messages:
+                errors[index] = messages
+
+        taken = db.execute(
+            select(User.email, User.username).where(or_(
+                User.email.in_(list(emails)), User.username.in_(list(usernames))
+            ))
+        ).all() if users else []
+        taken_emails = {email for email, _ in taken}
+        taken_usernames = {username for _, username in taken}
+        for index, user_in in enumerate(users):
+            if user_in.email in taken_emails:
+                errors.setdefault(index, []).append("User with this email already exists")
+            if user_in.username in taken_usernames:
+                errors.setdefault(index, []).append("Username already taken")
+
+        new_users = [user_in for index, user_in in enumerate(users) if index not in errors]
+        hashes = get_password_hashes([user_in.password for user_in in new_users], workers=workers)
+        rows = [
+            {
+                "email": user_in.email,
+                "username": user_in.username,
+                "hashed_password": hashed_password,
+                "full_name": user_in.full_name,
+                "bio": user_in.bio,
+                "is_admin": bool(user_in.is_admin),
+            }
+            for user_in, hashed_password in zip(new_users, hashes)
+        ]
+
+        created: List[Any] = []
+        if rows:
+            try:
+                if db.get_bind().dialect.insert_executemany_returning:
+                    created = db.execute(insert(User).returning(*USER_RESPONSE_COLUMNS), rows).all()
+                else:
+                    db.execute(insert(User), rows)
+                    created = db.execute(
+                        select(*USER_RESPONSE_COLUMNS)
+                        .where(User.email.in_([row["email"] for row in rows]))
+                        .order_by(User.id)
+                    ).all()
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                raise
+
+        return [dict(row._mapping) for row in created], [
+            {"index": index, "email": users[index].email, "errors": messages}
+            for index, messages in sorted(errors.items())
+        ]
 
     def update(
         self, db: Session, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
@@ -57,7 +201,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.dict(exclude_unset=True)
+            update_data = obj_in.model_dump(exclude_unset=True)
         
         if update_data.get("password"):
             hashed_password = get_password_hash(update_data["password"])
@@ -66,6 +210,30 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         
         return super().update(db, db_obj=db_obj, obj_in=update_data)
 
+    def export_select(self) -> Select:
+        """
+        Column-projection select for exporting users with their review counts.
+        """
+        review_counts = (
+            select(Review.user_id, func.count(Review.id).label("review_count"))
+            .group_by(Review.user_id)
+            .subquery()
+        )
+        return (
+            select(
+                User.id,
+                User.email,
+                User.username,
+                User.full_name,
+                User.bio,
+                User.is_admin,
+                User.joined_date,
+                func.coalesce(review_counts.c.review_count, 0).label("review_count"),
+            )
+            .outerjoin(review_counts, review_counts.c.user_id == User.id)
+            .order_by(User.id)
+        )
+
     def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
         user = self.get_by_email(db, email=email)
         if not user:
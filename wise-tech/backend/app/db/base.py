@@ -3,5 +3,5 @@ Import all models for easy access elsewhere.
 """
 
 from app.models.user import User
-from app.models.gadget import Gadget, GadgetSpec
+from app.models.gadget import Brand, Category, Gadget, GadgetSpec
 from app.models.review import Review
@@ -0,0 +1,108 @@
+"""
+Bulk gadget import from CSV or NDJSON.
+
+Rows are parsed incrementally, validated in batches and written with
+crud.gadget.bulk_upsert, one transaction per batch, so a large vendor catalog
+streams through in bounded memory. Rows that fail parsing, validation or the
+database write are reported by line number instead of aborting the import.
+
+CSV columns: name, brand, category, description, price, release_date,
+image_url, plus one ``spec:<name>`` column per specification.
+NDJSON: one gadget object per line, with specs as ``{"name": "value"}`` or
+``[{"name": ..., "value": ...}]``.
+"""
+
+import logging
+from typing import IO, Any, Dict, Iterator, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.db.records import ImportFormat, Record, iter_records, validation_messages
+from app.schemas.gadget import GadgetImportRow
+
+logger = logging.getLogger(__name__)
+
+SPEC_COLUMN_PREFIX = "spec:"
+
+
+def _gadget_records(file: IO[bytes], format: ImportFormat) -> Iterator[Record]:
+    """
+    Parse gadget records, folding CSV ``spec:<name>`` columns into specs.
+    """
+    for line, record, error in iter_records(file, format):
+        if record is not None and format == ImportFormat.CSV:
+            specs = {}
+            for column in [column for column in record if column.startswith(SPEC_COLUMN_PREFIX)]:
+                specs[column[len(SPEC_COLUMN_PREFIX):].strip()] = record.pop(column)
+            record["specs"] = specs
+        yield line, record, error
+
+
+def _write_batch(
+    db: Session, batch: List[Tuple[int, GadgetImportRow]], report: Dict[str, Any]
+) -> None:
+    rows = [row for _, row in batch]
+    try:
+        try:
+            created, updated = crud.gadget.bulk_upsert(db, rows=rows)
+        except IntegrityError:
+            # A concurrent import may have inserted some of the gadgets first;
+            # they are matched and updated on the second attempt
+            created, updated = crud.gadget.bulk_upsert(db, rows=rows)
+    except IntegrityError as exc:
+        # The whole chunk rolled back; report every row in it
+        message = f"Database error: {exc.orig}"
+        report["failed"] += len(batch)
+        report["errors"].extend({"line": line, "errors": [message]} for line, _ in batch)
+        return
+    report["created"] += created
+    report["updated"] += updated
+
+
+def import_gadgets(
+    db: Session,
+    file: IO[bytes],
+    format: ImportFormat,
+    *,
+    batch_size: int = settings.IMPORT_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """
+    Import gadgets from a CSV or NDJSON stream, upserting on (brand, name).
+
+    Returns a report with created/updated/failed counts and the errors of
+    each rejected row.
+    """
+    report: Dict[str, Any] = {"created": 0, "updated": 0, "failed": 0, "errors": []}
+    pending: List[Tuple[int, Dict[str, Any]]] = []
+
+    def flush() -> None:
+        valid = []
+        for line, record in pending:
+            try:
+                valid.append((line, GadgetImportRow.model_validate(record)))
+            except ValidationError as exc:
+                report["failed"] += 1
+                report["errors"].append({"line": line, "errors": validation_messages(exc)})
+        if valid:
+            _write_batch(db, valid, report)
+        pending.clear()
+
+    for line, record, error in _gadget_records(file, format):
+        if error is not None:
+            report["failed"] += 1
+            report["errors"].append({"line": line, "errors": [error]})
+            continue
+        pending.append((line, record))
+        if len(pending) >= batch_size:
+            flush()
+            logger.info(
+                "Imported %d gadgets so far (%d failed)",
+                report["created"] + report["updated"], report["failed"],
+            )
+    if pending:
+        flush()
+    return report
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app import crud, schemas
-from app.db.base_class import Base
+from app.db.migrate import upgrade
 from app.db.session import SessionLocal, engine
 from app.core.security import get_password_hash
 
@@ -21,24 +21,6 @@ def init_db(db: Session) -> None:
     """
     Initialize database with sample data.
     """
-    # Create admin user
-    admin_user = crud.user.get_by_email(db, email="admin@wisetech.com")
-    if not admin_user:
-        logger.info("Creating admin user")
-        admin_in = schemas.UserCreate(
-            email="admin@wisetech.com",
-            username="admin",
-            password="admin123",
-            full_name="Admin User",
-            bio="Administrator account for WiseTech platform.",
-        )
-        admin_user = crud.user.create(db, obj_in=admin_in)
-
-        # Set admin privileges
-        admin_user.is_admin = True
-        db.add(admin_user)
-        db.commit()
-
     # Create sample users - 15 users total
     sample_users = [
         {
@@ -148,14 +130,20 @@ def init_db(db: Session) -> None:
         },
     ]
 
-    created_users = []
-    for user_data in sample_users:
-        user = crud.user.get_by_email(db, email=user_data["email"])
-        if not user:
-            logger.info(f"Creating user {user_data['username']}")
-            user_in = schemas.UserCreate(**user_data)
-            user = crud.user.create(db, obj_in=user_in)
-            created_users.append(user)
+    # Create the admin and any missing sample users in one batch; existing
+    # accounts come back as errors and are left as they are
+    admin_in = schemas.UserAdminCreate(
+        email="admin@wisetech.com",
+        username="admin",
+        password="admin123",
+        full_name="Admin User",
+        bio="Administrator account for WiseTech platform.",
+        is_admin=True,
+    )
+    created_users, _ = crud.user.bulk_create(
+        db, users=[admin_in] + [schemas.UserAdminCreate(**user_data) for user_data in sample_users]
+    )
+    logger.info(f"Created {len(created_users)} users")
 
     # Buat sample gadgets - 30 gadgets total
     sample_gadgets = [
@@ -1063,8 +1051,8 @@ def main() -> None:
     """
     logger.info("Creating initial data")
 
-    # Buat tabel database
-    Base.metadata.create_all(bind=engine)
+    # Buat tabel database (atau migrasikan skema lama)
+    upgrade(engine)
 
     # Buat session
     db = SessionLocal()
@@ -0,0 +1,67 @@
+"""
+Schema migrations (Alembic, in backend/migrations) for the WiseTech database.
+
+Databases created by create_all before migrations existed have no
+alembic_version table; they are stamped at the baseline revision and then
+upgraded, so `python -m app.db.migrate` works on any database. An empty
+database gets the current schema straight from the models.
+"""
+
+import logging
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+from app.db import base  # noqa: F401  (registers every model on Base.metadata)
+from app.db.base_class import Base
+from app.db.session import engine as app_engine
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+# Revision matching the schema create_all built before migrations existed
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(connection: Connection) -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    config.attributes["connection"] = connection
+    return config
+
+
+def stamp_head(connection: Connection) -> None:
+    """
+    Record a database just built with create_all as being at the latest revision.
+    """
+    command.stamp(alembic_config(connection), "head")
+
+
+def upgrade(engine: Engine) -> None:
+    """
+    Bring the database behind the engine to the latest revision.
+    """
+    with engine.begin() as connection:
+        config = alembic_config(connection)
+        if MigrationContext.configure(connection).get_current_revision() is None:
+            if not inspect(connection).has_table("gadgets"):
+                logger.info("Empty database; creating the current schema")
+                Base.metadata.create_all(bind=connection)
+                command.stamp(config, "head")
+                return
+            logger.info("Unversioned database; stamping baseline revision %s", BASELINE_REVISION)
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    upgrade(app_engine)
+
+
+if __name__ == "__main__":
+    main()
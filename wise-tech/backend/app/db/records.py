@@ -0,0 +1,86 @@
+"""
+Incremental CSV and NDJSON record parsing for bulk imports.
+
+Shared by the gadget import and user provisioning: records are yielded one
+at a time with their line number, and unparseable lines are reported
+instead of aborting the file.
+"""
+
+import csv
+import enum
+import io
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from pydantic import ValidationError
+
+
+class ImportFormat(str, enum.Enum):
+    """Supported bulk import encodings."""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @classmethod
+    def from_filename(cls, filename: Optional[str]) -> Optional["ImportFormat"]:
+        suffix = (filename or "").rsplit(".", 1)[-1].lower()
+        if suffix == "csv":
+            return cls.CSV
+        if suffix in ("ndjson", "jsonl"):
+            return cls.NDJSON
+        return None
+
+
+# (line number, parsed record or None, parse error or None)
+Record = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def _csv_records(file: IO[bytes]) -> Iterator[Record]:
+    # Values are stripped; empty cells are left out of the record
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    try:
+        for row in reader:
+            record = {
+                column.strip(): value.strip()
+                for column, value in row.items()
+                if column is not None and value is not None and value.strip()
+            }
+            yield reader.line_num, record, None
+    except (UnicodeDecodeError, csv.Error) as exc:
+        # The rest of the file can't be read reliably
+        yield reader.line_num + 1, None, f"Unreadable CSV: {exc}"
+    text.detach()
+
+
+def _ndjson_records(file: IO[bytes]) -> Iterator[Record]:
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            yield line_number, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def iter_records(file: IO[bytes], format: ImportFormat) -> Iterator[Record]:
+    """
+    Parse a binary CSV or NDJSON stream one record at a time.
+    """
+    if format == ImportFormat.CSV:
+        return _csv_records(file)
+    return _ndjson_records(file)
+
+
+def validation_messages(exc: ValidationError) -> List[str]:
+    """
+    One "field: message" line per error of a validation failure.
+    """
+    return [
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    ]
@@ -3,16 +3,72 @@ Seeder untuk menambahkan data gadget dan review sample
 """
 
 from datetime import datetime, timedelta
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app import crud, schemas
 from app.models.user import User
-from app.models.gadget import Gadget
+from app.models.gadget import Gadget, GadgetSpec
 from app.models.review import Review
 import random
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Sample review content templates, by sentiment
+REVIEW_TEMPLATES = {
+    "positive": [
+        "Excellent performance and build quality. Highly recommended!",
+        "Amazing device with outstanding features. Worth every penny!",
+        "Incredible performance, sleek design, and great value for money.",
+        "Outstanding product with excellent camera quality and smooth performance.",
+        "Fantastic device! Exceeds expectations in every way.",
+        "Superb build quality and amazing performance. Love it!",
+        "Best purchase I've made this year. Highly recommend!",
+        "Exceptional device with premium features at great price.",
+        "Absolutely love this device. Perfect for my needs!",
+        "Outstanding performance and beautiful design. 5 stars!"
+    ],
+    "neutral": [
+        "Good device overall, but has some minor issues.",
+        "Decent performance for the price point. Could be better.",
+        "Solid device with good features. Nothing exceptional.",
+        "Average performance, meets basic expectations.",
+        "Good value for money, but not outstanding.",
+        "Decent build quality, performance is okay.",
+        "Satisfactory device with some room for improvement.",
+        "Good device overall, some features could be better.",
+        "Acceptable performance, but competition is strong.",
+        "Fair device for the price, has pros and cons."
+    ],
+    "negative": [
+        "Disappointing performance, not worth the price.",
+        "Poor build quality and frequent issues.",
+        "Below expectations, many problems since day one.",
+        "Overpriced for what it offers. Not recommended.",
+        "Quality issues and poor customer service.",
+        "Many bugs and performance problems.",
+        "Not as advertised, several features don't work properly.",
+        "Poor value for money, better alternatives available.",
+        "Frequent crashes and poor battery life.",
+        "Disappointed with overall experience and quality."
+    ]
+}
+
+PROS_TEMPLATES = [
+    "Great battery life", "Excellent camera quality", "Fast performance",
+    "Beautiful design", "Good value for money", "Smooth user interface",
+    "Premium build quality", "Fast charging", "Great display quality",
+    "Excellent audio quality", "Lightweight design", "Good connectivity options"
+]
+
+CONS_TEMPLATES = [
+    "Expensive price", "Average battery life", "Limited storage options",
+    "No headphone jack", "Heavy weight", "Slow charging speed",
+    "Poor low-light camera", "Limited software updates", "Fragile build",
+    "Poor speaker quality", "Limited color options", "No wireless charging"
+]
+
+
 def seed_gadgets_and_reviews(db: Session) -> None:
     """
     Seed database with 30 gadgets and sample reviews
@@ -567,62 +623,15 @@ def seed_gadgets_and_reviews(db: Session) -> None:
         return
     
     logger.info(f"Found {len(users)} users for creating reviews")
-      # Sample review content templates
-    review_templates = {
-        "positive": [
-            "Excellent performance and build quality. Highly recommended!",
-            "Amazing device with outstanding features. Worth every penny!",
-            "Incredible performance, sleek design, and great value for money.",
-            "Outstanding product with excellent camera quality and smooth performance.",
-            "Fantastic device! Exceeds expectations in every way.",
-            "Superb build quality and amazing performance. Love it!",
-            "Best purchase I've made this year. Highly recommend!",
-            "Exceptional device with premium features at great price.",
-            "Absolutely love this device. Perfect for my needs!",
-            "Outstanding performance and beautiful design. 5 stars!"
-        ],
-        "neutral": [
-            "Good device overall, but has some minor issues.",
-            "Decent performance for the price point. Could be better.",
-            "Solid device with good features. Nothing exceptional.",
-            "Average performance, meets basic expectations.",
-            "Good value for money, but not outstanding.",
-            "Decent build quality, performance is okay.",
-            "Satisfactory device with some room for improvement.",
-            "Good device overall, some features could be better.",
-            "Acceptable performance, but competition is strong.",
-            "Fair device for the price, has pros and cons."
-        ],
-        "negative": [
-            "Disappointing performance, not worth the price.",
-            "Poor build quality and frequent issues.",
-            "Below expectations, many problems since day one.",
-            "Overpriced for what it offers. Not recommended.",
-            "Quality issues and poor customer service.",
-            "Many bugs and performance problems.",
-            "Not as advertised, several features don't work properly.",
-            "Poor value for money, better alternatives available.",
-            "Frequent crashes and poor battery life.",
-            "Disappointed with overall experience and quality."
-        ]
-    }
-    
-    pros_templates = [
-        "Great battery life", "Excellent camera quality", "Fast performance", 
-        "Beautiful design", "Good value for money", "Smooth user interface",
-        "Premium build quality", "Fast charging", "Great display quality",
-        "Excellent audio quality", "Lightweight design", "Good connectivity options"
-    ]
-    
-    cons_templates = [
-        "Expensive price", "Average battery life", "Limited storage options",
-        "No headphone jack", "Heavy weight", "Slow charging speed",
-        "Poor low-light camera", "Limited software updates", "Fragile build",
-        "Poor speaker quality", "Limited color options", "No wireless charging"
-    ]
+    # Users who already reviewed each gadget, loaded once instead of per review
+    reviewed = set(
+        db.query(Review.user_id, Review.gadget_id)
+        .filter(Review.gadget_id.in_([gadget.id for gadget in created_gadgets]))
+        .all()
+    )
     
     # Create reviews for each gadget
-    review_count = 0
+    review_rows = []
     for gadget in created_gadgets:
         # Create 3-8 reviews per gadget
         num_reviews = random.randint(3, 8)
@@ -631,58 +640,45 @@ def seed_gadgets_and_reviews(db: Session) -> None:
             # Select random user
             user = random.choice(users)
             
-            # Check if user already reviewed this gadget
-            existing_review = db.query(Review).filter(
-                Review.user_id == user.id,
-                Review.gadget_id == gadget.id
-            ).first()
-            
-            if existing_review:
+            # Skip if user already reviewed this gadget
+            if (user.id, gadget.id) in reviewed:
                 continue
+            reviewed.add((user.id, gadget.id))
             
             # Generate random rating (bias towards higher ratings)
             rating = random.choices([1, 2, 3, 4, 5], weights=[5, 10, 15, 35, 35])[0]
             
             # Select review content based on rating
             if rating >= 4:
-                content = random.choice(review_templates["positive"])
+                content = random.choice(REVIEW_TEMPLATES["positive"])
             elif rating == 3:
-                content = random.choice(review_templates["neutral"])
+                content = random.choice(REVIEW_TEMPLATES["neutral"])
             else:
-                content = random.choice(review_templates["negative"])
-            
-            # Generate title
-            title = f"Review of {gadget.name}"
+                content = random.choice(REVIEW_TEMPLATES["negative"])
             
             # Add pros and cons (randomly)
-            pros = random.choice(pros_templates) if random.random() > 0.4 else None
-            cons = random.choice(cons_templates) if random.random() > 0.6 else None
-              # Create review
-            review_data = {
+            pros = random.choice(PROS_TEMPLATES) if random.random() > 0.4 else None
+            cons = random.choice(CONS_TEMPLATES) if random.random() > 0.6 else None
+            
+            # Random created_at (within last 6 months)
+            created_at = datetime.now() - timedelta(days=random.randint(1, 180))
+            review_rows.append({
+                "user_id": user.id,
                 "gadget_id": gadget.id,
-                "title": title,
+                "title": f"Review of {gadget.name}",
                 "content": content,
                 "rating": rating,
                 "pros": pros,
-                "cons": cons
-            }
-            
-            try:
-                review_in = schemas.ReviewCreate(**review_data)
-                review = crud.review.create_user_review(db, obj_in=review_in, user_id=user.id)
-                review_count += 1
-                
-                # Random created_at (within last 6 months)
-                days_ago = random.randint(1, 180)
-                review.created_at = datetime.now() - timedelta(days=days_ago)
-                db.commit()
-                
-            except Exception as e:
-                logger.error(f"Error creating review: {e}")
-                db.rollback()
-                continue
-                db.rollback()
-                continue
+                "cons": cons,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+    
+    # Insert all reviews in one executemany and a single commit
+    if review_rows:
+        db.execute(insert(Review), review_rows)
+        db.commit()
+    review_count = len(review_rows)
     
     logger.info(f"Created {review_count} reviews")
     logger.info("Gadget and review seeding completed successfully!")
@@ -694,8 +690,9 @@ def clear_existing_data(db: Session) -> None:
     """
     logger.info("Clearing existing gadgets and reviews...")
     
-    # Delete reviews first (foreign key constraint)
+    # Delete reviews and specs first (foreign key constraint)
     db.query(Review).delete()
+    db.query(GadgetSpec).delete()
     
     # Delete gadgets
     db.query(Gadget).delete()
@@ -3,7 +3,7 @@ Database session module for the WiseTech API application.
 Sets up SQLAlchemy session factory.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -13,11 +13,23 @@ from app.core.config import settings
 # Add SQLite-specific connect_args if using SQLite
 if "sqlite" in settings.DATABASE_URL:
     engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        # SQLite only enforces foreign keys when enabled per connection; the
+        # RETURNING write path relies on them to reject dangling references.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 else:
     engine = create_engine(settings.DATABASE_URL)
 
 # Create SessionLocal class with sessionmaker factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False keeps loaded attributes valid after commit, so writes
+# don't need a follow-up refresh() SELECT to read the row back.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Create Base class for declarative models
 Base = declarative_base()
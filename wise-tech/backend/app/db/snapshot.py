@@ -0,0 +1,226 @@
+"""
+Prebuilt database snapshots of the sample data.
+
+Seeding through init_db takes hundreds of ORM queries and a bcrypt hash per
+user. Instead, the seeded database is built once as a SQLite file named after
+a hash of the seed data, the code that writes it and the schema, and every
+fresh environment (or test) starts from a copy of it. Changing init_db.py, the
+CRUD/security code it calls or any model yields a new name, so stale snapshots
+are never reused. The hash is also stored inside the snapshot, so restore can
+tell an outdated copy of the sample data from a database with real data.
+"""
+
+import argparse
+import hashlib
+import importlib
+import logging
+import os
+import shutil
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import create_engine, event, insert, inspect, select, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.core.config import settings
+from app.db import init_db as init_db_module
+from app.db.base_class import Base
+from app.db.migrate import stamp_head, upgrade
+from app.db.session import engine as app_engine
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot build itself changes
+SNAPSHOT_FORMAT = 2
+# Code the seeding modules call to write their rows (keys, hashes, defaults)
+SEED_DEPENDENCIES = (
+    "app.crud.base", "app.crud.user", "app.crud.gadget", "app.crud.review",
+    "app.core.security", "app.db.seed_gadgets",
+)
+# Single-row table holding the fingerprint of the snapshot a database was restored from
+FINGERPRINT_TABLE = "sample_snapshot"
+
+
+def fingerprint(seed_source: Optional[Path] = None) -> str:
+    """
+    Hash of everything a snapshot depends on: the seed data (init_db.py unless
+    another seeding module is given), the code it writes rows through and the
+    schema DDL.
+    """
+    digest = hashlib.sha256(f"format:{SNAPSHOT_FORMAT}\n".encode())
+    digest.update(Path(seed_source or init_db_module.__file__).read_bytes())
+    for name in SEED_DEPENDENCIES:
+        digest.update(Path(importlib.import_module(name).__file__).read_bytes())
+    dialect = sqlite.dialect()
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    return digest.hexdigest()[:16]
+
+
+def snapshot_path() -> Path:
+    return Path(settings.SNAPSHOT_DIR) / f"wisetech-{fingerprint()}.db"
+
+
+def _write_fingerprint(connection, value: str) -> None:
+    connection.execute(text(f"CREATE TABLE IF NOT EXISTS {FINGERPRINT_TABLE} (fingerprint VARCHAR NOT NULL)"))
+    connection.execute(text(f"DELETE FROM {FINGERPRINT_TABLE}"))
+    connection.execute(text(f"INSERT INTO {FINGERPRINT_TABLE} (fingerprint) VALUES (:value)"), {"value": value})
+
+
+def stored_fingerprint(engine: Engine) -> Optional[str]:
+    """
+    Fingerprint of the snapshot the database was restored from, or None if
+    it wasn't restored from one.
+    """
+    if not inspect(engine).has_table(FINGERPRINT_TABLE):
+        return None
+    with engine.connect() as connection:
+        return connection.execute(text(f"SELECT fingerprint FROM {FINGERPRINT_TABLE}")).scalar()
+
+
+def build_snapshot(path: Optional[Path] = None) -> Path:
+    """
+    Seed a fresh SQLite database with init_db and store it as the snapshot.
+    """
+    path = path or snapshot_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    building = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    building.unlink(missing_ok=True)
+
+    logger.info("Building database snapshot %s", path)
+    engine = create_engine(f"sqlite:///{building}")
+    try:
+        with engine.begin() as connection:
+            Base.metadata.create_all(bind=connection)
+            stamp_head(connection)
+            _write_fingerprint(connection, fingerprint())
+        with sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as db:
+            init_db_module.init_db(db)
+        with engine.connect() as connection:
+            connection.exec_driver_sql("VACUUM")
+    finally:
+        engine.dispose()
+    # Concurrent builders produce equivalent files; the last rename wins
+    os.replace(building, path)
+    return path
+
+
+def ensure_snapshot() -> Path:
+    """
+    Path of the current snapshot, building it first if needed.
+    """
+    path = snapshot_path()
+    if not path.exists():
+        build_snapshot(path)
+    return path
+
+
+def _has_data(engine: Engine) -> bool:
+    if not inspect(engine).has_table("users"):
+        return False
+    with engine.connect() as connection:
+        return connection.execute(select(Base.metadata.tables["users"].c.id).limit(1)).first() is not None
+
+
+def restore(engine: Engine, *, force: bool = False) -> bool:
+    """
+    Load the snapshot into the database behind the engine.
+
+    A SQLite file database is replaced by a copy of the snapshot; other
+    databases get their tables recreated and filled with one multi-row
+    INSERT per table. Unless force is set, a copy of the current snapshot is
+    kept, a copy of an outdated one is replaced, and a database with data of
+    its own is only migrated to the current schema. Returns whether the
+    snapshot was loaded.
+    """
+    if not force:
+        stored = stored_fingerprint(engine)
+        if stored == fingerprint():
+            logger.info("Database already holds the current snapshot")
+            return False
+        if stored is None and _has_data(engine):
+            logger.info("Database already has data; migrating it instead of restoring the snapshot")
+            upgrade(engine)
+            return False
+        if stored is not None:
+            logger.info("Database holds outdated snapshot %s; replacing it", stored)
+
+    source = ensure_snapshot()
+    database = engine.url.database
+    if engine.dialect.name == "sqlite" and database and database != ":memory:":
+        engine.dispose()
+        copying = Path(f"{database}.{os.getpid()}.tmp")
+        shutil.copyfile(source, copying)
+        os.replace(copying, database)
+        for suffix in ("-wal", "-shm", "-journal"):
+            Path(f"{database}{suffix}").unlink(missing_ok=True)
+    else:
+        source_engine = create_engine(f"sqlite:///{source}")
+        try:
+            Base.metadata.drop_all(bind=engine)
+            with engine.begin() as connection:
+                Base.metadata.create_all(bind=connection)
+                stamp_head(connection)
+                _write_fingerprint(connection, stored_fingerprint(source_engine))
+            with source_engine.connect() as reader, engine.begin() as writer:
+                for table in Base.metadata.sorted_tables:
+                    rows = reader.execute(select(table)).mappings().all()
+                    if rows:
+                        writer.execute(insert(table), [dict(row) for row in rows])
+        finally:
+            source_engine.dispose()
+    logger.info("Restored database snapshot %s", source.name)
+    return True
+
+
+def memory_engine() -> Engine:
+    """
+    Private in-memory SQLite database loaded from the snapshot, for tests.
+
+    The snapshot pages are copied with SQLite's online backup API, which
+    takes milliseconds, so every test can start from its own pristine copy.
+    """
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    with closing(sqlite3.connect(ensure_snapshot())) as source, engine.connect() as connection:
+        source.backup(connection.connection.dbapi_connection)
+    return engine
+
+
+def main() -> None:
+    """
+    Build or restore the sample data snapshot.
+    """
+    parser = argparse.ArgumentParser(description="Prebuilt sample database snapshots")
+    parser.add_argument(
+        "command", nargs="?", default="restore", choices=["restore", "build", "path"],
+        help="restore (default): load the snapshot into DATABASE_URL; "
+        "build: rebuild the snapshot; path: print the snapshot file",
+    )
+    parser.add_argument("--force", action="store_true", help="Replace a database that already has data")
+    args = parser.parse_args()
+
+    if args.command == "path":
+        print(snapshot_path())
+    elif args.command == "build":
+        build_snapshot()
+    else:
+        restore(app_engine, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""
+Deterministic synthetic data generator for load testing.
+
+The same seed and sizes always produce the same rows. Gadgets follow
+per-category brand, price and spec distributions, and review activity is
+Zipf-skewed: a few popular gadgets and very active users account for most of
+the reviews, as in real traffic, with at most one review per user per gadget
+as the app enforces. Rows are written in executemany batches with
+explicit ids (no per-row queries or RETURNING), and every user shares one
+precomputed password hash.
+"""
+
+import logging
+import math
+import random
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import Table, func, insert, select
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.security import get_password_hash
+from app.crud.gadget import brand_key, category_key
+from app.db.seed_gadgets import CONS_TEMPLATES, PROS_TEMPLATES, REVIEW_TEMPLATES
+from app.models.gadget import Brand, Category, Gadget, GadgetSpec
+from app.models.review import Review, ReviewStatus
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Timestamps fall in the years before this date, so the output doesn't depend
+# on when the generator runs
+REFERENCE_DATE = datetime(2025, 6, 1)
+HISTORY_SECONDS = 5 * 365 * 24 * 3600
+
+# Dataset presets: (users, gadgets, reviews)
+SCALES: Dict[str, Tuple[int, int, int]] = {
+    "small": (1_000, 1_000, 50_000),
+    "medium": (10_000, 10_000, 1_000_000),
+    "large": (100_000, 100_000, 10_000_000),
+}
+
+# Per-category share of the catalog, brand weights, median price and spec options
+CATALOG: Dict[str, Dict[str, Any]] = {
+    "Smartphones": {
+        "weight": 45,
+        "kind": "phone",
+        "median_price": 650.0,
+        "brands": {
+            "Samsung": 26, "Apple": 24, "Xiaomi": 16, "Google": 8,
+            "OnePlus": 7, "Oppo": 7, "Vivo": 6, "Motorola": 6,
+        },
+        "series": ["Galaxy", "Pro", "Ultra", "Lite", "Note", "Edge", "Neo", "Plus"],
+        "specs": {
+            "Display": ['6.1" OLED', '6.4" AMOLED', '6.7" Super Retina XDR', '6.8" Dynamic AMOLED 2X', '6.5" LCD'],
+            "Processor": ["Snapdragon 8 Gen 3", "Snapdragon 7 Gen 2", "A17 Pro chip", "Dimensity 9300", "Tensor G3", "Exynos 2400"],
+            "RAM": ["4GB", "6GB", "8GB", "12GB", "16GB"],
+            "Storage": ["64GB", "128GB", "256GB", "512GB", "1TB"],
+            "Camera": ["Dual 50MP", "Triple 48MP", "Triple 50MP with 3x zoom", "Quad 200MP"],
+            "Battery": ["3,500 mAh", "4,400 mAh", "5,000 mAh", "5,500 mAh"],
+        },
+    },
+    "Laptops": {
+        "weight": 30,
+        "kind": "laptop",
+        "median_price": 1200.0,
+        "brands": {
+            "Lenovo": 22, "HP": 18, "Dell": 17, "Apple": 14,
+            "ASUS": 13, "Acer": 9, "MSI": 4, "Microsoft": 3,
+        },
+        "series": ["Book", "Zen", "Aero", "Blade", "Flex", "Station", "Vector", "Air"],
+        "specs": {
+            "Display": ['13.3" IPS', '14" OLED', '15.6" IPS 144Hz', '16" Liquid Retina XDR', '17.3" IPS 240Hz'],
+            "Processor": ["Intel Core i5-1340P", "Intel Core i7-13700H", "Intel Core Ultra 7 155H", "Apple M3", "AMD Ryzen 7 7840HS"],
+            "RAM": ["8GB", "16GB", "32GB", "64GB"],
+            "Storage": ["256GB SSD", "512GB SSD", "1TB SSD", "2TB SSD"],
+            "Graphics": ["Integrated", "NVIDIA RTX 4050", "NVIDIA RTX 4060", "NVIDIA RTX 4070"],
+            "Battery": ["50Wh", "57Wh", "72Wh", "99Wh"],
+        },
+    },
+    "Tablets": {
+        "weight": 25,
+        "kind": "tablet",
+        "median_price": 450.0,
+        "brands": {
+            "Apple": 35, "Samsung": 25, "Lenovo": 12, "Xiaomi": 10, "Amazon": 10, "Microsoft": 8,
+        },
+        "series": ["Tab", "Pad", "Air", "Pro", "Mini", "Go", "Fire", "Plus"],
+        "specs": {
+            "Display": ['8.7" LCD', '10.9" Liquid Retina', '11" OLED', '12.4" Super AMOLED', '13" Ultra Retina XDR'],
+            "Processor": ["Apple M2", "A15 Bionic", "Snapdragon 8 Gen 2", "Dimensity 7050", "Helio G99"],
+            "RAM": ["3GB", "4GB", "8GB", "12GB", "16GB"],
+            "Storage": ["32GB", "64GB", "128GB", "256GB", "512GB"],
+            "Battery": ["6,000 mAh", "7,600 mAh", "8,840 mAh", "11,200 mAh"],
+        },
+    },
+}
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "Budi", "Siti", "Agus", "Dewi", "Rizky", "Putri",
+    "Wei", "Mei", "Hiroshi", "Yuki", "Carlos", "Maria", "Ahmed", "Fatima",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Santoso", "Wijaya", "Pratama", "Saputra", "Lestari", "Hidayat", "Chen", "Wang",
+    "Tanaka", "Sato", "Rodriguez", "Martinez", "Khan", "Ali", "Nguyen", "Kim",
+]
+BIOS = [
+    "Tech enthusiast and early adopter.",
+    "Photographer who cares about cameras.",
+    "Gamer looking for the best performance per dollar.",
+    "Student on a budget.",
+    "Software developer, always on a laptop.",
+    "Reviewing gadgets for everyday users.",
+]
+TITLE_TEMPLATES = {
+    "positive": ["Love my {name}", "Great {kind}", "Highly recommended", "Worth every penny", "Best {kind} I've owned"],
+    "neutral": ["Decent {kind}", "Good but not great", "Mixed feelings about the {name}", "Does the job"],
+    "negative": ["Disappointed", "Not worth it", "Returned my {name}", "Expected more from {brand}"],
+}
+REVIEW_STATUSES = [ReviewStatus.APPROVED, ReviewStatus.PENDING, ReviewStatus.REJECTED]
+REVIEW_STATUS_WEIGHTS = [90, 7, 3]
+
+
+def _timestamp(offset: float) -> datetime:
+    """
+    Datetime for a number of seconds into the generated history.
+    """
+    return REFERENCE_DATE - timedelta(seconds=HISTORY_SECONDS - offset)
+
+
+def _zipf_cum_weights(n: int, s: float) -> List[float]:
+    """
+    Cumulative Zipf weights 1/k^s for ranks 1..n, for random.choices().
+    """
+    return list(accumulate(k ** -s for k in range(1, n + 1)))
+
+
+def _next_id(db: Session, table: Table) -> int:
+    return (db.scalar(select(func.max(table.c.id))) or 0) + 1
+
+
+class _Timer:
+    """Rows written and time spent per table."""
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def add(self, table: str, rows: int, seconds: float) -> None:
+        entry = self.stats.setdefault(table, {"rows": 0, "seconds": 0.0})
+        entry["rows"] += rows
+        entry["seconds"] += seconds
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        for entry in self.stats.values():
+            entry["rows_per_sec"] = entry["rows"] / entry["seconds"] if entry["seconds"] else 0.0
+        return self.stats
+
+
+def _write(db: Session, table: Table, rows: Sequence[Dict[str, Any]]) -> None:
+    if rows:
+        db.execute(insert(table), rows)
+
+
+def generate(
+    db: Session,
+    *,
+    users: int,
+    gadgets: int,
+    reviews: int,
+    seed: int = 42,
+    zipf: float = 1.1,
+    batch_size: int = 5000,
+    password: str = "password123",
+) -> Dict[str, Dict[str, float]]:
+    """
+    Append a synthetic dataset to the database, one transaction per batch.
+
+    Reviews only reference the users and gadgets generated in the same run,
+    one per (user, gadget) pair at most. Returns rows, seconds and rows/sec
+    per table.
+    """
+    if reviews > users * gadgets:
+        raise ValueError(f"{reviews} reviews need more than {users} users x {gadgets} gadgets")
+    rng = random.Random(seed)
+    timer = _Timer()
+    user_table, gadget_table = User.__table__, Gadget.__table__
+    spec_table, review_table = GadgetSpec.__table__, Review.__table__
+
+    # Users: one bcrypt hash for all of them
+    hashed_password = get_password_hash(password)
+    first_user_id = _next_id(db, user_table)
+    user_joined: List[float] = []
+    for start in range(0, users, batch_size):
+        started = time.perf_counter()
+        rows = []
+        for user_id in range(first_user_id + start, first_user_id + min(start + batch_size, users)):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            username = f"{first.lower()}{last.lower()[0]}_{user_id}"
+            joined = rng.random() * HISTORY_SECONDS * 0.9
+            user_joined.append(joined)
+            rows.append({
+                "id": user_id,
+                "email": f"{username}@example.com",
+                "username": username,
+                "hashed_password": hashed_password,
+                "full_name": f"{first} {last}",
+                "bio": rng.choice(BIOS) if rng.random() < 0.3 else None,
+                "profile_photo": None,
+                "is_admin": False,
+                "joined_date": _timestamp(joined),
+            })
+        _write(db, user_table, rows)
+        db.commit()
+        timer.add("users", len(rows), time.perf_counter() - started)
+    logger.info("Generated %d users", users)
+
+    # Gadgets and their specs, with lookups resolved once per category and brand
+    categories = list(CATALOG)
+    category_weights = [CATALOG[name]["weight"] for name in categories]
+    category_rows = crud.gadget.lookup_rows(
+        db, Category, {category_key(name): name for name in categories}
+    )
+    brand_rows = crud.gadget.lookup_rows(db, Brand, {
+        brand_key(brand): brand for spec in CATALOG.values() for brand in spec["brands"]
+    })
+    db.commit()
+
+    first_gadget_id = _next_id(db, gadget_table)
+    next_spec_id = _next_id(db, spec_table)
+    model_numbers: Dict[str, int] = {}
+    # Per gadget: (release offset, rating quality, name, brand, kind)
+    gadget_info: List[Tuple[float, float, str, str, str]] = []
+    for start in range(0, gadgets, batch_size):
+        started = time.perf_counter()
+        rows, spec_rows = [], []
+        for gadget_id in range(first_gadget_id + start, first_gadget_id + min(start + batch_size, gadgets)):
+            category = rng.choices(categories, category_weights)[0]
+            spec = CATALOG[category]
+            brand = rng.choices(list(spec["brands"]), list(spec["brands"].values()))[0]
+            model_numbers[brand] = model_numbers.get(brand, 0) + 1
+            name = f"{brand} {rng.choice(spec['series'])} {model_numbers[brand]}"
+            price = max(49.99, round(spec["median_price"] * math.exp(rng.gauss(0, 0.45))) - 0.01)
+            released = rng.random() * HISTORY_SECONDS * 0.95
+            values = {spec_name: rng.choice(options) for spec_name, options in spec["specs"].items()}
+            gadget_info.append((released, rng.gauss(3.8, 0.6), name, brand, spec["kind"]))
+
+            category_id, category_name = category_rows[category_key(category)]
+            brand_id, brand_name = brand_rows[brand_key(brand)]
+            created_at = _timestamp(released)
+            rows.append({
+                "id": gadget_id,
+                "name": name,
+                "brand": brand_name,
+                "category": category_name,
+                "brand_id": brand_id,
+                "category_id": category_id,
+                "description": (
+                    f"{brand} {spec['kind']} with {values['Processor']}, "
+                    f"{values['RAM']} RAM and {values['Storage']} storage."
+                ),
+                "price": price,
+                "release_date": created_at,
+                "image_url": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            for spec_name, spec_value in values.items():
+                spec_rows.append({
+                    "id": next_spec_id,
+                    "gadget_id": gadget_id,
+                    "spec_name": spec_name,
+                    "spec_value": spec_value,
+                })
+                next_spec_id += 1
+        _write(db, gadget_table, rows)
+        _write(db, spec_table, spec_rows)
+        db.commit()
+        elapsed = time.perf_counter() - started
+        timer.add("gadgets", len(rows), elapsed * len(rows) / (len(rows) + len(spec_rows)))
+        timer.add("gadget_specs", len(spec_rows), elapsed * len(spec_rows) / (len(rows) + len(spec_rows)))
+    logger.info("Generated %d gadgets", gadgets)
+
+    if not (users and gadgets):
+        return timer.report()
+
+    # Reviews: popularity ranks are shuffled so they don't follow id order
+    gadget_ranks = list(range(gadgets))
+    user_ranks = list(range(users))
+    rng.shuffle(gadget_ranks)
+    rng.shuffle(user_ranks)
+    gadget_weights = _zipf_cum_weights(gadgets, zipf)
+    user_weights = _zipf_cum_weights(users, zipf)
+    first_review_id = _next_id(db, review_table)
+    # (user, gadget) pairs already reviewed, as user_index * gadgets + gadget_index
+    reviewed = set()
+    for start in range(0, reviews, batch_size):
+        started = time.perf_counter()
+        size = min(batch_size, reviews - start)
+        picked_gadgets = rng.choices(gadget_ranks, cum_weights=gadget_weights, k=size)
+        picked_users = rng.choices(user_ranks, cum_weights=user_weights, k=size)
+        rows = []
+        for offset, (gadget_index, user_index) in enumerate(zip(picked_gadgets, picked_users)):
+            # A repeat pair is redrawn from the same Zipf distributions
+            while user_index * gadgets + gadget_index in reviewed:
+                gadget_index = rng.choices(gadget_ranks, cum_weights=gadget_weights)[0]
+                user_index = rng.choices(user_ranks, cum_weights=user_weights)[0]
+            reviewed.add(user_index * gadgets + gadget_index)
+            released, quality, name, brand, kind = gadget_info[gadget_index]
+            rating = min(5, max(1, round(rng.gauss(quality, 0.9))))
+            sentiment = "positive" if rating >= 4 else "neutral" if rating == 3 else "negative"
+            earliest = max(released, user_joined[user_index])
+            created_at = _timestamp(earliest + rng.random() * (HISTORY_SECONDS - earliest))
+            rows.append({
+                "id": first_review_id + start + offset,
+                "user_id": first_user_id + user_index,
+                "gadget_id": first_gadget_id + gadget_index,
+                "title": rng.choice(TITLE_TEMPLATES[sentiment]).format(name=name, brand=brand, kind=kind),
+                "content": rng.choice(REVIEW_TEMPLATES[sentiment]),
+                "rating": float(rating),
+                "pros": rng.choice(PROS_TEMPLATES) if rng.random() < 0.6 else None,
+                "cons": rng.choice(CONS_TEMPLATES) if rng.random() < 0.4 else None,
+                "status": rng.choices(REVIEW_STATUSES, REVIEW_STATUS_WEIGHTS)[0],
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+        _write(db, review_table, rows)
+        db.commit()
+        timer.add("reviews", size, time.perf_counter() - started)
+        if (start // batch_size) % 20 == 19:
+            stats = timer.stats["reviews"]
+            logger.info(
+                "Generated %d/%d reviews (%.0f rows/sec)",
+                stats["rows"], reviews, stats["rows"] / stats["seconds"],
+            )
+    logger.info("Generated %d reviews", reviews)
+    return timer.report()
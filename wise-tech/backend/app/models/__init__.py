@@ -3,5 +3,5 @@ Models package initialization.
 """
 
 from app.models.user import User
-from app.models.gadget import Gadget, GadgetSpec
+from app.models.gadget import Brand, Category, Gadget, GadgetSpec
 from app.models.review import Review
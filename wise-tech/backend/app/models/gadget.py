@@ -3,7 +3,7 @@ Database model for gadgets.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -18,6 +18,8 @@ class Gadget(Base):
     name = Column(String, index=True, nullable=False)
     brand = Column(String, index=True, nullable=False)
     category = Column(String, index=True, nullable=False)  # smartphone, laptop, tablet
+    brand_id = Column(Integer, ForeignKey("brands.id"), index=True, nullable=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), index=True, nullable=True)
     description = Column(Text, nullable=False)
     price = Column(Float, nullable=False)
     release_date = Column(DateTime, nullable=False)
@@ -27,6 +29,8 @@ class Gadget(Base):
     
     # Relationships
     specs = relationship("GadgetSpec", back_populates="gadget", cascade="all, delete-orphan")
+    brand_ref = relationship("Brand", back_populates="gadgets")
+    category_ref = relationship("Category", back_populates="gadgets")
     reviews = relationship("Review", back_populates="gadget", cascade="all, delete-orphan")
     
     # Method for calculating average rating
@@ -37,6 +41,13 @@ class Gadget(Base):
         return sum(review.rating for review in self.reviews) / len(self.reviews)
 
 
+# Admin gadget listing sort orders (see crud.gadget.GADGET_SORTS)
+Index("ix_gadgets_created_at_id", Gadget.created_at, Gadget.id)
+Index("ix_gadgets_price_id", Gadget.price, Gadget.id)
+# Natural key used by bulk imports to match existing gadgets
+Index("ix_gadgets_brand_id_name", Gadget.brand_id, Gadget.name, unique=True)
+
+
 class GadgetSpec(Base):
     """Specifications for gadgets."""
     
@@ -49,3 +60,29 @@ class GadgetSpec(Base):
     
     # Relationships
     gadget = relationship("Gadget", back_populates="specs")
+
+
+class Category(Base):
+    """Lookup table for gadget categories."""
+
+    __tablename__ = "categories"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String, unique=True, index=True, nullable=False)  # e.g. "smartphone"
+    name = Column(String, nullable=False)  # e.g. "Smartphones"
+
+    # Relationships
+    gadgets = relationship("Gadget", back_populates="category_ref")
+
+
+class Brand(Base):
+    """Lookup table for gadget brands."""
+
+    __tablename__ = "brands"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String, unique=True, index=True, nullable=False)  # e.g. "samsung"
+    name = Column(String, nullable=False)  # e.g. "Samsung"
+
+    # Relationships
+    gadgets = relationship("Gadget", back_populates="brand_ref")
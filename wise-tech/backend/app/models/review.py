@@ -3,7 +3,7 @@ Database model for reviews.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text, Enum
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Text, Enum
 from sqlalchemy.orm import relationship
 import enum
 
@@ -23,8 +23,8 @@ class Review(Base):
     __tablename__ = "reviews"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    gadget_id = Column(Integer, ForeignKey("gadgets.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    gadget_id = Column(Integer, ForeignKey("gadgets.id"), index=True, nullable=False)
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     rating = Column(Float, nullable=False)  # 1-5 star rating
@@ -37,3 +37,17 @@ class Review(Base):
     # Relationships
     user = relationship("User", back_populates="reviews")
     gadget = relationship("Gadget", back_populates="reviews")
+
+
+# Composite indexes matching the review listing sort orders (see crud.review.REVIEW_SORTS),
+# so keyset pagination can seek straight to the next page
+Index("ix_reviews_created_at_id", Review.created_at, Review.id)
+Index("ix_reviews_rating_created_at_id", Review.rating, Review.created_at, Review.id)
+Index(
+    "ix_reviews_rating_asc_created_at_desc",
+    Review.rating,
+    Review.created_at.desc(),
+    Review.id.desc(),
+)
+# Admin moderation queue: reviews of one status, newest first
+Index("ix_reviews_status_created_at_id", Review.status, Review.created_at, Review.id)
@@ -3,7 +3,7 @@ Database model for users.
 """
 
 from datetime import datetime
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -26,3 +26,7 @@ class User(Base):
     
     # Relationships
     reviews = relationship("Review", back_populates="user")
+
+
+# Admin user listing sorted by join date (see crud.user.USER_SORTS)
+Index("ix_users_joined_date_id", User.joined_date, User.id)
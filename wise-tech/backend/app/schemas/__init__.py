@@ -1,4 +1,6 @@
 # Schemas package initialization
-from app.schemas.user import User, UserCreate, UserAdminCreate, UserUpdate, UserAdminUpdate, Token, TokenPayload
-from app.schemas.gadget import Gadget, GadgetCreate, GadgetUpdate, GadgetWithReviews, GadgetSpec, ReviewInGadget
-from app.schemas.review import Review, ReviewCreate, ReviewUpdate, ReviewWithDetails, ReviewPaginatedResponse
+from app.schemas.user import User, UserCreate, UserAdminCreate, UserUpdate, UserAdminUpdate, UserBulkCreate, UserBulkCreateReport, Token, TokenPayload
+from app.schemas.gadget import Gadget, GadgetCreate, GadgetUpdate, GadgetWithReviews, GadgetSpec, ReviewInGadget, CategoryWithCount, GadgetBatch, GadgetReviewStats, GadgetReviewStatsBatch, GadgetImportRow, GadgetImportReport
+from app.schemas.review import Review, ReviewCreate, ReviewUpdate, ReviewWithDetails, ReviewPaginatedResponse, ReviewBulkModeration, ReviewModerationResult
+from app.schemas.home import HomePage
+from app.schemas.batch import BatchRequest, BatchResponse
@@ -0,0 +1,32 @@
+"""
+Pydantic schemas for batched API requests.
+"""
+
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SubRequest(BaseModel):
+    """Schema for one request inside a batch."""
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(..., pattern=r"^/")  # e.g. /api/users/profile?skip=0
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None  # Sent as JSON
+
+
+class BatchRequest(BaseModel):
+    """Schema for a batch of API requests."""
+    requests: List[SubRequest]
+
+
+class SubResponse(BaseModel):
+    """Schema for the response to one request of a batch."""
+    status: int
+    headers: Dict[str, str]
+    body: Any = None  # Decoded JSON, or text for other content types
+
+
+class BatchResponse(BaseModel):
+    """Schema for batch response, in request order."""
+    responses: List[SubResponse]
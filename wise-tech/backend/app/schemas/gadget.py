@@ -3,9 +3,9 @@ Pydantic schemas for gadget-related API operations.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class GadgetSpecBase(BaseModel):
@@ -30,8 +30,7 @@ class GadgetSpecInDBBase(GadgetSpecBase):
     id: int
     gadget_id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GadgetSpec(GadgetSpecInDBBase):
@@ -39,30 +38,56 @@ class GadgetSpec(GadgetSpecInDBBase):
     pass
 
 
+class CategoryWithCount(BaseModel):
+    """Schema for a gadget category with the number of gadgets in it."""
+    id: int
+    key: str
+    name: str
+    gadget_count: int = 0
+
+
 class GadgetBase(BaseModel):
     """Base schema for gadget."""
     name: str
     brand: str
     category: str
     description: str
-    price: float
+    price: float = Field(ge=0, description="Price cannot be negative")
     image_url: Optional[str] = None
 
-    @validator('price')
-    def validate_price(cls, v):
-        if v < 0:
-            raise ValueError('Price cannot be negative')
-        return v
-
 
 class GadgetCreate(GadgetBase):
     """Schema for creating a gadget."""
     release_date: datetime
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+
+
+class GadgetImportRow(GadgetCreate):
+    """Schema for one row of a bulk gadget import, keyed on brand and name."""
+    specs: Dict[str, str] = {}  # spec name -> value; replaces existing specs when given
+
+    @field_validator("specs", mode="before")
+    @classmethod
+    def specs_as_dict(cls, value: Any) -> Any:
+        # Also accept the [{"name": ..., "value": ...}] list used by POST /gadgets
+        if isinstance(value, list) and all(
+            isinstance(spec, dict) and {"name", "value"} <= spec.keys() for spec in value
+        ):
+            return {spec["name"]: spec["value"] for spec in value}
+        return value
+
+
+class GadgetImportError(BaseModel):
+    """Schema for a rejected import row."""
+    line: int
+    errors: List[str]
+
+
+class GadgetImportReport(BaseModel):
+    """Schema for the result of a bulk gadget import."""
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[GadgetImportError] = []
 
 
 class GadgetUpdate(BaseModel):
@@ -71,16 +96,10 @@ class GadgetUpdate(BaseModel):
     brand: Optional[str] = None
     category: Optional[str] = None
     description: Optional[str] = None
-    price: Optional[float] = None
+    price: Optional[float] = Field(None, ge=0, description="Price cannot be negative")
     release_date: Optional[datetime] = None
     image_url: Optional[str] = None
 
-    @validator('price')
-    def validate_price(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('Price cannot be negative')
-        return v
-
 
 class GadgetInDBBase(GadgetBase):
     """Base schema for gadget in database."""
@@ -89,8 +108,7 @@ class GadgetInDBBase(GadgetBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Gadget(GadgetInDBBase):
@@ -100,6 +118,26 @@ class Gadget(GadgetInDBBase):
     review_count: int = 0
 
 
+class GadgetBatch(BaseModel):
+    """Schema for a batch gadget fetch, in request order."""
+    gadgets: List[Optional[Gadget]]  # None where the requested id was not found
+    missing: List[int]
+
+
+class GadgetReviewStats(BaseModel):
+    """Schema for review statistics of one gadget."""
+    gadget_id: int
+    review_count: int = 0
+    average_rating: float = 0
+    last_review_at: Optional[datetime] = None
+
+
+class GadgetReviewStatsBatch(BaseModel):
+    """Schema for review statistics of many gadgets, in request order."""
+    stats: List[Optional[GadgetReviewStats]]  # None where the requested id was not found
+    missing: List[int]
+
+
 class ReviewInGadget(BaseModel):
     """Simplified review schema for inclusion in gadget response."""
     id: int
@@ -112,9 +150,8 @@ class ReviewInGadget(BaseModel):
     created_at: datetime
     updated_at: datetime
     user_name: str
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GadgetWithReviews(Gadget):
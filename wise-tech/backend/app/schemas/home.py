@@ -0,0 +1,17 @@
+"""
+Pydantic schemas for the home page API.
+"""
+
+from typing import List
+
+from pydantic import BaseModel
+
+from app.schemas.gadget import CategoryWithCount, Gadget
+from app.schemas.review import Review
+
+
+class HomePage(BaseModel):
+    """Schema for the composite home page response."""
+    featured: List[Gadget]  # Top-rated gadgets, with review counts
+    recent_reviews: List[Review]
+    categories: List[CategoryWithCount]
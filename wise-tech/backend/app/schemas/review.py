@@ -5,7 +5,7 @@ Pydantic schemas for review-related API operations.
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 from app.models.review import ReviewStatus
 
 
@@ -42,8 +42,7 @@ class ReviewInDBBase(ReviewBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Review(ReviewInDBBase):
@@ -65,10 +64,59 @@ class ReviewStatusUpdate(BaseModel):
     status: ReviewStatus
 
 
+class ReviewModerationFilter(BaseModel):
+    """Filter selecting the reviews to moderate; same criteria as the admin listing."""
+    search: Optional[str] = None
+    status: Optional[ReviewStatus] = None
+    category: Optional[str] = None
+    user_id: Optional[int] = None
+    gadget_id: Optional[int] = None
+    min_rating: Optional[float] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    @field_validator("search", "category", mode="before")
+    @classmethod
+    def blank_as_none(cls, value: Any) -> Any:
+        # A blank term matches everything, so it is no criterion at all
+        if isinstance(value, str):
+            value = value.strip()
+            return value or None
+        return value
+
+
+class ReviewBulkModeration(BaseModel):
+    """Schema for setting the status of many reviews at once (admin only)."""
+    status: ReviewStatus
+    ids: Optional[List[int]] = None
+    filter: Optional[ReviewModerationFilter] = None
+
+    @model_validator(mode="after")
+    def check_target(self) -> "ReviewBulkModeration":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide either ids or filter")
+        if self.ids is not None and not self.ids:
+            raise ValueError("ids must not be empty")
+        # An empty filter would moderate every review
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("filter needs at least one criterion")
+        return self
+
+
+class ReviewModerationResult(BaseModel):
+    """Schema for bulk moderation response."""
+    status: ReviewStatus
+    updated: int
+    gadget_ids: List[int]  # Gadgets whose rating aggregates were refreshed
+    not_found: List[int] = []  # Requested ids that matched no review
+
+
 class ReviewPaginatedResponse(BaseModel):
     """Schema for paginated review response."""
     reviews: List[Review]
-    total: int
-    total_pages: int
-    current_page: int
+    total: Optional[int] = None  # None when count=none; approximate when count=estimate
+    total_pages: Optional[int] = None
+    current_page: Optional[int] = None  # None when paging by cursor
     limit: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Opaque cursor for the next page, if any
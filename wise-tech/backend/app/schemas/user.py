@@ -5,7 +5,7 @@ Pydantic schemas for user-related API operations.
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class UserBase(BaseModel):
@@ -50,9 +50,8 @@ class UserInDBBase(UserBase):
     id: int
     joined_date: datetime
     is_admin: bool = False
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class User(UserInDBBase):
@@ -65,6 +64,26 @@ class UserInDB(UserInDBBase):
     hashed_password: str
 
 
+class UserBulkCreate(BaseModel):
+    """Schema for creating many users at once (admin only)."""
+    users: List[UserAdminCreate]
+
+
+class UserBulkCreateError(BaseModel):
+    """A user rejected by bulk creation, by position in the request."""
+    index: int
+    email: Optional[str] = None
+    errors: List[str]
+
+
+class UserBulkCreateReport(BaseModel):
+    """Schema for bulk user creation response."""
+    created: int
+    failed: int
+    users: List[User]
+    errors: List[UserBulkCreateError]
+
+
 class Token(BaseModel):
     """Schema for access token."""
     access_token: str
@@ -0,0 +1,338 @@
+"""
+Request scenarios for bench_api.py, one per API route.
+
+Imported by the benchmark worker only, after DATABASE_URL points at the
+scratch copy of the dataset. Destructive requests (DELETE, creating reviews
+on a user's behalf, ...) each get their own row from a pool inserted directly
+into the database before the run, so every request does the same amount of
+work and none of them hit a 404.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import Table, create_engine, func, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import crud, schemas
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db import snapshot, synthetic
+from app.db.base_class import Base
+from app.db.migrate import stamp_head
+from app.models.gadget import Brand, Category, Gadget
+from app.models.review import Review, ReviewStatus
+from app.models.user import User
+
+ADMIN_EMAIL = "bench.admin@example.com"
+PASSWORD = "password123"
+# Smallest valid PNG, for profile photo uploads
+PNG_1X1 = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+def ensure_dataset(scale: str, seed: int) -> Path:
+    """
+    SQLite file with the synthetic dataset for a scale, generated on first use.
+
+    Named after the fingerprint of the generator, the CRUD/security code it
+    writes through and the schema, like the sample data snapshots, so it is
+    rebuilt when any of them changes.
+    """
+    source = snapshot.fingerprint(Path(synthetic.__file__))
+    path = Path(settings.SNAPSHOT_DIR) / f"bench-{scale}-seed{seed}-{source}.db"
+    if path.exists():
+        return path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    building = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    building.unlink(missing_ok=True)
+    users, gadgets, reviews = synthetic.SCALES[scale]
+    engine = create_engine(f"sqlite:///{building}")
+    try:
+        with engine.begin() as connection:
+            Base.metadata.create_all(bind=connection)
+            stamp_head(connection)
+        with sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as db:
+            synthetic.generate(db, users=users, gadgets=gadgets, reviews=reviews, seed=seed, password=PASSWORD)
+            admin = schemas.UserAdminCreate(
+                email=ADMIN_EMAIL,
+                username="bench_admin",
+                password=PASSWORD,
+                full_name="Benchmark Admin",
+                is_admin=True,
+            )
+            crud.user.bulk_create(db, users=[admin])
+    finally:
+        engine.dispose()
+    os.replace(building, path)
+    return path
+
+
+@dataclass
+class Context:
+    """What scenarios need to know about the dataset."""
+    gadget_ids: List[int]
+    categories: List[str]
+    brands: List[str]
+    user_id: int
+    admin_id: int
+    hashed_password: str
+    sample_gadget: Dict[str, Any]
+    tokens: Dict[str, str] = field(default_factory=dict)
+
+    def gadget(self, i: int) -> int:
+        """A gadget id spread over the whole catalog, the same for every run."""
+        return self.gadget_ids[(i * 2654435761) % len(self.gadget_ids)]
+
+    def gadgets(self, i: int, n: int) -> List[int]:
+        return [self.gadget(i * n + k) for k in range(n)]
+
+
+def load_context(db: Session) -> Context:
+    admin_id = db.scalar(select(User.id).where(User.email == ADMIN_EMAIL))
+    # A typical active reviewer rather than the single most active one
+    by_activity = (
+        select(Review.user_id)
+        .group_by(Review.user_id)
+        .order_by(func.count().desc(), Review.user_id)
+    )
+    user_id = db.scalar(by_activity.offset(99).limit(1)) or db.scalar(by_activity.limit(1))
+    sample = db.execute(
+        select(Gadget.brand, Gadget.category, Gadget.brand_id, Gadget.category_id).limit(1)
+    ).mappings().one()
+    context = Context(
+        gadget_ids=list(db.scalars(select(Gadget.id).order_by(Gadget.id))),
+        categories=list(db.scalars(select(Category.name).order_by(Category.id))),
+        brands=list(db.scalars(select(Brand.name).order_by(Brand.id))),
+        user_id=user_id,
+        admin_id=admin_id,
+        hashed_password=db.scalar(select(User.hashed_password).where(User.id == user_id)),
+        sample_gadget=dict(sample),
+    )
+    context.tokens = {
+        "user": create_access_token(user_id),
+        "admin": create_access_token(admin_id),
+    }
+    return context
+
+
+def _insert_pool(db: Session, table: Table, count: int, row: Callable[[int], Dict[str, Any]]) -> List[int]:
+    """
+    Insert count rows with explicit ids and return the ids.
+    """
+    first = (db.scalar(select(func.max(table.c.id))) or 0) + 1
+    ids = list(range(first, first + count))
+    if ids:
+        db.execute(insert(table), [{"id": row_id, **row(row_id)} for row_id in ids])
+        db.commit()
+    return ids
+
+
+def review_pool(db: Session, ctx: Context, count: int) -> List[int]:
+    """Reviews by the benchmark user."""
+    return _insert_pool(db, Review.__table__, count, lambda row_id: {
+        "user_id": ctx.user_id,
+        "gadget_id": ctx.gadget(row_id),
+        "title": f"Pool review {row_id}",
+        "content": "Written for the benchmark.",
+        "rating": 4.0,
+        "status": ReviewStatus.APPROVED,
+        "created_at": synthetic.REFERENCE_DATE,
+        "updated_at": synthetic.REFERENCE_DATE,
+    })
+
+
+def gadget_pool(db: Session, ctx: Context, count: int) -> List[int]:
+    """Gadgets without reviews or specs."""
+    return _insert_pool(db, Gadget.__table__, count, lambda row_id: {
+        **ctx.sample_gadget,
+        "name": f"Pool gadget {row_id}",
+        "description": "Created for the benchmark.",
+        "price": 199.0,
+        "release_date": synthetic.REFERENCE_DATE,
+        "created_at": synthetic.REFERENCE_DATE,
+        "updated_at": synthetic.REFERENCE_DATE,
+    })
+
+
+def _user_row(ctx: Context, row_id: int, **values: Any) -> Dict[str, Any]:
+    return {
+        "email": f"pool{row_id}@example.com",
+        "username": f"pool_{row_id}",
+        "hashed_password": ctx.hashed_password,
+        "full_name": f"Pool User {row_id}",
+        "is_admin": False,
+        "joined_date": synthetic.REFERENCE_DATE,
+        **values,
+    }
+
+
+def user_pool(db: Session, ctx: Context, count: int) -> List[int]:
+    """Users without reviews."""
+    return _insert_pool(db, User.__table__, count, lambda row_id: _user_row(ctx, row_id))
+
+
+def photo_user_pool(db: Session, ctx: Context, count: int) -> List[str]:
+    """Tokens of users who have a profile photo."""
+    ids = _insert_pool(db, User.__table__, count, lambda row_id: _user_row(
+        ctx, row_id, profile_photo=f"/uploads/profile_photos/pool-{row_id}.png"
+    ))
+    return [create_access_token(user_id) for user_id in ids]
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmarked route.
+
+    build(ctx, i, item) returns the httpx request arguments for request i
+    (path, params, json, data, files, headers); item is the i-th pool row.
+    """
+    route: str  # "METHOD /path", as the app lists it
+    build: Callable[[Context, int, Any], Dict[str, Any]] = lambda ctx, i, item: {}
+    auth: Optional[str] = None  # "user" or "admin"
+    pool: Optional[Callable[[Session, Context, int], List[Any]]] = None
+    max_requests: Optional[int] = None  # for bcrypt-bound or full-table requests
+
+    @property
+    def method(self) -> str:
+        return self.route.split(" ", 1)[0]
+
+    @property
+    def path(self) -> str:
+        return self.route.split(" ", 1)[1]
+
+
+def _new_gadget(i: int, ctx: Context) -> Dict[str, Any]:
+    return {
+        "name": f"Bench Gadget {i}",
+        "brand": ctx.brands[i % len(ctx.brands)],
+        "category": ctx.categories[i % len(ctx.categories)],
+        "description": "Created by the benchmark.",
+        "price": 99.0 + i,
+        "release_date": "2025-01-01T00:00:00",
+    }
+
+
+def _import_file(ctx: Context, i: int) -> Dict[str, Any]:
+    lines = [
+        json.dumps({**_new_gadget(i * 10 + k, ctx), "name": f"Imported {i}-{k}", "specs": {"RAM": "8GB"}})
+        for k in range(10)
+    ]
+    return {"files": {"file": ("gadgets.ndjson", "\n".join(lines).encode(), "application/x-ndjson")}}
+
+
+def _new_user(tag: str, i: int) -> Dict[str, Any]:
+    return {
+        "email": f"{tag}{i}@example.com",
+        "username": f"{tag}_{i}",
+        "password": PASSWORD,
+        "full_name": f"Bench {tag.title()} {i}",
+    }
+
+
+SCENARIOS: List[Scenario] = [
+    # auth
+    Scenario("POST /api/auth/login", lambda ctx, i, item: {
+        "data": {"username": ADMIN_EMAIL, "password": PASSWORD},
+    }, max_requests=20),
+    Scenario("POST /api/auth/register", lambda ctx, i, item: {"json": _new_user("register", i)}, max_requests=20),
+    Scenario("POST /api/auth/logout", auth="user"),
+    Scenario("GET /api/auth/me", auth="user"),
+    # users
+    Scenario("GET /api/users/profile", auth="user"),
+    Scenario("PUT /api/users/profile", lambda ctx, i, item: {"json": {"bio": f"Benchmark bio {i}"}}, auth="user"),
+    Scenario("GET /api/users/reviews", auth="user"),
+    Scenario("POST /api/users/profile/photo", lambda ctx, i, item: {
+        "files": {"file": ("photo.png", PNG_1X1, "image/png")},
+    }, auth="user"),
+    Scenario("DELETE /api/users/profile/photo", lambda ctx, i, item: {
+        "headers": {"Authorization": f"Bearer {item}"},
+    }, pool=photo_user_pool),
+    # gadgets
+    Scenario("GET /api/gadgets", lambda ctx, i, item: {
+        "params": {
+            "skip": i % 10 * 20,
+            "limit": 20,
+            **({"category": ctx.categories[i % len(ctx.categories)]} if i % 2 else {}),
+        },
+    }),
+    Scenario("GET /api/gadgets/search", lambda ctx, i, item: {
+        "params": {"query": ctx.brands[i % len(ctx.brands)], "limit": 20},
+    }),
+    Scenario("GET /api/gadgets/featured"),
+    Scenario("GET /api/gadgets/categories"),
+    Scenario("GET /api/gadgets/categories/{category}/stats", lambda ctx, i, item: {
+        "path": f"/api/gadgets/categories/{ctx.categories[i % len(ctx.categories)]}/stats",
+    }, max_requests=50),
+    Scenario("GET /api/gadgets/all", lambda ctx, i, item: {"params": {"limit": 100}}),
+    Scenario("GET /api/gadgets/batch", lambda ctx, i, item: {
+        "params": {"ids": ",".join(map(str, ctx.gadgets(i, 20)))},
+    }),
+    Scenario("GET /api/gadgets/stats", lambda ctx, i, item: {
+        "params": {"ids": ",".join(map(str, ctx.gadgets(i, 20)))},
+    }),
+    Scenario("GET /api/gadgets/{id}", lambda ctx, i, item: {"path": f"/api/gadgets/{ctx.gadget(i)}"}),
+    Scenario("GET /api/gadgets/{id}/reviews", lambda ctx, i, item: {"path": f"/api/gadgets/{ctx.gadget(i)}/reviews"}),
+    Scenario("POST /api/gadgets", lambda ctx, i, item: {"json": {
+        "gadget_in": _new_gadget(i, ctx), "specs": [{"name": "RAM", "value": "8GB"}],
+    }}, auth="admin"),
+    Scenario("PUT /api/gadgets/{id}", lambda ctx, i, item: {
+        "path": f"/api/gadgets/{item}", "json": {"price": 100.0 + i},
+    }, auth="admin", pool=gadget_pool),
+    Scenario("DELETE /api/gadgets/{id}", lambda ctx, i, item: {"path": f"/api/gadgets/{item}"}, auth="admin", pool=gadget_pool),
+    # reviews
+    Scenario("GET /api/reviews", lambda ctx, i, item: {"params": {"page": i % 10 + 1, "limit": 20}}),
+    Scenario("GET /api/reviews/recent"),
+    Scenario("POST /api/reviews", lambda ctx, i, item: {"json": {
+        "gadget_id": ctx.gadget(i), "title": f"Bench review {i}", "content": "Benchmark review.", "rating": 4,
+    }}, auth="user"),
+    Scenario("PUT /api/reviews/{id}", lambda ctx, i, item: {
+        "path": f"/api/reviews/{item}", "json": {"rating": i % 5 + 1},
+    }, auth="user", pool=review_pool),
+    Scenario("DELETE /api/reviews/{id}", lambda ctx, i, item: {"path": f"/api/reviews/{item}"}, auth="user", pool=review_pool),
+    # admin
+    Scenario("GET /api/admin/users", lambda ctx, i, item: {"params": {"limit": 20}}, auth="admin"),
+    Scenario("POST /api/admin/users", lambda ctx, i, item: {"json": _new_user("admincreated", i)}, auth="admin", max_requests=20),
+    Scenario("POST /api/admin/users/bulk", lambda ctx, i, item: {
+        "json": {"users": [_new_user("bulk", i * 5 + k) for k in range(5)]},
+    }, auth="admin", max_requests=10),
+    Scenario("PUT /api/admin/users/{id}", lambda ctx, i, item: {
+        "path": f"/api/admin/users/{item}", "json": {"full_name": f"Renamed {i}"},
+    }, auth="admin", pool=user_pool),
+    Scenario("DELETE /api/admin/users/{id}", lambda ctx, i, item: {"path": f"/api/admin/users/{item}"}, auth="admin", pool=user_pool),
+    Scenario("PUT /api/admin/reviews/{id}", lambda ctx, i, item: {
+        "path": f"/api/admin/reviews/{item}", "json": {"status": "rejected" if i % 2 else "approved"},
+    }, auth="admin", pool=review_pool),
+    Scenario("POST /api/admin/reviews/moderate", lambda ctx, i, item: {
+        "json": {"status": "pending" if i % 2 else "approved", "ids": [item]},
+    }, auth="admin", pool=review_pool),
+    Scenario("DELETE /api/admin/reviews/{id}", lambda ctx, i, item: {"path": f"/api/admin/reviews/{item}"}, auth="admin", pool=review_pool),
+    Scenario("GET /api/admin/dashboard/stats", auth="admin"),
+    Scenario("GET /api/admin/reviews", lambda ctx, i, item: {"params": {"limit": 20}}, auth="admin"),
+    Scenario("GET /api/admin/gadgets", lambda ctx, i, item: {"params": {"limit": 20}}, auth="admin"),
+    Scenario("POST /api/admin/gadgets", lambda ctx, i, item: {
+        "json": {**_new_gadget(i, ctx), "name": f"Admin Gadget {i}"},
+    }, auth="admin"),
+    Scenario("POST /api/admin/gadgets/import", lambda ctx, i, item: _import_file(ctx, i), auth="admin", max_requests=50),
+    Scenario("PUT /api/admin/gadgets/{id}", lambda ctx, i, item: {
+        "path": f"/api/admin/gadgets/{item}", "json": {"price": 150.0 + i},
+    }, auth="admin", pool=gadget_pool),
+    Scenario("DELETE /api/admin/gadgets/{id}", lambda ctx, i, item: {"path": f"/api/admin/gadgets/{item}"}, auth="admin", pool=gadget_pool),
+    Scenario("GET /api/admin/export/{resource}", lambda ctx, i, item: {
+        "path": "/api/admin/export/gadgets", "params": {"format": "ndjson"},
+    }, auth="admin", max_requests=10),
+    # home and batch
+    Scenario("GET /api/home"),
+    Scenario("POST /api/batch", lambda ctx, i, item: {"json": {"requests": [
+        {"path": "/api/users/profile"},
+        {"path": f"/api/gadgets/{ctx.gadget(i)}"},
+        {"path": "/api/reviews/recent"},
+    ]}}, auth="user"),
+]
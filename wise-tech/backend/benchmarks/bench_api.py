@@ -0,0 +1,449 @@
+"""
+Benchmark every API endpoint at several dataset sizes.
+
+Each dataset is generated once by app.db.synthetic (cached in SNAPSHOT_DIR,
+keyed by scale, seed and the generator/schema fingerprint), and every run
+works on a scratch copy of it in a separate worker process. Requests go
+through httpx's ASGI transport (in-process, no network) and through a real
+uvicorn server. Per route it reports p50/p95/p99 latency of sequential
+requests, cold (every in-process cache cleared before each request) and warm
+(caches filled by the warmup), and throughput with concurrent clients (see
+api_scenarios.py for what each route is sent).
+
+Results can be saved as JSON baselines in benchmarks/baselines/ (one file
+per transport and scale, machine-specific, so record them on the machine
+you compare on) and later runs checked against them.
+
+Run from the backend directory:
+    python benchmarks/bench_api.py                                   # small dataset, both transports
+    python benchmarks/bench_api.py --scales small medium --save-baseline
+    python benchmarks/bench_api.py --check --threshold 0.25          # exit 1 on regressions
+    python benchmarks/bench_api.py --only /api/gadgets --transports asgi
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+# Add parent directory to Python path
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.db.synthetic import SCALES
+
+TRANSPORTS = ("asgi", "uvicorn")
+# Shared by the worker and the uvicorn server, so tokens minted by one are
+# accepted by the other
+BENCH_SECRET_KEY = "benchmark-secret-key"
+SERVER_START_TIMEOUT = 60  # seconds
+# Only mounted on the benchmark's own uvicorn server, whose caches live in
+# another process
+CLEAR_CACHES_PATH = "/__bench__/clear-caches"
+# Metrics compared against baselines; p99 of a few hundred samples is too noisy
+CHECKED_LATENCIES = ("p50_ms", "p95_ms", "cold_p50_ms", "cold_p95_ms")
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("bench_api")
+# One line per request otherwise
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of sorted samples.
+    """
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def summarize(
+    latencies: List[float], cold_latencies: List[float], statuses: Counter, burst: int, burst_seconds: float
+) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    cold = sorted(cold_latencies)
+    return {
+        "requests": len(ordered),
+        "p50_ms": percentile(ordered, 0.50) * 1e3,
+        "p95_ms": percentile(ordered, 0.95) * 1e3,
+        "p99_ms": percentile(ordered, 0.99) * 1e3,
+        "mean_ms": sum(ordered) / len(ordered) * 1e3,
+        "cold_p50_ms": percentile(cold, 0.50) * 1e3,
+        "cold_p95_ms": percentile(cold, 0.95) * 1e3,
+        "cold_p99_ms": percentile(cold, 0.99) * 1e3,
+        "rps": burst / burst_seconds if burst_seconds else 0.0,
+        "errors": sum(count for code, count in statuses.items() if code >= 400),
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Any,
+    ctx: Any,
+    items: Optional[List[Any]],
+    clear_caches: Callable[[], Awaitable[None]],
+    *,
+    warmup: int,
+    requests: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """
+    Warm up, time requests one at a time with the caches cleared before each
+    (cold) and then left filled (warm), then measure throughput with
+    concurrent clients. Request i always uses pool item i.
+    """
+    statuses: Counter = Counter()
+    first_error: List[str] = []
+
+    async def send(i: int) -> float:
+        kwargs = scenario.build(ctx, i, items[i] if items is not None else None)
+        headers = dict(kwargs.pop("headers", {}))
+        if scenario.auth:
+            headers.setdefault("Authorization", f"Bearer {ctx.tokens[scenario.auth]}")
+        request = client.build_request(
+            scenario.method, kwargs.pop("path", scenario.path), headers=headers, **kwargs
+        )
+        started = time.perf_counter()
+        response = await client.send(request)
+        elapsed = time.perf_counter() - started
+        statuses[response.status_code] += 1
+        if response.status_code >= 400 and not first_error:
+            first_error.append(f"{response.status_code} {response.text[:200]}")
+        return elapsed
+
+    for i in range(warmup):
+        await send(i)
+    statuses.clear()
+
+    cold_latencies = []
+    for i in range(warmup, warmup + requests):
+        await clear_caches()
+        cold_latencies.append(await send(i))
+
+    # The last cold request leaves the caches filled again
+    latencies = [await send(i) for i in range(warmup + requests, warmup + 2 * requests)]
+
+    pending = iter(range(warmup + 2 * requests, warmup + 3 * requests))
+
+    async def client_loop() -> None:
+        for i in pending:
+            await send(i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(min(concurrency, requests))))
+    burst_seconds = time.perf_counter() - started
+
+    result = summarize(latencies, cold_latencies, statuses, requests, burst_seconds)
+    if first_error:
+        result["first_error"] = first_error[0]
+    return result
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_for_server(process: subprocess.Popen, base_url: str) -> None:
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+            try:
+                await client.get("/")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError("uvicorn did not start in time")
+
+
+async def drive(args: argparse.Namespace, app: Any, scenarios: List[Any], ctx: Any, pools: Dict[str, List[Any]]) -> Dict[str, Any]:
+    from app.core.cache import clear_all_caches
+
+    server = None
+    limits = httpx.Limits(max_connections=args.concurrency)
+    if args.transport == "asgi":
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", limits=limits)
+
+        async def clear_caches() -> None:
+            clear_all_caches()
+    else:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+        )
+        await _wait_for_server(server, base_url)
+        client = httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60)
+
+        async def clear_caches() -> None:
+            response = await client.post(CLEAR_CACHES_PATH)
+            response.raise_for_status()
+
+    endpoints = {}
+    try:
+        async with client:
+            for scenario in scenarios:
+                requests, warmup = _request_counts(args, scenario)
+                result = await run_scenario(
+                    client, scenario, ctx, pools.get(scenario.route), clear_caches,
+                    warmup=warmup, requests=requests, concurrency=args.concurrency,
+                )
+                endpoints[scenario.route] = result
+                logger.info(
+                    "  %-48s cold p50 %8.2f ms  p95 %8.2f ms  warm p50 %8.2f ms  p95 %8.2f ms  p99 %8.2f ms  %8.1f req/s%s",
+                    scenario.route, result["cold_p50_ms"], result["cold_p95_ms"],
+                    result["p50_ms"], result["p95_ms"], result["p99_ms"], result["rps"],
+                    f"  {result['errors']} errors ({result['first_error']})" if result["errors"] else "",
+                )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+    return endpoints
+
+
+def run_server(args: argparse.Namespace) -> None:
+    """
+    The app under uvicorn, plus a route that clears its in-process caches
+    for the cold measurements.
+    """
+    import uvicorn
+
+    from app.core.cache import clear_all_caches
+    from main import app
+
+    app.add_api_route(CLEAR_CACHES_PATH, clear_all_caches, methods=["POST"], include_in_schema=False)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning", access_log=False)
+
+
+def _request_counts(args: argparse.Namespace, scenario: Any) -> tuple:
+    requests = min(args.requests, scenario.max_requests or args.requests)
+    return requests, min(args.warmup, requests)
+
+
+def run_worker(args: argparse.Namespace) -> None:
+    """
+    One transport and scale, in a process whose DATABASE_URL points at a
+    scratch database in the current directory.
+    """
+    import api_scenarios
+    from fastapi.routing import APIRoute
+    from sqlalchemy import func, select
+
+    from app.db.session import SessionLocal
+    from app.models.gadget import Gadget
+    from app.models.review import Review
+    from app.models.user import User
+
+    dataset = api_scenarios.ensure_dataset(args.scale, args.seed)
+    shutil.copyfile(dataset, args.database)
+    # Profile photo uploads land here instead of in the backend directory
+    os.makedirs("uploads/profile_photos", exist_ok=True)
+
+    from main import app
+
+    routes = {
+        f"{method} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.endpoint.__module__.startswith("app.api.")
+        for method in route.methods
+    }
+    covered = {scenario.route for scenario in api_scenarios.SCENARIOS}
+    uncovered = sorted(routes - covered)
+    for route in uncovered:
+        logger.warning("No benchmark scenario for %s", route)
+    scenarios = [
+        scenario for scenario in api_scenarios.SCENARIOS
+        if not args.only or any(pattern in scenario.route for pattern in args.only)
+    ]
+
+    with SessionLocal() as db:
+        ctx = api_scenarios.load_context(db)
+        dataset_rows = {
+            "users": db.scalar(select(func.count(User.id))),
+            "gadgets": db.scalar(select(func.count(Gadget.id))),
+            "reviews": db.scalar(select(func.count(Review.id))),
+        }
+        pools = {}
+        for scenario in scenarios:
+            if scenario.pool is not None:
+                requests, warmup = _request_counts(args, scenario)
+                pools[scenario.route] = scenario.pool(db, ctx, warmup + 3 * requests)
+
+    logger.info("%s / %s (%s)", args.scale, args.transport, ", ".join(f"{n} {t}" for t, n in dataset_rows.items()))
+    endpoints = asyncio.run(drive(args, app, scenarios, ctx, pools))
+
+    with open(args.result, "w") as file:
+        json.dump({
+            "meta": {
+                "scale": args.scale,
+                "seed": args.seed,
+                "transport": args.transport,
+                "dataset": dataset_rows,
+                "requests": args.requests,
+                "warmup": args.warmup,
+                "concurrency": args.concurrency,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            },
+            "uncovered": uncovered,
+            "endpoints": endpoints,
+        }, file, indent=2)
+
+
+def baseline_path(baseline_dir: Path, transport: str, scale: str) -> Path:
+    return baseline_dir / f"{transport}-{scale}.json"
+
+
+def find_regressions(result: Dict[str, Any], baseline: Dict[str, Any], *, threshold: float, min_delta_ms: float) -> List[str]:
+    """
+    Routes that got slower than the baseline by more than threshold (a
+    fraction) and min_delta_ms, lost throughput, or started failing.
+    """
+    regressions = []
+    for route, current in result["endpoints"].items():
+        base = baseline["endpoints"].get(route)
+        if base is None:
+            continue
+        for metric in CHECKED_LATENCIES:
+            # Baselines recorded before cold latencies were measured
+            if metric not in base:
+                continue
+            if (
+                current[metric] > base[metric] * (1 + threshold)
+                and current[metric] - base[metric] > min_delta_ms
+            ):
+                regressions.append(
+                    f"{route}: {metric} {base[metric]:.2f} -> {current[metric]:.2f} "
+                    f"(+{(current[metric] / base[metric] - 1) * 100:.0f}%)"
+                )
+        if base["rps"] and current["rps"] < base["rps"] / (1 + threshold):
+            regressions.append(
+                f"{route}: rps {base['rps']:.1f} -> {current['rps']:.1f} "
+                f"({(current['rps'] / base['rps'] - 1) * 100:.0f}%)"
+            )
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{route}: errors {base['errors']} -> {current['errors']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark every API endpoint")
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small"])
+    parser.add_argument("--transports", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS))
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per route, for cold and warm latency and for throughput")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients in the throughput phase")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", action="append", help="Only routes containing this text (repeatable)")
+    parser.add_argument("--output", help="Write all results as JSON to this file")
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baselines")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any route regressed against its baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown as a fraction (default: 0.25)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="Ignore latency changes smaller than this")
+    # Worker mode, used internally
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--scale", help=argparse.SUPPRESS)
+    parser.add_argument("--transport", help=argparse.SUPPRESS)
+    parser.add_argument("--database", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if min(args.requests, args.concurrency) < 1 or args.warmup < 0:
+        parser.error("--requests and --concurrency must be positive")
+
+    if args.worker:
+        run_worker(args)
+        return
+    if args.serve:
+        run_server(args)
+        return
+
+    snapshot_dir = os.path.abspath(os.environ.get("SNAPSHOT_DIR", ".snapshots"))
+    runs, regressions = [], []
+    for scale in args.scales:
+        for transport in args.transports:
+            with tempfile.TemporaryDirectory(prefix="bench-api-") as scratch:
+                database = os.path.join(scratch, "bench.db")
+                result_file = os.path.join(scratch, "result.json")
+                command = [
+                    sys.executable, os.path.abspath(__file__), "--worker",
+                    "--scale", scale, "--transport", transport, "--seed", str(args.seed),
+                    "--requests", str(args.requests), "--warmup", str(args.warmup),
+                    "--concurrency", str(args.concurrency),
+                    "--database", database, "--result", result_file,
+                ]
+                for pattern in args.only or []:
+                    command += ["--only", pattern]
+                env = {
+                    **os.environ,
+                    "DATABASE_URL": f"sqlite:///{database}",
+                    "SECRET_KEY": BENCH_SECRET_KEY,
+                    "SNAPSHOT_DIR": snapshot_dir,
+                }
+                # The app prints on some requests; progress goes to stderr
+                subprocess.run(command, cwd=scratch, env=env, stdout=subprocess.DEVNULL, check=True)
+                with open(result_file) as file:
+                    result = json.load(file)
+            runs.append(result)
+
+            path = baseline_path(args.baseline_dir, transport, scale)
+            if args.check:
+                if path.exists():
+                    with open(path) as file:
+                        baseline = json.load(file)
+                    found = find_regressions(result, baseline, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+                    regressions += [f"[{transport}/{scale}] {line}" for line in found]
+                else:
+                    logger.warning("No baseline at %s; nothing to check against", path)
+            if args.save_baseline:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if args.only and path.exists():
+                    # A partial run only replaces the routes it measured
+                    with open(path) as file:
+                        saved = json.load(file)
+                    saved["endpoints"].update(result["endpoints"])
+                    result = {**result, "endpoints": saved["endpoints"]}
+                with open(path, "w") as file:
+                    json.dump(result, file, indent=2)
+                logger.info("Baseline written to %s", path)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(runs, file, indent=2)
+        logger.info("Results written to %s", args.output)
+
+    if args.check:
+        for line in regressions:
+            logger.error("Regression: %s", line)
+        logger.info("%d regressions (threshold %.0f%%)", len(regressions), args.threshold * 100)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Micro-benchmarks for the Python hot paths behind gadget search and review
+listings, at growing dataset sizes.
+
+Each step is timed on its own, outside the database:
+
+- search scoring: CRUDGadget.score_gadgets over every gadget, as if all of
+  them matched the SQL filter (one benchmark per query)
+- search sorting: ordering the scored gadgets the way search_gadgets does
+- review dicts: CRUDReview.listing_dict over review listing rows
+- review validation: schemas.Review validation of those dicts
+- JSON encoding: orjson on the dicts (trusted_json path) and dump_json of
+  the validated models (response_model path)
+
+For each step the report gives ops/sec, time per item and the memory one
+op allocates (tracemalloc peak, measured in a separate run so tracing does
+not skew the timings). The data comes from the synthetic generator in an
+in-memory SQLite database.
+
+Run from the backend directory:
+    python benchmarks/bench_hotpaths.py
+    python benchmarks/bench_hotpaths.py --sizes 1000 100000 --only search --output hotpaths.json
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Add parent directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import crud, schemas
+from app.db import synthetic
+from app.db.base_class import Base
+from app.models.gadget import Gadget
+from app.models.review import Review
+
+SIZES = (100, 1_000, 10_000)
+# Exact brand, word start in name, and a short query that drops weak matches
+QUERIES = ("samsung", "pro", "ga")
+REPEAT = 5
+SEED = 42
+
+review_list_adapter = TypeAdapter(List[schemas.Review])
+
+
+@dataclass
+class Result:
+    name: str
+    size: int
+    ops_per_sec: float
+    us_per_item: float
+    alloc_kib: float
+
+
+def build_dataset(size: int, seed: int) -> Tuple[List[Gadget], list]:
+    """
+    Generate size gadgets and size reviews, and load the gadgets (detached,
+    columns loaded) and the review listing rows.
+    """
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    try:
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as db:
+            synthetic.generate(
+                db, users=max(size // 10, 10), gadgets=size, reviews=size, seed=seed
+            )
+            gadgets = db.scalars(select(Gadget).order_by(Gadget.id)).all()
+            rows = db.execute(crud.review.listing_select().order_by(Review.id)).all()
+    finally:
+        engine.dispose()
+    return list(gadgets), rows
+
+
+def measure(name: str, size: int, fn: Callable[[], Any]) -> Result:
+    """
+    Best-of-REPEAT ops/sec and the tracemalloc peak of a single call.
+    """
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=name,
+        size=size,
+        ops_per_sec=1 / best,
+        us_per_item=best / size * 1e6,
+        alloc_kib=(peak - before) / 1024,
+    )
+
+
+def search_benchmarks(gadgets: List[Gadget]) -> Dict[str, Callable[[], Any]]:
+    benchmarks = {}
+    for query in QUERIES:
+        benchmarks[f"search score {query!r}"] = (
+            lambda query=query: crud.gadget.score_gadgets(gadgets, query)
+        )
+
+    # Same ordering as search_gadgets, on a fresh copy each time
+    scored = crud.gadget.score_gadgets(gadgets, QUERIES[1])
+    benchmarks["search sort"] = lambda: sorted(scored, key=lambda x: x[0], reverse=True)
+    return benchmarks
+
+
+def review_benchmarks(rows: list) -> Dict[str, Callable[[], Any]]:
+    items = [crud.review.listing_dict(row) for row in rows]
+    validated = review_list_adapter.validate_python(items)
+    return {
+        "review listing_dict": lambda: [crud.review.listing_dict(row) for row in rows],
+        "review validate": lambda: review_list_adapter.validate_python(items),
+        "review orjson": lambda: orjson.dumps(items),
+        "review dump_json": lambda: review_list_adapter.dump_json(validated),
+    }
+
+
+def run(sizes: Sequence[int], only: Sequence[str], seed: int) -> List[Result]:
+    results = []
+    for size in sizes:
+        print(f"\n{size} gadgets / {size} reviews (best of {REPEAT})\n")
+        gadgets, rows = build_dataset(size, seed)
+        benchmarks = {**search_benchmarks(gadgets), **review_benchmarks(rows)}
+        for name, fn in benchmarks.items():
+            if only and not any(part in name for part in only):
+                continue
+            result = measure(name, size, fn)
+            results.append(result)
+            print(
+                f"{name:24} {result.ops_per_sec:12,.1f} ops/s  "
+                f"{result.us_per_item:8.3f} us/item  {result.alloc_kib:12,.1f} KiB/op"
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(SIZES),
+        help="Dataset sizes (gadgets and reviews each)",
+    )
+    parser.add_argument(
+        "--only", nargs="+", default=[],
+        help="Run only benchmarks whose name contains one of these (e.g. search, validate)",
+    )
+    parser.add_argument("--seed", type=int, default=SEED, help="Synthetic data seed")
+    parser.add_argument("--output", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.only, args.seed)
+    if args.output:
+        args.output.write_text(json.dumps([asdict(result) for result in results], indent=2))
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
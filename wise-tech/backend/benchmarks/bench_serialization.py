@@ -0,0 +1,148 @@
+"""
+Benchmark response serialization for a 100-item review page.
+
+Compares the old path (handler builds schemas.Review objects, FastAPI validates
+them again against response_model and encodes with the stdlib json module)
+with the trusted path (dicts built from database rows encoded directly by
+orjson) and with a single validation pass through response_model.
+
+Then compares JSON with MessagePack for the same page: encoded size, encode
+time and client-side decode time (skipped if msgpack is not installed).
+
+Run from the backend directory:
+    python benchmarks/bench_serialization.py
+"""
+
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import orjson
+from pydantic import TypeAdapter
+
+# Add parent directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import schemas
+from app.core.responses import msgpack_available, msgpack_dumps
+from app.models.review import ReviewStatus
+
+PAGE_SIZE = 100
+REPEAT = 5
+NUMBER = 50
+
+
+def make_review_page(n: int = PAGE_SIZE) -> list:
+    """
+    Build review dicts shaped like the ones get_all_reviews assembles.
+    """
+    now = datetime(2025, 6, 1, 12, 0, 0)
+    return [
+        {
+            "id": i,
+            "title": f"Review {i}",
+            "content": "Great battery life and a sharp display. " * 8,
+            "rating": float(i % 5 + 1),
+            "pros": "Battery, display",
+            "cons": "Price",
+            "user_id": i % 15 + 1,
+            "gadget_id": i % 30 + 1,
+            "status": ReviewStatus.APPROVED,
+            "created_at": now - timedelta(hours=i),
+            "updated_at": now - timedelta(hours=i),
+            "user_name": f"user{i % 15}",
+            "user": {
+                "id": i % 15 + 1,
+                "username": f"user{i % 15}",
+                "full_name": f"User {i % 15}",
+                "profile_photo": None,
+            },
+            "gadget": {
+                "id": i % 30 + 1,
+                "name": f"Gadget {i % 30}",
+                "category": "Smartphones",
+                "brand": "Samsung",
+            },
+        }
+        for i in range(n)
+    ]
+
+
+page_adapter = TypeAdapter(schemas.ReviewPaginatedResponse)
+
+
+def envelope(reviews: list) -> dict:
+    return {
+        "reviews": reviews,
+        "total": 1000,
+        "total_pages": 10,
+        "current_page": 1,
+        "limit": PAGE_SIZE,
+    }
+
+
+def double_validation_stdlib_json(rows: list) -> bytes:
+    """Old path: wrap in schemas, revalidate against response_model, stdlib json."""
+    response = schemas.ReviewPaginatedResponse(
+        **envelope([schemas.Review(**row) for row in rows])
+    )
+    validated = page_adapter.validate_python(response.model_dump())
+    return json.dumps(page_adapter.dump_python(validated, mode="json")).encode()
+
+
+def single_validation(rows: list) -> bytes:
+    """Detail-handler path: one validation pass through response_model."""
+    validated = page_adapter.validate_python(envelope(rows))
+    return orjson.dumps(page_adapter.dump_python(validated, mode="json"))
+
+
+def trusted_orjson(rows: list) -> bytes:
+    """Trusted path: database-shaped dicts encoded directly by orjson."""
+    return orjson.dumps(envelope(rows))
+
+
+def compare_formats(rows: list) -> None:
+    """
+    Size, encode and decode time of the trusted page as JSON and MessagePack.
+    """
+    import msgpack
+
+    content = envelope(rows)
+    formats = (
+        ("json (orjson)", orjson.dumps, orjson.loads),
+        ("msgpack", msgpack_dumps, msgpack.unpackb),
+    )
+    print("\nJSON vs MessagePack for the same page\n")
+    for name, encode, decode in formats:
+        body = encode(content)
+        encode_s = min(timeit.repeat(lambda: encode(content), repeat=REPEAT, number=NUMBER)) / NUMBER
+        decode_s = min(timeit.repeat(lambda: decode(body), repeat=REPEAT, number=NUMBER)) / NUMBER
+        print(
+            f"{name:16} {len(body):8d} bytes  "
+            f"encode {encode_s * 1e3:7.3f} ms  decode {decode_s * 1e3:7.3f} ms"
+        )
+
+
+def main() -> None:
+    rows = make_review_page()
+    print(f"Serializing a {PAGE_SIZE}-item review page (best of {REPEAT} x {NUMBER} runs)\n")
+    baseline = None
+    for fn in (double_validation_stdlib_json, single_validation, trusted_orjson):
+        best = min(timeit.repeat(lambda: fn(rows), repeat=REPEAT, number=NUMBER)) / NUMBER
+        baseline = baseline or best
+        per_item_us = best / PAGE_SIZE * 1e6
+        print(
+            f"{fn.__name__:32} {best * 1e3:8.3f} ms/page  "
+            f"{per_item_us:7.2f} us/item  {baseline / best:5.1f}x"
+        )
+
+    if msgpack_available():
+        compare_formats(rows)
+    else:
+        print("\nmsgpack is not installed; skipping the JSON vs MessagePack comparison")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Script to generate a deterministic synthetic dataset for load testing
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add the backend directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.base_class import Base
+from app.db.migrate import stamp_head, upgrade
+from app.db.session import SessionLocal, engine
+from app.db.synthetic import SCALES, generate
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """
+    Main function to run the generator
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic users, gadgets and reviews; "
+        "the same seed and sizes always produce the same data"
+    )
+    parser.add_argument("--scale", choices=list(SCALES), default="small", help="Dataset size preset (default: small)")
+    parser.add_argument("--users", type=int, help="Override the preset's user count")
+    parser.add_argument("--gadgets", type=int, help="Override the preset's gadget count")
+    parser.add_argument("--reviews", type=int, help="Override the preset's review count")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Skew of review activity per gadget and user (default: 1.1)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per INSERT batch and transaction")
+    parser.add_argument("--password", default="password123", help="Password shared by every generated user")
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first")
+    parser.add_argument("--report", help="Write per-table rows and timings as JSON to this file")
+    args = parser.parse_args()
+
+    users, gadgets, reviews = SCALES[args.scale]
+    users = users if args.users is None else args.users
+    gadgets = gadgets if args.gadgets is None else args.gadgets
+    reviews = reviews if args.reviews is None else args.reviews
+    if min(users, gadgets, reviews) < 0 or args.batch_size < 1:
+        parser.error("counts can't be negative and --batch-size must be positive")
+
+    if args.reset:
+        logger.info("Dropping all tables")
+        Base.metadata.drop_all(bind=engine)
+        with engine.begin() as connection:
+            Base.metadata.create_all(bind=connection)
+            stamp_head(connection)
+    else:
+        upgrade(engine)
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        stats = generate(
+            db,
+            users=users,
+            gadgets=gadgets,
+            reviews=reviews,
+            seed=args.seed,
+            zipf=args.zipf,
+            batch_size=args.batch_size,
+            password=args.password,
+        )
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - started
+
+    for table, entry in stats.items():
+        logger.info(
+            "%-12s %10d rows in %7.1fs (%.0f rows/sec)",
+            table, entry["rows"], entry["seconds"], entry["rows_per_sec"],
+        )
+    rows = sum(entry["rows"] for entry in stats.values())
+    logger.info("Total %d rows in %.1fs (%.0f rows/sec)", rows, elapsed, rows / elapsed if elapsed else 0)
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump({
+                "seed": args.seed,
+                "zipf": args.zipf,
+                "tables": stats,
+                "rows": rows,
+                "seconds": elapsed,
+            }, file, indent=2)
+        logger.info("Report written to %s", args.report)
+
+
+if __name__ == "__main__":
+    main()
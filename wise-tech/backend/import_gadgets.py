@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Script to bulk import gadgets with specs from a CSV or NDJSON file
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add the backend directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.db.gadget_import import ImportFormat, import_gadgets
+from app.db.session import SessionLocal
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """
+    Main function to run the import
+    """
+    parser = argparse.ArgumentParser(description="Bulk import gadgets from CSV or NDJSON")
+    parser.add_argument("path", help="CSV or NDJSON file to import")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], help="Default: from the file extension")
+    parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE, help="Rows per transaction")
+    parser.add_argument("--report", help="Write the full JSON report (with per-row errors) to this file")
+    args = parser.parse_args()
+
+    format = ImportFormat(args.format) if args.format else ImportFormat.from_filename(args.path)
+    if format is None:
+        parser.error("cannot tell the format from the file name; pass --format")
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        with open(args.path, "rb") as file:
+            report = import_gadgets(db, file, format, batch_size=args.batch_size)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - started
+
+    rows = report["created"] + report["updated"] + report["failed"]
+    logger.info(
+        "Imported %d rows in %.1fs (%.0f rows/sec): %d created, %d updated, %d failed",
+        rows, elapsed, rows / elapsed if elapsed else 0,
+        report["created"], report["updated"], report["failed"],
+    )
+    for error in report["errors"][:20]:
+        logger.warning("Line %d: %s", error["line"], "; ".join(error["errors"]))
+    if len(report["errors"]) > 20:
+        logger.warning("... %d more rejected rows", len(report["errors"]) - 20)
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(report, file, indent=2)
+        logger.info("Report written to %s", args.report)
+
+    sys.exit(1 if report["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
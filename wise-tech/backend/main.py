@@ -10,27 +10,44 @@ Endpoints:
 - Gadgets: Pencarian dan pengelolaan gadget berdasarkan kategori
 - Reviews: Manajemen ulasan gadget
 - Admin: Endpoint khusus admin untuk pengelolaan platform
+- Home: Seluruh data halaman beranda dalam satu respons
+- Batch: Banyak request API dalam satu round-trip
 
 Dibuat: Juni 2025
 """
 
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
 
-from app.api import auth, gadgets, users, reviews, admin
+from app.api import auth, batch, gadgets, home, users, reviews, admin
+from app.core.cache import TTLCache
+from app.core.compression import CompressionMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.query_stats import QUERY_COUNT_HEADER, QueryCountMiddleware
+from app.core.security import shutdown_password_hash_pool
 from app.core.config import settings
-from app.db.session import engine, SessionLocal
-from app.db.base_class import Base
+from app.db.migrate import upgrade as upgrade_database
+from app.db.session import engine
 
-# Buat tabel database jika belum ada
-Base.metadata.create_all(bind=engine)
+# Buat tabel database jika belum ada, atau migrasikan skema lama ke versi terbaru
+upgrade_database(engine)
 
 app = FastAPI(
     title="WiseTech API",
     description="API untuk platform ulasan gadget WiseTech",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Kompresi respons (zstd/brotli/gzip) dengan cache untuk respons publik yang sering diakses
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    cache=TTLCache(maxsize=settings.RESPONSE_CACHE_SIZE, ttl=settings.RESPONSE_CACHE_TTL),
+    # Batches are cleared by their own write sub-requests, which pass through here too
+    invalidate_exempt=(f"{settings.API_V1_STR}/auth/", batch.BATCH_PATH),
 )
 
 # Konfigurasi CORS untuk komunikasi dengan frontend React
@@ -40,15 +57,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, QUERY_COUNT_HEADER],
 )
 
-# Dependency untuk mendapatkan database session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Jumlah query SQL per request (header X-Query-Count saat DEBUG); paling luar
+# agar respons dari cache terhitung nol query
+app.add_middleware(QueryCountMiddleware)
+
+# Hentikan proses worker hashing password saat server berhenti
+app.add_event_handler("shutdown", shutdown_password_hash_pool)
 
 # Endpoint untuk health check
 @app.get("/")
@@ -61,6 +78,8 @@ app.include_router(users.router, prefix="/api", tags=["users"])
 app.include_router(gadgets.router, prefix="/api", tags=["gadgets"])
 app.include_router(reviews.router, prefix="/api", tags=["reviews"])
 app.include_router(admin.router, prefix="/api", tags=["admin"])
+app.include_router(home.router, prefix="/api", tags=["home"])
+app.include_router(batch.router, prefix="/api", tags=["batch"])
 
 # Serve static files (uploaded images)
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
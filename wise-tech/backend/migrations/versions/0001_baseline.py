@@ -0,0 +1,25 @@
+"""Baseline: users, gadgets, gadget_specs and reviews as create_all made them
+
+Databases created before migrations existed are stamped at this revision
+(app.db.migrate does it automatically) and upgraded from here.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,160 @@
+"""Brand/category lookup tables, gadget brand_id/category_id and listing indexes
+
+Creates the brands and categories lookup tables, adds gadgets.brand_id and
+gadgets.category_id and backfills them from the brand/category strings, and
+adds the composite indexes the listing endpoints sort on.
+
+Every step is skipped when already done, so databases whose new tables were
+created by create_all at app startup upgrade cleanly, and the backfill can be
+re-run.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+
+"""
+from typing import Dict, List, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of crud.gadget.CATEGORY_ALIASES at the time of this migration
+CATEGORY_ALIASES = {
+    "smartphones": "smartphone",
+    "laptops": "laptop",
+    "tablets": "tablet",
+}
+
+# (name, table, columns, unique)
+INDEXES = [
+    ("ix_gadgets_brand_id", "gadgets", ["brand_id"], False),
+    ("ix_gadgets_category_id", "gadgets", ["category_id"], False),
+    ("ix_gadgets_created_at_id", "gadgets", ["created_at", "id"], False),
+    ("ix_gadgets_price_id", "gadgets", ["price", "id"], False),
+    ("ix_gadgets_brand_id_name", "gadgets", ["brand_id", "name"], False),
+    ("ix_reviews_user_id", "reviews", ["user_id"], False),
+    ("ix_reviews_gadget_id", "reviews", ["gadget_id"], False),
+    ("ix_reviews_created_at_id", "reviews", ["created_at", "id"], False),
+    ("ix_reviews_rating_created_at_id", "reviews", ["rating", "created_at", "id"], False),
+    (
+        "ix_reviews_rating_asc_created_at_desc", "reviews",
+        ["rating", sa.text("created_at DESC"), sa.text("id DESC")], False,
+    ),
+    ("ix_reviews_status_created_at_id", "reviews", ["status", "created_at", "id"], False),
+    ("ix_users_joined_date_id", "users", ["joined_date", "id"], False),
+]
+
+
+def _category_key(value: str) -> str:
+    key = value.strip().lower()
+    return CATEGORY_ALIASES.get(key, key)
+
+
+def _brand_key(value: str) -> str:
+    return value.strip().lower()
+
+
+def _lookup_table(name: str) -> sa.Table:
+    return sa.Table(
+        name,
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("key", sa.String),
+        sa.Column("name", sa.String),
+    )
+
+
+def _backfill(bind, lookup_name: str, column: str, fk_column: str, key) -> None:
+    """
+    Point every gadget without fk_column at the lookup row for its column
+    string, and store the row's display name. Missing rows are created,
+    named after the most common spelling of the key.
+    """
+    lookup = _lookup_table(lookup_name)
+    gadgets = sa.table("gadgets", sa.column(column), sa.column(fk_column))
+    rows: Dict[str, Tuple[int, str]] = {
+        row.key: (row.id, row.name) for row in bind.execute(sa.select(lookup))
+    }
+    spellings: Dict[str, List[str]] = {}
+    for value, _ in bind.execute(
+        sa.select(gadgets.c[column], sa.func.count())
+        .where(gadgets.c[fk_column].is_(None))
+        .group_by(gadgets.c[column])
+        .order_by(sa.func.count().desc(), gadgets.c[column])
+    ):
+        spellings.setdefault(key(value), []).append(value)
+
+    for lookup_key, values in spellings.items():
+        if lookup_key not in rows:
+            name = values[0].strip()
+            result = bind.execute(sa.insert(lookup).values(key=lookup_key, name=name))
+            rows[lookup_key] = (result.inserted_primary_key[0], name)
+        lookup_id, name = rows[lookup_key]
+        bind.execute(
+            sa.update(gadgets)
+            .where(gadgets.c[column].in_(values), gadgets.c[fk_column].is_(None))
+            .values({fk_column: lookup_id, column: name})
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    for name in ("categories", "brands"):
+        if name not in tables:
+            op.create_table(
+                name,
+                sa.Column("id", sa.Integer(), nullable=False),
+                sa.Column("key", sa.String(), nullable=False),
+                sa.Column("name", sa.String(), nullable=False),
+                sa.PrimaryKeyConstraint("id"),
+            )
+            op.create_index(f"ix_{name}_id", name, ["id"])
+            op.create_index(f"ix_{name}_key", name, ["key"], unique=True)
+
+    columns = {column["name"] for column in inspector.get_columns("gadgets")}
+    new_columns = [
+        sa.Column(
+            fk_column, sa.Integer(),
+            sa.ForeignKey(f"{lookup}.id", name=f"fk_gadgets_{fk_column}_{lookup}"),
+            nullable=True,
+        )
+        for fk_column, lookup in (("brand_id", "brands"), ("category_id", "categories"))
+        if fk_column not in columns
+    ]
+    if new_columns:
+        with op.batch_alter_table("gadgets") as batch:
+            for column in new_columns:
+                batch.add_column(column)
+
+    existing = {
+        index["name"]
+        for table in ("gadgets", "reviews", "users")
+        for index in sa.inspect(bind).get_indexes(table)
+    }
+    for name, table, index_columns, unique in INDEXES:
+        if name not in existing:
+            op.create_index(name, table, index_columns, unique=unique)
+
+    _backfill(bind, "categories", "category", "category_id", _category_key)
+    _backfill(bind, "brands", "brand", "brand_id", _brand_key)
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    with op.batch_alter_table("gadgets") as batch:
+        batch.drop_column("category_id")
+        batch.drop_column("brand_id")
+    for name in ("brands", "categories"):
+        op.drop_index(f"ix_{name}_key", table_name=name)
+        op.drop_index(f"ix_{name}_id", table_name=name)
+        op.drop_table(name)
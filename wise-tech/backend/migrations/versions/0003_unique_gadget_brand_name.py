@@ -0,0 +1,59 @@
+"""Make (brand_id, name) unique on gadgets
+
+Bulk imports match existing gadgets on (brand_id, name). With a plain index,
+two concurrent imports of the same catalog could both insert. Existing
+duplicates are merged into the oldest gadget of each group, which takes
+over the duplicates' reviews; the duplicates' specs are dropped.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_gadgets_brand_id_name"
+
+gadgets = sa.table("gadgets", sa.column("id"), sa.column("brand_id"), sa.column("name"))
+gadget_specs = sa.table("gadget_specs", sa.column("gadget_id"))
+reviews = sa.table("reviews", sa.column("gadget_id"))
+
+
+def _merge_duplicates(bind) -> None:
+    groups = bind.execute(
+        sa.select(gadgets.c.brand_id, gadgets.c.name, sa.func.min(gadgets.c.id))
+        .where(gadgets.c.brand_id.is_not(None))
+        .group_by(gadgets.c.brand_id, gadgets.c.name)
+        .having(sa.func.count() > 1)
+    ).all()
+    for brand_id, name, keep_id in groups:
+        duplicate_ids = bind.execute(
+            sa.select(gadgets.c.id).where(
+                gadgets.c.brand_id == brand_id, gadgets.c.name == name, gadgets.c.id != keep_id
+            )
+        ).scalars().all()
+        bind.execute(
+            sa.update(reviews).where(reviews.c.gadget_id.in_(duplicate_ids)).values(gadget_id=keep_id)
+        )
+        bind.execute(sa.delete(gadget_specs).where(gadget_specs.c.gadget_id.in_(duplicate_ids)))
+        bind.execute(sa.delete(gadgets).where(gadgets.c.id.in_(duplicate_ids)))
+
+
+def upgrade() -> None:
+    _merge_duplicates(op.get_bind())
+    op.drop_index(INDEX, table_name="gadgets")
+    op.create_index(INDEX, "gadgets", ["brand_id", "name"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="gadgets")
+    op.create_index(INDEX, "gadgets", ["brand_id", "name"])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Script to bulk create user accounts from a CSV or NDJSON file
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Add the backend directory to the path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pydantic import ValidationError
+
+from app import crud, schemas
+from app.core.config import settings
+from app.core.security import shutdown_password_hash_pool
+from app.db.records import ImportFormat, iter_records, validation_messages
+from app.db.session import SessionLocal
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """
+    Main function to run the provisioning
+    """
+    parser = argparse.ArgumentParser(
+        description="Bulk create users from CSV or NDJSON "
+        "(email, username, password, full_name, bio, is_admin)"
+    )
+    parser.add_argument("path", help="CSV or NDJSON file with one user per row")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat], help="Default: from the file extension")
+    parser.add_argument("--workers", type=int, help="Password hashing processes (default: CPU count)")
+    parser.add_argument("--report", help="Write the full JSON report (with per-row errors) to this file")
+    args = parser.parse_args()
+
+    format = ImportFormat(args.format) if args.format else ImportFormat.from_filename(args.path)
+    if format is None:
+        parser.error("cannot tell the format from the file name; pass --format")
+
+    started = time.perf_counter()
+    users, lines, errors = [], [], []
+    with open(args.path, "rb") as file:
+        for line, record, error in iter_records(file, format):
+            if error is not None:
+                errors.append({"line": line, "errors": [error]})
+                continue
+            try:
+                users.append(schemas.UserAdminCreate.model_validate(record))
+                lines.append(line)
+            except ValidationError as exc:
+                errors.append({"line": line, "errors": validation_messages(exc)})
+
+    # One transaction per USER_PROVISION_MAX_USERS users
+    created = []
+    db = SessionLocal()
+    try:
+        for offset in range(0, len(users), settings.USER_PROVISION_MAX_USERS):
+            chunk = users[offset:offset + settings.USER_PROVISION_MAX_USERS]
+            chunk_created, rejected = crud.user.bulk_create(db, users=chunk, workers=args.workers)
+            created.extend(chunk_created)
+            errors.extend(
+                {"line": lines[offset + error["index"]], "email": error["email"], "errors": error["errors"]}
+                for error in rejected
+            )
+            logger.info("Provisioned %d/%d users", offset + len(chunk), len(users))
+    finally:
+        db.close()
+        shutdown_password_hash_pool()
+    elapsed = time.perf_counter() - started
+
+    errors.sort(key=lambda error: error["line"])
+    rows = len(created) + len(errors)
+    logger.info(
+        "Processed %d users in %.1fs (%.0f users/sec): %d created, %d failed",
+        rows, elapsed, rows / elapsed if elapsed else 0, len(created), len(errors),
+    )
+    for error in errors[:20]:
+        logger.warning("Line %d: %s", error["line"], "; ".join(error["errors"]))
+    if len(errors) > 20:
+        logger.warning("... %d more rejected rows", len(errors) - 20)
+
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump(
+                {"created": len(created), "failed": len(errors), "users": created, "errors": errors},
+                file, indent=2, default=str,
+            )
+        logger.info("Report written to %s", args.report)
+
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,9 +27,10 @@ pip install 'python-jose[cryptography]'
 # Set environment variables
 export PYTHONPATH=$PYTHONPATH:$(pwd)
 
-# Initialize the database
+# Initialize the database from the prebuilt sample data snapshot
+# (built on first use, and again whenever the seed data or schema changes)
 echo -e "${YELLOW}Initializing database...${NC}"
-python -m app.db.init_db
+python -m app.db.snapshot restore
 
 # Run the FastAPI server
 echo -e "${GREEN}Starting API server on http://localhost:8000${NC}"
@@ -0,0 +1,79 @@
+"""
+Shared pytest fixtures.
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+# Add parent directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db import snapshot
+
+
+@pytest.fixture
+def db_engine():
+    """In-memory database with the sample data, copied fresh for every test."""
+    engine = snapshot.memory_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    with sessionmaker(bind=db_engine, autoflush=False, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def client(db_engine, monkeypatch):
+    """
+    TestClient for the app on the per-test database, with caches emptied,
+    X-Query-Count sent and lazy loads raising LazyLoadError.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.core.cache import clear_all_caches
+    from app.core.config import settings
+    from app.db.session import SessionLocal, engine
+    from main import app
+
+    monkeypatch.setattr(settings, "DEBUG", True)
+    monkeypatch.setattr(settings, "STRICT_LAZY_LOADS", True)
+    SessionLocal.configure(bind=db_engine)
+    clear_all_caches()
+    try:
+        yield TestClient(app)
+    finally:
+        SessionLocal.configure(bind=engine)
+        clear_all_caches()
+
+
+@pytest.fixture
+def query_budget(db_engine):
+    """
+    Context manager asserting that at most `budget` SQL statements run on
+    the test database inside it; the statements are listed on failure.
+    """
+    @contextmanager
+    def check(budget: int):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+        assert len(statements) <= budget, (
+            f"{len(statements)} SQL statements, budget {budget}:\n" + "\n".join(statements)
+        )
+
+    return check
@@ -0,0 +1,110 @@
+"""
+Batch endpoint: ordering of reads and writes, per-sub-request statuses, and
+how the batch's token is applied to every sub-request.
+"""
+
+from sqlalchemy import select
+
+from app.core.security import create_access_token
+from app.models.review import Review
+
+ADMIN_ID = 1
+USER_ID = 2
+
+
+def _auth(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+def _batch(client, requests, headers=None):
+    return client.post("/api/batch", json={"requests": requests}, headers=headers or {})
+
+
+def test_reads_see_earlier_writes(client, db):
+    reviewed = set(db.scalars(select(Review.gadget_id).where(Review.user_id == USER_ID)))
+    gadget_id = next(gadget_id for gadget_id in range(1, 100) if gadget_id not in reviewed)
+    review = {
+        "gadget_id": gadget_id, "title": "Batched review", "content": "Written in a batch",
+        "rating": 5, "pros": "Fast", "cons": "None",
+    }
+    # Fill the response cache first, so the read after the write must not be served from it
+    assert client.get(f"/api/gadgets/{gadget_id}/reviews").status_code == 200
+
+    response = _batch(client, [
+        {"method": "PUT", "path": "/api/users/profile", "body": {"bio": "Batched bio"}},
+        {"path": "/api/users/profile"},
+        {"method": "POST", "path": "/api/reviews", "body": review},
+        {"path": f"/api/gadgets/{gadget_id}/reviews"},
+        {"path": "/api/users/reviews"},
+    ], headers=_auth(USER_ID))
+
+    assert response.status_code == 200, response.text
+    profile_update, profile, created, gadget_reviews, user_reviews = response.json()["responses"]
+    assert [profile_update["status"], profile["status"], created["status"]] == [200, 200, 200]
+    assert profile["body"]["bio"] == "Batched bio"
+    review_id = created["body"]["id"]
+    assert review_id in [item["id"] for item in gadget_reviews["body"]]
+    assert review_id in [item["id"] for item in user_reviews["body"]]
+
+
+def test_each_sub_request_gets_its_own_status(client):
+    response = _batch(client, [
+        {"path": "/api/gadgets/1"},
+        {"path": "/api/gadgets/999999"},
+        {"path": "/api/admin/users"},
+        {"method": "POST", "path": "/api/reviews", "body": {"gadget_id": 1}},
+    ], headers=_auth(USER_ID))
+
+    assert response.status_code == 200, response.text
+    assert [entry["status"] for entry in response.json()["responses"]] == [200, 404, 403, 422]
+
+
+def test_nested_batch_is_rejected(client):
+    response = _batch(client, [
+        {"method": "POST", "path": "/api/batch", "body": {"requests": [{"path": "/api/gadgets/1"}]}},
+        {"path": "/api/gadgets/1"},
+    ], headers=_auth(USER_ID))
+
+    assert response.status_code == 200, response.text
+    nested, sibling = response.json()["responses"]
+    assert nested["status"] == 400
+    assert nested["body"] == {"detail": "Batch requests can't be nested"}
+    assert sibling["status"] == 200
+
+
+def test_unauthenticated_batch_fails_per_sub_request(client):
+    response = _batch(client, [{"path": "/api/gadgets/1"}, {"path": "/api/users/profile"}])
+
+    assert response.status_code == 200, response.text
+    assert [entry["status"] for entry in response.json()["responses"]] == [200, 401]
+
+
+def test_invalid_token_fails_whole_batch(client):
+    response = _batch(
+        client, [{"path": "/api/gadgets/1"}], headers={"Authorization": "Bearer not-a-token"}
+    )
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Could not validate credentials"
+
+
+def test_sub_request_authorization_is_ignored(client):
+    response = _batch(client, [
+        {"path": "/api/users/profile", "headers": _auth(ADMIN_ID)},
+        {"path": "/api/admin/users", "headers": _auth(ADMIN_ID)},
+    ], headers=_auth(USER_ID))
+
+    assert response.status_code == 200, response.text
+    profile, admin_users = response.json()["responses"]
+    assert profile["status"] == 200
+    assert profile["body"]["id"] == USER_ID
+    assert admin_users["status"] == 403
+
+
+def test_batch_user_is_loaded_once(client, query_budget):
+    # One user lookup for the batch; the sub-requests reuse request.state.user
+    with query_budget(1):
+        response = _batch(client, [{"path": "/api/users/profile"}] * 3, headers=_auth(USER_ID))
+
+    assert response.status_code == 200, response.text
+    assert [entry["body"]["id"] for entry in response.json()["responses"]] == [USER_ID] * 3
@@ -0,0 +1,42 @@
+"""
+Cache invalidation on commit (clear_on_commit).
+"""
+
+from sqlalchemy import update
+
+from app.api.home import home_sections
+from app.core.cache import clear_all_caches
+from app.crud.gadget import gadget_cache
+from app.models.gadget import Gadget
+from app.models.user import User
+
+
+def _fill_caches():
+    clear_all_caches()
+    gadget_cache.set(1, "iPhone")
+    gadget_cache.set(2, "other")
+    home_sections.set(("categories",), "sections")
+
+
+def test_flushed_gadget_evicts_only_its_own_entry(db):
+    _fill_caches()
+    db.get(Gadget, 1).price += 1
+    db.flush()
+    assert gadget_cache.get(1) == "iPhone"
+
+    db.commit()
+    assert gadget_cache.get(1) is None
+    assert gadget_cache.get(2) == "other"
+    assert home_sections.get(("categories",)) is None
+
+
+def test_statement_write_clears_the_cache_and_rollback_keeps_it(db):
+    _fill_caches()
+    db.execute(update(User).where(User.id == 2).values(bio="changed"))
+    db.rollback()
+    assert home_sections.get(("categories",)) == "sections"
+
+    db.execute(update(Gadget).where(Gadget.id == 1).values(price=1))
+    db.commit()
+    assert gadget_cache.get(2) is None
+    assert home_sections.get(("categories",)) is None
@@ -0,0 +1,30 @@
+"""
+Category lookup keys: names match in any case and through explicit aliases
+only, never by guessing at plurals.
+"""
+
+import pytest
+
+from app.crud.gadget import category_key
+
+
+@pytest.mark.parametrize("name,key", [
+    ("Smartphones", "smartphone"),
+    (" smartphone ", "smartphone"),
+    ("LAPTOPS", "laptop"),
+    ("Tablet", "tablet"),
+    ("Accessories", "accessories"),
+    ("Headphones", "headphones"),
+    ("Glass", "glass"),
+])
+def test_category_key(name, key):
+    assert category_key(name) == key
+
+
+def test_review_category_filter_accepts_name_and_alias(client):
+    by_alias = client.get("/api/reviews", params={"category": "smartphone"}).json()
+    by_name = client.get("/api/reviews", params={"category": "Smartphones"}).json()
+
+    assert by_alias["total"] > 0
+    assert by_alias == by_name
+    assert {review["gadget"]["category"] for review in by_alias["reviews"]} == {"Smartphones"}
@@ -0,0 +1,23 @@
+"""
+?ids= lists on the gadget batch and stats endpoints.
+"""
+
+import pytest
+
+PATHS = ["/api/gadgets/batch", "/api/gadgets/stats"]
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize("ids", ["1,²", "1,٣", "1,99999999999999999999999", "1,-2", "1,x"])
+def test_invalid_ids_are_rejected(client, path, ids):
+    response = client.get(path, params={"ids": ids})
+
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"].startswith("Invalid ids")
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_unknown_large_id_is_accepted(client, path):
+    response = client.get(path, params={"ids": "1,999999999999999999"})
+
+    assert response.status_code == 200, response.text
@@ -0,0 +1,59 @@
+"""
+Bulk gadget upserts keyed on (brand, name).
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from app import crud
+from app.core.security import create_access_token
+from app.models.gadget import Gadget
+from app.schemas.gadget import GadgetImportRow
+
+ADMIN_ID = 1
+
+
+def _row(name: str, brand: str = "Apple", price: float = 999.0) -> GadgetImportRow:
+    return GadgetImportRow(
+        name=name, brand=brand, category="Smartphones", description="Imported",
+        price=price, release_date="2024-01-01T00:00:00",
+    )
+
+
+def test_repeated_rows_count_once(db):
+    created, updated = crud.gadget.bulk_upsert(db, rows=[
+        _row("Import Phone", price=100.0),
+        _row("Import Phone", price=200.0),
+        _row("iPhone 15 Pro", brand=" apple"),
+        _row("iPhone 15 Pro"),
+    ])
+
+    assert (created, updated) == (1, 1)
+    prices = db.scalars(select(Gadget.price).where(Gadget.name == "Import Phone")).all()
+    assert prices == [200.0]
+
+
+def test_brand_and_name_are_unique(db):
+    gadget = db.get(Gadget, 1)
+    db.add(Gadget(
+        name=gadget.name, brand=gadget.brand, category=gadget.category, brand_id=gadget.brand_id,
+        category_id=gadget.category_id, description="Duplicate", price=1.0, release_date=gadget.release_date,
+    ))
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+    assert db.scalar(select(func.count()).where(Gadget.name == gadget.name)) == 1
+
+
+def test_duplicate_gadget_is_a_conflict(client):
+    response = client.post(
+        "/api/admin/gadgets",
+        json={
+            "name": "iPhone 15 Pro", "brand": "Apple", "category": "Smartphones",
+            "description": "Duplicate", "price": 1.0, "release_date": "2024-01-01T00:00:00",
+        },
+        headers={"Authorization": f"Bearer {create_access_token(ADMIN_ID)}"},
+    )
+
+    assert response.status_code == 409, response.text
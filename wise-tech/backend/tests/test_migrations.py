@@ -0,0 +1,126 @@
+"""
+Upgrading a database created before the brand/category lookup tables and
+the unique (brand_id, name) gadget key.
+"""
+
+import sqlite3
+from contextlib import closing
+
+from sqlalchemy import create_engine, inspect, select
+
+from app.db import migrate, snapshot
+from app.db.base_class import Base
+from app.models.gadget import Brand, Category, Gadget, GadgetSpec
+from app.models.review import Review
+
+# Schema create_all built at the baseline revision
+BASELINE_DDL = """
+CREATE TABLE users (
+    id INTEGER NOT NULL, email VARCHAR NOT NULL, username VARCHAR NOT NULL,
+    hashed_password VARCHAR NOT NULL, full_name VARCHAR, bio VARCHAR, profile_photo VARCHAR,
+    is_admin BOOLEAN, joined_date DATETIME, PRIMARY KEY (id)
+);
+CREATE INDEX ix_users_full_name ON users (full_name);
+CREATE UNIQUE INDEX ix_users_username ON users (username);
+CREATE INDEX ix_users_id ON users (id);
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+CREATE TABLE gadgets (
+    id INTEGER NOT NULL, name VARCHAR NOT NULL, brand VARCHAR NOT NULL, category VARCHAR NOT NULL,
+    description TEXT NOT NULL, price FLOAT NOT NULL, release_date DATETIME NOT NULL,
+    image_url VARCHAR, created_at DATETIME, updated_at DATETIME, PRIMARY KEY (id)
+);
+CREATE INDEX ix_gadgets_id ON gadgets (id);
+CREATE INDEX ix_gadgets_category ON gadgets (category);
+CREATE INDEX ix_gadgets_name ON gadgets (name);
+CREATE INDEX ix_gadgets_brand ON gadgets (brand);
+CREATE TABLE gadget_specs (
+    id INTEGER NOT NULL, gadget_id INTEGER NOT NULL, spec_name VARCHAR NOT NULL,
+    spec_value VARCHAR NOT NULL, PRIMARY KEY (id), FOREIGN KEY(gadget_id) REFERENCES gadgets (id)
+);
+CREATE INDEX ix_gadget_specs_id ON gadget_specs (id);
+CREATE TABLE reviews (
+    id INTEGER NOT NULL, user_id INTEGER NOT NULL, gadget_id INTEGER NOT NULL,
+    title VARCHAR NOT NULL, content TEXT NOT NULL, rating FLOAT NOT NULL, pros TEXT, cons TEXT,
+    status VARCHAR(8) NOT NULL, created_at DATETIME, updated_at DATETIME, PRIMARY KEY (id),
+    FOREIGN KEY(user_id) REFERENCES users (id), FOREIGN KEY(gadget_id) REFERENCES gadgets (id)
+);
+CREATE INDEX ix_reviews_id ON reviews (id);
+"""
+BASELINE_COLUMNS = {
+    "users": "id, email, username, hashed_password, full_name, bio, profile_photo, is_admin, joined_date",
+    "gadgets": "id, name, brand, category, description, price, release_date, image_url, created_at, updated_at",
+    "gadget_specs": "id, gadget_id, spec_name, spec_value",
+    "reviews": "id, user_id, gadget_id, title, content, rating, pros, cons, status, created_at, updated_at",
+}
+
+
+def _baseline_database(path):
+    """The sample data in the baseline schema, with category names in mixed forms."""
+    with closing(sqlite3.connect(path)) as connection:
+        connection.executescript(BASELINE_DDL)
+        connection.execute("ATTACH DATABASE ? AS sample", (str(snapshot.ensure_snapshot()),))
+        for table, columns in BASELINE_COLUMNS.items():
+            connection.execute(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM sample.{table}")
+        connection.execute("UPDATE gadgets SET category = 'smartphone' WHERE id = 1")
+        connection.execute("UPDATE gadgets SET brand = ' SAMSUNG' WHERE brand = 'Samsung' AND id % 2 = 0")
+        # A duplicate of gadget 3 from a concurrent import, with a review and a spec
+        connection.execute(
+            f"INSERT INTO gadgets ({BASELINE_COLUMNS['gadgets']}) SELECT 1000, name, brand, category, "
+            "description, price, release_date, image_url, created_at, updated_at FROM gadgets WHERE id = 3"
+        )
+        connection.execute("UPDATE reviews SET gadget_id = 1000 WHERE id = (SELECT min(id) FROM reviews)")
+        connection.execute("INSERT INTO gadget_specs (gadget_id, spec_name, spec_value) VALUES (1000, 'RAM', '1GB')")
+        connection.commit()
+
+
+def test_upgrade_backfills_lookups_and_matches_models(tmp_path):
+    path = tmp_path / "old.db"
+    _baseline_database(path)
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        # create_all at app startup adds the new tables, but not the new columns
+        Base.metadata.create_all(bind=engine)
+        migrate.upgrade(engine)
+        # Running it again is a no-op
+        migrate.upgrade(engine)
+
+        inspector = inspect(engine)
+        for table in Base.metadata.sorted_tables:
+            assert {column["name"] for column in inspector.get_columns(table.name)} == set(table.c.keys())
+            assert {index["name"] for index in inspector.get_indexes(table.name)} >= {
+                index.name for index in table.indexes
+            }
+
+        with engine.connect() as connection:
+            assert connection.execute(
+                select(Gadget.id).where((Gadget.brand_id.is_(None)) | (Gadget.category_id.is_(None)))
+            ).first() is None
+            categories = connection.execute(select(Category.key, Category.name)).all()
+            assert sorted(key for key, _ in categories) == ["laptop", "smartphone", "tablet"]
+            # Named after the most common spelling
+            assert dict(categories)["smartphone"] == "Smartphones"
+            assert connection.execute(select(Gadget.category).where(Gadget.id == 1)).scalar_one() == "Smartphones"
+            # The duplicate was merged into the original
+            assert connection.execute(select(Gadget.id).where(Gadget.id == 1000)).first() is None
+            assert connection.execute(select(Review.gadget_id).order_by(Review.id).limit(1)).scalar_one() == 3
+            assert connection.execute(
+                select(GadgetSpec.id).where(GadgetSpec.gadget_id == 1000)
+            ).first() is None
+            samsung = connection.execute(select(Brand.id).where(Brand.key == "samsung")).scalar_one()
+            assert set(connection.execute(
+                select(Gadget.brand).where(Gadget.brand_id == samsung).distinct()
+            ).scalars()) == {"Samsung"}
+    finally:
+        engine.dispose()
+
+
+def test_restore_migrates_a_database_with_its_own_data(tmp_path):
+    path = tmp_path / "old.db"
+    _baseline_database(path)
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        assert snapshot.restore(engine) is False
+        assert snapshot.stored_fingerprint(engine) is None
+        assert "brand_id" in {column["name"] for column in inspect(engine).get_columns("gadgets")}
+    finally:
+        engine.dispose()
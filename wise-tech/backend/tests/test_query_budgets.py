@@ -0,0 +1,73 @@
+"""
+SQL statement budgets per endpoint, run in strict lazy-load mode so any N+1
+pattern fails with LazyLoadError even before a budget is exceeded.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.core.query_stats import QUERY_COUNT_HEADER, LazyLoadError, strict_lazy_loads
+from app.core.security import create_access_token
+from app.models.gadget import Gadget
+
+ADMIN_ID = 1
+# Sample user with the most reviews
+USER_ID = 12
+
+BUDGETS = [
+    ("GET", "/api/auth/me", USER_ID, None, 1),
+    ("GET", "/api/users/profile", USER_ID, None, 1),
+    ("GET", "/api/users/reviews", USER_ID, None, 2),
+    ("GET", "/api/gadgets", None, None, 3),
+    ("GET", "/api/gadgets/search?query=pro", None, None, 3),
+    ("GET", "/api/gadgets/featured", None, None, 3),
+    ("GET", "/api/gadgets/categories", None, None, 1),
+    ("GET", "/api/gadgets/batch?ids=1,2,3,4,5", None, None, 3),
+    ("GET", "/api/gadgets/stats?ids=1,2,3,4,5", None, None, 1),
+    ("GET", "/api/gadgets/1", None, None, 3),
+    ("GET", "/api/gadgets/1/reviews", None, None, 2),
+    ("GET", "/api/reviews", None, None, 2),
+    ("GET", "/api/reviews/recent", None, None, 1),
+    ("GET", "/api/home", None, None, 7),
+    ("GET", "/api/admin/users", ADMIN_ID, None, 2),
+    ("GET", "/api/admin/reviews", ADMIN_ID, None, 2),
+    ("GET", "/api/admin/gadgets", ADMIN_ID, None, 4),
+    ("GET", "/api/admin/dashboard/stats", ADMIN_ID, None, 5),
+    (
+        "POST", "/api/gadgets", ADMIN_ID,
+        {
+            "gadget_in": {
+                "name": "Budget Phone", "brand": "Samsung", "category": "Smartphones",
+                "description": "Test gadget", "price": 199.0, "release_date": "2024-01-01T00:00:00",
+            },
+            "specs": [{"name": "RAM", "value": "8GB"}, {"name": "Storage", "value": "128GB"}],
+        },
+        5,
+    ),
+    ("PUT", "/api/gadgets/1", ADMIN_ID, {"price": 123.0}, 5),
+    ("DELETE", "/api/gadgets/2", ADMIN_ID, None, 7),
+    ("PUT", "/api/admin/reviews/1", ADMIN_ID, {"title": "Edited title"}, 3),
+]
+
+
+@pytest.mark.parametrize(
+    "method,path,user_id,body,budget",
+    BUDGETS,
+    ids=[f"{method} {path}" for method, path, *_ in BUDGETS],
+)
+def test_query_budget(client, query_budget, method, path, user_id, body, budget):
+    headers = {}
+    if user_id is not None:
+        headers["Authorization"] = f"Bearer {create_access_token(user_id)}"
+
+    with query_budget(budget) as statements:
+        response = client.request(method, path, headers=headers, json=body)
+
+    assert response.status_code == 200, response.text
+    assert response.headers[QUERY_COUNT_HEADER] == str(len(statements))
+
+
+def test_strict_mode_rejects_lazy_loads(db):
+    gadget = db.scalars(select(Gadget).limit(1)).one()
+    with strict_lazy_loads(), pytest.raises(LazyLoadError):
+        gadget.specs
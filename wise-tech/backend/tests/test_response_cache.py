@@ -0,0 +1,59 @@
+"""
+Hot-response cache: cacheable responses are marked internally, never with a
+Cache-Control that lets clients reuse them without revalidating.
+"""
+
+from sqlalchemy import select
+
+from app.core.compression import SERVER_CACHE_HEADER
+from app.core.security import create_access_token
+from app.models.review import Review
+
+USER_ID = 2
+
+
+def test_cacheable_response_is_revalidated_by_clients(client):
+    first = client.get("/api/gadgets/1")
+    second = client.get("/api/gadgets/1")
+
+    assert first.headers["cache-control"] == "no-cache"
+    assert SERVER_CACHE_HEADER.lower() not in first.headers
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["etag"] == first.headers["etag"]
+
+    not_modified = client.get("/api/gadgets/1", headers={"If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+def test_refetch_after_write_sees_new_review(client, db):
+    reviewed = set(db.scalars(select(Review.gadget_id).where(Review.user_id == USER_ID)))
+    gadget_id = next(gadget_id for gadget_id in range(1, 100) if gadget_id not in reviewed)
+    before = client.get(f"/api/gadgets/{gadget_id}")
+
+    created = client.post(
+        "/api/reviews",
+        json={
+            "gadget_id": gadget_id, "title": "Fresh review", "content": "Just posted",
+            "rating": 4, "pros": "Fast", "cons": "None",
+        },
+        headers={"Authorization": f"Bearer {create_access_token(USER_ID)}"},
+    )
+    assert created.status_code == 200, created.text
+
+    after = client.get(f"/api/gadgets/{gadget_id}", headers={"If-None-Match": before.headers["etag"]})
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert "Fresh review" in [review["title"] for review in after.json()["reviews"]]
+
+
+def test_private_responses_are_not_marked(client):
+    response = client.get(
+        "/api/users/profile",
+        headers={"Authorization": f"Bearer {create_access_token(USER_ID)}"},
+    )
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "public" not in response.headers.get("cache-control", "")
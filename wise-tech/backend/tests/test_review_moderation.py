@@ -0,0 +1,71 @@
+"""
+Bulk review moderation: the UPDATE must never run without a WHERE clause.
+"""
+
+import pytest
+from sqlalchemy import func, select
+
+from app import crud
+from app.core.security import create_access_token
+from app.models.review import Review, ReviewStatus
+
+ADMIN_ID = 1
+
+
+@pytest.fixture
+def admin_headers():
+    return {"Authorization": f"Bearer {create_access_token(ADMIN_ID)}"}
+
+
+def count_status(db, status):
+    return db.scalar(select(func.count(Review.id)).where(Review.status == status))
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [{}, {"search": ""}, {"search": "   "}, {"category": ""}, {"search": "", "category": " "}],
+)
+def test_blank_filter_is_rejected(client, db, admin_headers, filter):
+    response = client.post(
+        "/api/admin/reviews/moderate",
+        json={"status": "rejected", "filter": filter},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 422
+    assert count_status(db, ReviewStatus.REJECTED) == 0
+
+
+def test_moderation_condition_requires_a_filter():
+    with pytest.raises(ValueError):
+        crud.review.moderation_condition()
+    with pytest.raises(ValueError):
+        crud.review.moderation_condition(search="", category=None)
+
+
+def test_moderate_by_ids(client, db, admin_headers):
+    response = client.post(
+        "/api/admin/reviews/moderate",
+        json={"status": "rejected", "ids": [1, 2, 999999]},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["updated"] == 2
+    assert body["not_found"] == [999999]
+    rejected = db.scalars(select(Review.id).where(Review.status == ReviewStatus.REJECTED)).all()
+    assert sorted(rejected) == [1, 2]
+
+
+def test_moderate_by_filter(client, db, admin_headers):
+    response = client.post(
+        "/api/admin/reviews/moderate",
+        json={"status": "rejected", "filter": {"user_id": 12}},
+        headers=admin_headers,
+    )
+
+    assert response.status_code == 200, response.text
+    expected = db.scalar(select(func.count(Review.id)).where(Review.user_id == 12))
+    assert response.json()["updated"] == expected > 0
+    assert count_status(db, ReviewStatus.REJECTED) == expected
@@ -0,0 +1,34 @@
+"""
+Sample data snapshots: what the fingerprint covers and when restore reloads.
+"""
+
+from sqlalchemy import create_engine, text
+
+from app.db import snapshot
+
+
+def test_fingerprint_covers_code_the_seed_runs_through(tmp_path, monkeypatch):
+    source = tmp_path / "seed_dependency.py"
+    source.write_text("KEY = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(snapshot, "SEED_DEPENDENCIES", ("seed_dependency",))
+    before = snapshot.fingerprint()
+
+    source.write_text("KEY = 2\n")
+
+    assert snapshot.fingerprint() != before
+
+
+def test_restore_replaces_outdated_snapshot_only(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'dev.db'}")
+    try:
+        assert snapshot.restore(engine) is True
+        assert snapshot.stored_fingerprint(engine) == snapshot.fingerprint()
+        assert snapshot.restore(engine) is False
+
+        with engine.begin() as connection:
+            connection.execute(text(f"UPDATE {snapshot.FINGERPRINT_TABLE} SET fingerprint = 'outdated'"))
+        assert snapshot.restore(engine) is True
+        assert snapshot.stored_fingerprint(engine) == snapshot.fingerprint()
+    finally:
+        engine.dispose()
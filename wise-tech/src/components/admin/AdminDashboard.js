@@ -16,6 +16,10 @@ const AdminDashboard = () => {
   const [gadgets, setGadgets] = useState([]);
   const [users, setUsers] = useState([]);
   const [reviews, setReviews] = useState([]);
+  // X-Next-Cursor of each admin listing (null once everything is loaded)
+  const [usersCursor, setUsersCursor] = useState(null);
+  const [gadgetsCursor, setGadgetsCursor] = useState(null);
+  const [reviewsCursor, setReviewsCursor] = useState(null);
   const [error, setError] = useState("");
   const [dataLoading, setDataLoading] = useState(false);
   const [alert, setAlert] = useState({ show: false, type: "", message: "" });
@@ -112,18 +116,6 @@ const AdminDashboard = () => {
   const [reviewSortOrder, setReviewSortOrder] = useState("desc"); // asc, desc
 
   // Calculate stats dynamically from current data
-  const calculateStats = () => {
-    const totalGadgets = gadgets.length;
-    const totalUsers = users.length;
-    const totalReviews = reviews.length;
-
-    return {
-      totalGadgets,
-      totalUsers,
-      totalReviews,
-    };
-  };
-
   // Helper function to sort array by field
   const sortData = (data, sortField, sortOrder) => {
     return [...data].sort((a, b) => {
@@ -246,94 +238,26 @@ const AdminDashboard = () => {
 
   // Filter and search functions
   const filteredUsers = (() => {
-    const filtered = users.filter((user) => {
-      const matchesSearch =
-        userSearch === "" ||
-        user.username?.toLowerCase().includes(userSearch.toLowerCase()) ||
-        user.full_name?.toLowerCase().includes(userSearch.toLowerCase()) ||
-        user.email?.toLowerCase().includes(userSearch.toLowerCase());
-
-      const matchesFilter =
-        userFilter === "all" ||
-        (userFilter === "admin" && user.is_admin) ||
-        (userFilter === "regular" && !user.is_admin);
-
-      return matchesSearch && matchesFilter;
-    });
-
+    // Search and role are filtered by the server (fetchUsers)
     return sortData(
-      filtered,
+      users,
       userSort === "role" ? "is_admin" : userSort,
       userSortOrder
     );
   })();
 
   const filteredGadgets = (() => {
-    const filtered = gadgets.filter((gadget) => {
-      const matchesSearch =
-        gadgetSearch === "" ||
-        gadget.name?.toLowerCase().includes(gadgetSearch.toLowerCase()) ||
-        gadget.brand?.toLowerCase().includes(gadgetSearch.toLowerCase()) ||
-        gadget.description?.toLowerCase().includes(gadgetSearch.toLowerCase());
-
-      const matchesFilter =
-        gadgetFilter === "all" ||
-        gadget.category?.toLowerCase() === gadgetFilter.toLowerCase();
-
-      return matchesSearch && matchesFilter;
-    });
-
-    return sortData(filtered, gadgetSort, gadgetSortOrder);
+    // Search and category are filtered by the server (fetchGadgets)
+    return sortData(gadgets, gadgetSort, gadgetSortOrder);
   })();
 
   const filteredReviews = (() => {
-    const filtered = reviews.filter((review) => {
-      const matchesSearch =
-        reviewSearch === "" ||
-        review.title?.toLowerCase().includes(reviewSearch.toLowerCase()) ||
-        review.content?.toLowerCase().includes(reviewSearch.toLowerCase()) ||
-        review.user_name?.toLowerCase().includes(reviewSearch.toLowerCase()) ||
-        review.gadget?.name?.toLowerCase().includes(reviewSearch.toLowerCase());
-
-      const matchesRating =
-        reviewFilter === "all" || review.rating === parseInt(reviewFilter);
-
-      // Date filter
-      const matchesDate =
-        reviewDateFilter === "all" ||
-        (() => {
-          if (!review.created_at) return true;
-
-          const reviewDate = new Date(review.created_at);
-          const now = new Date();
-          const today = new Date(
-            now.getFullYear(),
-            now.getMonth(),
-            now.getDate()
-          );
-
-          switch (reviewDateFilter) {
-            case "today":
-              return reviewDate >= today;
-            case "week":
-              const weekAgo = new Date(today);
-              weekAgo.setDate(weekAgo.getDate() - 7);
-              return reviewDate >= weekAgo;
-            case "month":
-              const monthAgo = new Date(today);
-              monthAgo.setMonth(monthAgo.getMonth() - 1);
-              return reviewDate >= monthAgo;
-            case "year":
-              const yearAgo = new Date(today);
-              yearAgo.setFullYear(yearAgo.getFullYear() - 1);
-              return reviewDate >= yearAgo;
-            default:
-              return true;
-          }
-        })();
-
-      return matchesSearch && matchesRating && matchesDate;
-    });
+    // Search, date and minimum rating are filtered by the server
+    // (fetchReviews); the endpoint has no exact-rating filter
+    const filtered = reviews.filter(
+      (review) =>
+        reviewFilter === "all" || review.rating === parseInt(reviewFilter)
+    );
 
     // Use user_name for sorting if sort field is user_name
     const sortField =
@@ -474,62 +398,88 @@ const AdminDashboard = () => {
     }
   };
 
-  const fetchUsers = async () => {
+  // Start of the review date filter, as sent to the server
+  const reviewCreatedFrom = () => {
+    if (reviewDateFilter === "all") return undefined;
+
+    const now = new Date();
+    const from = new Date(now.getFullYear(), now.getMonth(), now.getDate());
+    switch (reviewDateFilter) {
+      case "week":
+        from.setDate(from.getDate() - 7);
+        break;
+      case "month":
+        from.setMonth(from.getMonth() - 1);
+        break;
+      case "year":
+        from.setFullYear(from.getFullYear() - 1);
+        break;
+      default:
+        break;
+    }
+    return from.toISOString();
+  };
+
+  // Each fetch loads the first page for the current filters, or appends the
+  // next page when given the cursor from the previous one
+  const fetchUsers = async (cursor = null) => {
     try {
       setDataLoading(true);
-      const data = await adminAPI.getUsers({ pageSize: 50 });
-      setUsers(data.users || data || []);
+      const { items, nextCursor } = await adminAPI.getUsers({
+        cursor,
+        search: userSearch,
+        is_admin: userFilter === "all" ? undefined : userFilter === "admin",
+      });
+      setUsers((prevUsers) => (cursor ? [...prevUsers, ...items] : items));
+      setUsersCursor(nextCursor);
     } catch (error) {
       console.error("Error fetching users:", error);
       setError("Failed to load users");
-      setUsers([]);
+      if (!cursor) setUsers([]);
     } finally {
       setDataLoading(false);
     }
   };
 
-  const fetchReviews = async () => {
+  const fetchReviews = async (cursor = null) => {
     try {
       setDataLoading(true);
-      console.log("🔄 AdminDashboard - Fetching reviews...");
-
-      const data = await adminAPI.getReviews({ pageSize: 50 });
-      const reviewsData = data.reviews || data || [];
-
-      console.log(
-        "✅ AdminDashboard - Reviews fetched:",
-        reviewsData.length,
-        "reviews"
-      );
-      console.log("📋 AdminDashboard - Review data:", reviewsData);
-
-      // Sort reviews by creation date (newest first) - basic sort for initial load
-      const sortedReviews = [...reviewsData].sort((a, b) => {
-        const dateA = new Date(a.created_at || a.date || 0);
-        const dateB = new Date(b.created_at || b.date || 0);
-        return dateB - dateA; // Newest first
+      const { items, nextCursor } = await adminAPI.getReviews({
+        cursor,
+        search: reviewSearch,
+        min_rating: reviewFilter === "all" ? undefined : reviewFilter,
+        created_from: reviewCreatedFrom(),
+        sort: "newest",
       });
-      setReviews(sortedReviews);
-
-      console.log("✅ AdminDashboard - Reviews sorted and set to state");
+      setReviews((prevReviews) =>
+        cursor ? [...prevReviews, ...items] : items
+      );
+      setReviewsCursor(nextCursor);
     } catch (error) {
       console.error("❌ AdminDashboard - Error fetching reviews:", error);
       setError("Failed to load reviews");
-      setReviews([]);
+      if (!cursor) setReviews([]);
     } finally {
       setDataLoading(false);
     }
   };
 
-  const fetchGadgets = async () => {
+  const fetchGadgets = async (cursor = null) => {
     try {
       setDataLoading(true);
-      const data = await adminAPI.getGadgets({ pageSize: 50 });
-      setGadgets(data.gadgets || data || []);
+      const { items, nextCursor } = await adminAPI.getGadgets({
+        cursor,
+        search: gadgetSearch,
+        category: gadgetFilter === "all" ? undefined : gadgetFilter,
+      });
+      setGadgets((prevGadgets) =>
+        cursor ? [...prevGadgets, ...items] : items
+      );
+      setGadgetsCursor(nextCursor);
     } catch (error) {
       console.error("Error fetching gadgets:", error);
       setError("Failed to load gadgets");
-      setGadgets([]);
+      if (!cursor) setGadgets([]);
     } finally {
       setDataLoading(false);
     }
@@ -611,8 +561,7 @@ const AdminDashboard = () => {
       });
 
       // Refresh stats
-      const calculatedStats = calculateStats();
-      setStats(calculatedStats);
+      await fetchDashboardStats();
     } catch (error) {
       console.error("❌ Error creating user:", error);
       showErrorAlert(
@@ -651,8 +600,7 @@ const AdminDashboard = () => {
         showSuccessAlert("User deleted successfully!");
 
         // Refresh stats
-        const calculatedStats = calculateStats();
-        setStats(calculatedStats);
+        await fetchDashboardStats();
       } catch (error) {
         console.error("❌ Error deleting user:", error);
         showErrorAlert(
@@ -722,8 +670,7 @@ const AdminDashboard = () => {
         showSuccessAlert("Review deleted successfully!");
 
         // Refresh stats
-        const calculatedStats = calculateStats();
-        setStats(calculatedStats);
+        await fetchDashboardStats();
       } catch (error) {
         console.error("❌ Error deleting review:", error);
         showErrorAlert(
@@ -811,8 +758,7 @@ const AdminDashboard = () => {
       showSuccessAlert("Gadget created successfully!");
 
       // Refresh stats
-      const calculatedStats = calculateStats();
-      setStats(calculatedStats);
+      await fetchDashboardStats();
     } catch (error) {
       console.error("❌ Error creating gadget:", error);
       showErrorAlert(
@@ -886,8 +832,7 @@ const AdminDashboard = () => {
         showSuccessAlert("Gadget deleted successfully!");
 
         // Refresh stats
-        const calculatedStats = calculateStats();
-        setStats(calculatedStats);
+        await fetchDashboardStats();
       } catch (error) {
         console.error("❌ Error deleting gadget:", error);
         showErrorAlert(
@@ -1116,13 +1061,9 @@ const AdminDashboard = () => {
 
   // Check if user is admin and fetch data
   useEffect(() => {
+    // The lists are loaded by the filter effects below once authorized
     const fetchAllData = async () => {
-      await Promise.all([
-        fetchDashboardStats(),
-        fetchUsers(),
-        fetchReviews(),
-        fetchGadgets(),
-      ]);
+      await fetchDashboardStats();
     };
 
     const checkAdminAccess = async () => {
@@ -1179,6 +1120,29 @@ const AdminDashboard = () => {
     checkAdminAccess();
   }, []);
 
+  // Reload the first page of a list when its server-side filters change,
+  // waiting for typing in the search box to pause
+  useEffect(() => {
+    if (!isAuthorized) return undefined;
+    const timer = setTimeout(() => fetchUsers(), 300);
+    return () => clearTimeout(timer);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [isAuthorized, userSearch, userFilter]);
+
+  useEffect(() => {
+    if (!isAuthorized) return undefined;
+    const timer = setTimeout(() => fetchGadgets(), 300);
+    return () => clearTimeout(timer);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [isAuthorized, gadgetSearch, gadgetFilter]);
+
+  useEffect(() => {
+    if (!isAuthorized) return undefined;
+    const timer = setTimeout(() => fetchReviews(), 300);
+    return () => clearTimeout(timer);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [isAuthorized, reviewSearch, reviewFilter, reviewDateFilter]);
+
   // Listen for new reviews being submitted to refresh the review list
   useEffect(() => {
     const handleNewReview = async (event) => {
@@ -1216,8 +1180,7 @@ const AdminDashboard = () => {
         await fetchReviews();
 
         // Also refresh stats since total review count might have changed
-        const updatedStats = calculateStats();
-        setStats(updatedStats);
+        await fetchDashboardStats();
 
         console.log("✅ AdminDashboard - Review list refreshed successfully");
       } catch (error) {
@@ -1235,7 +1198,7 @@ const AdminDashboard = () => {
     return () => {
       window.removeEventListener("reviewSubmitted", handleNewReview);
     };
-  }, [fetchReviews, calculateStats]);
+  }, [fetchReviews, fetchDashboardStats]);
 
   // Show loading while checking authorization
   if (isLoading) {
@@ -1860,7 +1823,7 @@ const AdminDashboard = () => {
                   {/* Results Count */}
                   <div className="mt-4 flex items-center justify-between">
                     <span className="text-sm text-gray-500">
-                      {filteredUsers.length} of {users.length} users
+                      {users.length} users{usersCursor && " loaded"}
                     </span>
                   </div>
 
@@ -1985,6 +1948,18 @@ const AdminDashboard = () => {
                           </tbody>
                         </table>
                       </div>
+                      {usersCursor && (
+                        <div className="mt-4 flex justify-center">
+                          <button
+                            type="button"
+                            onClick={() => fetchUsers(usersCursor)}
+                            disabled={dataLoading}
+                            className="inline-flex items-center px-4 py-2 border border-gray-300 shadow-sm text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50"
+                          >
+                            Load more users
+                          </button>
+                        </div>
+                      )}
                     </div>
                   </div>
                 </div>
@@ -2064,7 +2039,7 @@ const AdminDashboard = () => {
                   {/* Results Count */}
                   <div className="mt-4 flex items-center justify-between">
                     <span className="text-sm text-gray-500">
-                      {filteredGadgets.length} of {gadgets.length} gadgets
+                      {gadgets.length} gadgets{gadgetsCursor && " loaded"}
                     </span>
                   </div>
 
@@ -2192,6 +2167,18 @@ const AdminDashboard = () => {
                           </tbody>
                         </table>
                       </div>
+                      {gadgetsCursor && (
+                        <div className="mt-4 flex justify-center">
+                          <button
+                            type="button"
+                            onClick={() => fetchGadgets(gadgetsCursor)}
+                            disabled={dataLoading}
+                            className="inline-flex items-center px-4 py-2 border border-gray-300 shadow-sm text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50"
+                          >
+                            Load more gadgets
+                          </button>
+                        </div>
+                      )}
                     </div>
                   </div>
                 </div>
@@ -2215,7 +2202,7 @@ const AdminDashboard = () => {
                   <div className="mt-4 sm:mt-0 sm:ml-16 sm:flex-none">
                     <button
                       type="button"
-                      onClick={fetchReviews}
+                      onClick={() => fetchReviews()}
                       disabled={dataLoading}
                       className="inline-flex items-center justify-center rounded-md border border-transparent bg-indigo-600 px-4 py-2 text-sm font-medium text-white shadow-sm hover:bg-indigo-700 focus:outline-none focus:ring-2 focus:ring-indigo-500 focus:ring-offset-2 disabled:opacity-50"
                     >
@@ -2334,7 +2321,7 @@ const AdminDashboard = () => {
                 {/* Results Count */}
                 <div className="mt-4">
                   <span className="text-sm text-gray-500">
-                    {filteredReviews.length} of {reviews.length} reviews
+                    {filteredReviews.length} of {reviews.length} reviews{reviewsCursor && " loaded"}
                   </span>
                 </div>
                 <div className="mt-8 flex flex-col">
@@ -2485,6 +2472,18 @@ const AdminDashboard = () => {
                           </tbody>
                         </table>
                       </div>
+                      {reviewsCursor && (
+                        <div className="mt-4 flex justify-center">
+                          <button
+                            type="button"
+                            onClick={() => fetchReviews(reviewsCursor)}
+                            disabled={dataLoading}
+                            className="inline-flex items-center px-4 py-2 border border-gray-300 shadow-sm text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50"
+                          >
+                            Load more reviews
+                          </button>
+                        </div>
+                      )}
                     </div>
                   </div>
                 </div>
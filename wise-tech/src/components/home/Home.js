@@ -8,18 +8,17 @@
  * - Navigasi ke kategori gadget (smartphones, laptops, tablets)
  *
  * API yang digunakan:
- * - GET /api/gadgets/all - Mengambil semua gadget untuk kalkulasi featured
- * - GET /api/reviews/recent - Mengambil ulasan terbaru
+ * - GET /api/home - Mengambil gadget unggulan (beserta jumlah review), ulasan terbaru,
+ *   dan daftar kategori dalam satu request
  *
- * Logic Featured Gadgets:
- * 1. Mengambil semua gadget dengan getAllGadgets()
- * 2. Filter gadget yang memiliki rating dan review
- * 3. Sort berdasarkan rating tertinggi, kemudian jumlah review terbanyak
- * 4. Ambil 4 gadget teratas sebagai featured
+ * Logic Featured Gadgets (dihitung di backend):
+ * 1. Urutkan gadget berdasarkan rating rata-rata tertinggi
+ * 2. Kemudian berdasarkan jumlah review terbanyak
+ * 3. Ambil 4 gadget teratas sebagai featured
  */
 import React, { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
-import { gadgetAPI, reviewAPI, authUtils } from "../../utils/api";
+import { homeAPI, authUtils } from "../../utils/api";
 import GadgetImage from "../gadgets/GadgetImage";
 
 const Home = () => {
@@ -62,71 +61,18 @@ const Home = () => {
         setError(null);
 
         console.log(
-          "Fetching all gadgets to calculate featured based on rating and reviews..."
+          "Fetching home page data from:",
+          "http://localhost:8000/api/home"
         );
-        console.log(
-          "Fetching recent reviews from:",
-          "http://localhost:8000/api/reviews/recent"
-        );
-
-        // Fetch all gadgets and recent reviews simultaneously
-        const [allGadgetsResponse, reviewsResponse] = await Promise.all([
-          gadgetAPI.getAllGadgets(50), // Get up to 50 gadgets to calculate featured
-          reviewAPI.getRecentReviews(6), // Get 6 recent reviews
-        ]);
 
-        console.log("All gadgets response:", allGadgetsResponse);
-        console.log("Recent reviews response:", reviewsResponse);
+        // Featured gadgets, recent reviews and categories in one round-trip
+        const homeResponse = await homeAPI.getHome(4, 6);
+        const reviewsResponse = homeResponse.recent_reviews;
 
-        // Calculate featured gadgets based on rating and review count
-        let featuredList = [];
-        if (allGadgetsResponse && allGadgetsResponse.length > 0) {
-          // Sort gadgets by a combination of rating and review count
-          featuredList = allGadgetsResponse
-            .filter((gadget) => gadget.average_rating > 0) // Only gadgets with rating > 0
-            .sort((a, b) => {
-              // Primary sort: average rating (higher is better)
-              const ratingDiff =
-                (b.average_rating || 0) - (a.average_rating || 0);
-              if (Math.abs(ratingDiff) > 0.1) return ratingDiff;
+        console.log("Home response:", homeResponse);
 
-              // Secondary sort: review count (more reviews is better, but treat 0 as having some value)
-              return (b.review_count || 0) - (a.review_count || 0);
-            })
-            .slice(0, 4); // Take top 4 as featured
-
-          // If no gadgets have good ratings, just take first 4 gadgets
-          if (featuredList.length === 0) {
-            featuredList = allGadgetsResponse.slice(0, 4);
-          }
-
-          // Fetch real review count for featured gadgets to show accurate data
-          try {
-            const featuredWithRealCounts = await Promise.all(
-              featuredList.map(async (gadget) => {
-                try {
-                  const reviews = await gadgetAPI.getGadgetReviews(gadget.id);
-                  return {
-                    ...gadget,
-                    real_review_count: reviews ? reviews.length : 0,
-                  };
-                } catch (err) {
-                  console.warn(
-                    `Failed to fetch reviews for gadget ${gadget.id}:`,
-                    err
-                  );
-                  return {
-                    ...gadget,
-                    real_review_count: gadget.review_count || 0,
-                  };
-                }
-              })
-            );
-            featuredList = featuredWithRealCounts;
-          } catch (err) {
-            console.warn("Failed to fetch real review counts:", err);
-          }
-        }
+        // Featured gadgets come ranked, with their real review counts
+        const featuredList = homeResponse.featured || [];
 
         setFeaturedGadgets(featuredList);
         setRecentReviews(reviewsResponse || []);
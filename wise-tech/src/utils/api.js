@@ -40,6 +40,43 @@ const apiCall = async (endpoint, options = {}) => {
   }
 };
 
+/**
+ * API call for a keyset-paginated listing: returns the items and the cursor
+ * of the next page (X-Next-Cursor header, null on the last page)
+ */
+const apiPageCall = async (endpoint) => {
+  const headers = {};
+  const token = localStorage.getItem("access_token");
+  if (token) {
+    headers.Authorization = `Bearer ${token}`;
+  }
+
+  const response = await fetch(`${API_BASE_URL}${endpoint}`, { headers });
+  if (!response.ok) {
+    throw new Error(`HTTP error! status: ${response.status}`);
+  }
+
+  return {
+    items: await response.json(),
+    nextCursor: response.headers.get("X-Next-Cursor"),
+  };
+};
+
+/**
+ * Query string for the admin listings: page size, cursor and the filters
+ * the endpoint understands (params keys are the query parameter names)
+ */
+const adminListQuery = (params = {}) => {
+  const queryString = new URLSearchParams();
+  queryString.append("limit", params.limit || 50);
+  Object.entries(params).forEach(([key, value]) => {
+    if (key !== "limit" && value !== undefined && value !== null && value !== "") {
+      queryString.append(key, value);
+    }
+  });
+  return queryString.toString();
+};
+
 /**
  * Authentication APIs
  */
@@ -161,6 +198,23 @@ export const gadgetAPI = {
   getGadgetReviews: async (gadgetId) => {
     return apiCall(`/api/gadgets/${gadgetId}/reviews`);
   },
+
+  // Get review count, average rating and last review time for many gadgets
+  getGadgetStats: async (gadgetIds) => {
+    return apiCall(`/api/gadgets/stats?ids=${gadgetIds.join(",")}`);
+  },
+};
+
+/**
+ * Home page API
+ */
+export const homeAPI = {
+  // Get featured gadgets, recent reviews and categories in one request
+  getHome: async (featuredLimit = 4, reviewsLimit = 6) => {
+    return apiCall(
+      `/api/home?featured_limit=${featuredLimit}&reviews_limit=${reviewsLimit}`
+    );
+  },
 };
 
 /**
@@ -373,167 +427,20 @@ export const adminAPI = {
     }
   },
 
-  // Get all users (admin only)
+  // One page of users (admin only); params: limit, cursor, search, is_admin, sort
   getUsers: async (params = {}) => {
-    try {
-      const queryString = new URLSearchParams();
-      if (params.page) queryString.append("page", params.page);
-      if (params.pageSize) queryString.append("page_size", params.pageSize);
-
-      const endpoint = queryString.toString()
-        ? `/api/admin/users?${queryString.toString()}`
-        : "/api/admin/users";
-
-      const users = await apiCall(endpoint);
-
-      // Add review count to each user
-      try {
-        const allReviews = await this.getReviews();
-        const reviewCounts = {};
-        allReviews.forEach((review) => {
-          reviewCounts[review.user_id] =
-            (reviewCounts[review.user_id] || 0) + 1;
-        });
-
-        return users.map((user) => ({
-          ...user,
-          review_count: reviewCounts[user.id] || 0,
-        }));
-      } catch (reviewError) {
-        console.warn("Could not fetch review counts for users:", reviewError);
-        return users.map((user) => ({
-          ...user,
-          review_count: 0,
-        }));
-      }
-    } catch (error) {
-      console.log("Admin users endpoint not available, using fallback data");
-
-      // Generate sample user data based on reviews
-      try {
-        const gadgets = await apiCall("/api/gadgets");
-        let allReviews = [];
-
-        for (const gadget of gadgets) {
-          try {
-            const reviews = await apiCall(`/api/gadgets/${gadget.id}/reviews`);
-            allReviews.push(...reviews);
-          } catch (reviewError) {
-            console.warn(
-              `Failed to get reviews for gadget ${gadget.id}:`,
-              reviewError
-            );
-          }
-        }
-
-        // Create user objects from review data
-        const userMap = new Map();
-        allReviews.forEach((review) => {
-          if (!userMap.has(review.user_id)) {
-            userMap.set(review.user_id, {
-              id: review.user_id,
-              email: review.user_name || `user${review.user_id}@example.com`,
-              name: review.user_name || `User ${review.user_id}`,
-              full_name: review.user_name || `User ${review.user_id}`,
-              role: review.user_id === 1 ? "admin" : "user", // Assume user ID 1 is admin
-              status: "Active",
-              is_admin: review.user_id === 1,
-              review_count: 0,
-              created_at: review.created_at,
-              joined_date: review.created_at,
-              last_login: review.created_at,
-            });
-          }
-          // Count reviews for each user
-          const user = userMap.get(review.user_id);
-          user.review_count = (user.review_count || 0) + 1;
-        });
-
-        return Array.from(userMap.values());
-      } catch (fallbackError) {
-        console.error(
-          "Failed to generate user data from reviews:",
-          fallbackError
-        );
-        return [];
-      }
-    }
+    return apiPageCall(`/api/admin/users?${adminListQuery(params)}`);
   },
 
-  // Get all gadgets (use public endpoint for now since admin-specific one doesn't exist)
+  // One page of gadgets (admin only); params: limit, cursor, search, category, brand, sort
   getGadgets: async (params = {}) => {
-    try {
-      // Try admin endpoint first
-      const queryString = new URLSearchParams();
-      if (params.page) queryString.append("page", params.page);
-      if (params.pageSize) queryString.append("page_size", params.pageSize);
-
-      const endpoint = queryString.toString()
-        ? `/api/admin/gadgets?${queryString.toString()}`
-        : "/api/admin/gadgets";
-
-      return await apiCall(endpoint);
-    } catch (error) {
-      console.log(
-        "Admin gadgets endpoint not available, using public endpoint"
-      );
-      // Fallback to public gadgets endpoint
-      return await apiCall("/api/gadgets");
-    }
+    return apiPageCall(`/api/admin/gadgets?${adminListQuery(params)}`);
   },
 
-  // Get all reviews (collect from all gadgets since there's no global endpoint)
+  // One page of reviews (admin only); params: limit, cursor, search, status,
+  // min_rating, created_from, sort
   getReviews: async (params = {}) => {
-    try {
-      // Try admin endpoint first
-      const queryString = new URLSearchParams();
-      if (params.page) queryString.append("page", params.page);
-      if (params.pageSize) queryString.append("page_size", params.pageSize);
-
-      const endpoint = queryString.toString()
-        ? `/api/admin/reviews?${queryString.toString()}`
-        : "/api/admin/reviews";
-
-      return await apiCall(endpoint);
-    } catch (error) {
-      console.log(
-        "Admin reviews endpoint not available, collecting from all gadgets"
-      );
-
-      try {
-        // Get all gadgets first
-        const gadgets = await apiCall("/api/gadgets");
-        const allReviews = [];
-
-        // Collect reviews from all gadgets
-        for (const gadget of gadgets) {
-          try {
-            const reviews = await apiCall(`/api/gadgets/${gadget.id}/reviews`);
-            // Add gadget name to each review for display
-            const reviewsWithGadgetName = reviews.map((review, index) => ({
-              ...review,
-              gadget: gadget.name,
-              gadget_name: gadget.name,
-              user: review.user_name || "Unknown User",
-              date: new Date(review.created_at).toLocaleDateString(),
-              // Simulate review status system - make some reviews pending
-              status: Math.random() > 0.7 ? "Pending" : "Approved",
-            }));
-            allReviews.push(...reviewsWithGadgetName);
-          } catch (reviewError) {
-            console.warn(
-              `Failed to get reviews for gadget ${gadget.id}:`,
-              reviewError
-            );
-          }
-        }
-
-        return allReviews;
-      } catch (fallbackError) {
-        console.error("Failed to collect reviews from gadgets:", fallbackError);
-        return [];
-      }
-    }
+    return apiPageCall(`/api/admin/reviews?${adminListQuery(params)}`);
   },
 
   // Admin actions for reviews
@@ -725,6 +632,7 @@ export const authUtils = {
 const api = {
   authAPI,
   gadgetAPI,
+  homeAPI,
   reviewAPI,
   userAPI,
   adminAPI,